@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+bench_batching.py
+Count repository round trips and wall time for N concurrent find_by_id calls
+(as issued by TaskService.get_tasks and GET /api/v1/tasks?ids=...), against
+the repository directly and through BatchingTaskRepository. The in-memory
+repository is wrapped so that each call costs a simulated network latency.
+
+Usage:
+    python benchmarks/bench_batching.py [--ids 100] [--latency-ms 1.0] [--repeat 5]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.domain.entities.task import Task  # noqa: E402
+from src.domain.services.task_service import TaskService  # noqa: E402
+from src.infrastructure.repositories.batching_task_repository import BatchingTaskRepository  # noqa: E402
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository  # noqa: E402
+
+
+class RemoteTaskRepository(InMemoryTaskRepository):
+    """In-memory repository that sleeps once per read call, like a remote store."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+        self.round_trips = 0
+
+    async def find_by_id(self, id: UUID) -> Optional[Task]:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        return await super().find_by_id(id)
+
+    async def find_many_by_ids(self, ids: Sequence[UUID]) -> List[Optional[Task]]:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        return await super().find_many_by_ids(ids)
+
+
+async def measure(remote, ids, batching, repeat):
+    best = float("inf")
+    trips = 0
+    for _ in range(repeat):
+        remote.round_trips = 0
+        # One loader per request, as get_repository does.
+        repository = BatchingTaskRepository(remote) if batching else remote
+        service = TaskService(repository)
+        started = time.perf_counter()
+        tasks = await service.get_tasks(ids)
+        best = min(best, time.perf_counter() - started)
+        trips = remote.round_trips
+        assert len(tasks) == len(ids)
+    return best, trips
+
+
+async def run(args):
+    remote = RemoteTaskRepository(args.latency_ms / 1000)
+    tasks = [Task.create(f"Task {i}", "benchmark") for i in range(args.ids)]
+    await remote.save_many(tasks)
+    ids = [task.id for task in tasks]
+
+    print(f"{args.ids} concurrent find_by_id calls, {args.latency_ms} ms per round trip")
+    print(f"  {'':<10} {'round trips':>12} {'wall':>12}")
+    results = {}
+    for label, batching in (("direct", False), ("batching", True)):
+        elapsed, trips = await measure(remote, ids, batching, args.repeat)
+        results[label] = (elapsed, trips)
+        print(f"  {label:<10} {trips:>12} {elapsed * 1e3:>9.2f} ms")
+    (direct_s, direct_trips), (batched_s, batched_trips) = results["direct"], results["batching"]
+    print(f"  round trips {direct_trips / batched_trips:.0f}x fewer, wall {direct_s / batched_s:.2f}x faster")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ids", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+bench_bulk_io.py
+Import and export N tasks (default 1M) through src/tools/bulk_io.py with an
+in-memory repository, and report rows per second for each phase.
+
+Usage:
+    python benchmarks/bench_bulk_io.py [--rows 1000000] [--format jsonl|csv] [--workers N]
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.domain.services.task_service import TaskService  # noqa: E402
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository  # noqa: E402
+from src.tools.bulk_io import export_tasks, import_tasks  # noqa: E402
+
+
+def generate(path, rows, fmt):
+    users = [str(uuid4()) for _ in range(100)]
+    with open(path, "w", encoding="utf-8", newline="") as out:
+        writer = csv.writer(out) if fmt == "csv" else None
+        if writer:
+            writer.writerow(["title", "description", "assigned_to"])
+        for i in range(rows):
+            row = (f"Task {i}", f"Generated task number {i} for the bulk benchmark", users[i % 100] if i % 3 else "")
+            if writer:
+                writer.writerow(row)
+            else:
+                out.write(json.dumps({"title": row[0], "description": row[1], "assigned_to": row[2] or None}) + "\n")
+
+
+async def run(args, directory):
+    source = os.path.join(directory, f"input.{args.format}")
+    sink = os.path.join(directory, f"output.{args.format}")
+
+    started = time.perf_counter()
+    generate(source, args.rows, args.format)
+    print(f"generated {args.rows:,} rows ({os.path.getsize(source) / 2**20:.0f} MiB) in {time.perf_counter() - started:.1f}s")
+
+    repository = InMemoryTaskRepository()
+    with open(source, encoding="utf-8", newline="") as stream:
+        result = await import_tasks(TaskService(repository), stream, fmt=args.format, workers=args.workers)
+    print(f"import  {result.imported:>10,} rows {result.seconds:>7.1f}s {result.imported / result.seconds:>10,.0f} rows/s")
+
+    started = time.perf_counter()
+    with open(sink, "w", encoding="utf-8", newline="") as stream:
+        rows = await export_tasks(repository, stream, fmt=args.format)
+    elapsed = time.perf_counter() - started
+    print(f"export  {rows:>10,} rows {elapsed:>7.1f}s {rows / elapsed:>10,.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(args, directory))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+bench_msgpack.py
+Compare JSON and MessagePack task payloads: server-side encode time (what a
+route does between the domain Task and the response body), client-side decode
+time into typed values (UUIDs and datetimes), and payload size, for a single
+task and for a list of N tasks (default 10k).
+
+Requires the optional msgpack package.
+
+Usage:
+    python benchmarks/bench_msgpack.py [--tasks 10000] [--repeat 20]
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from src.domain.entities.task import Task, TaskStatus  # noqa: E402
+from src.infrastructure.api.models import TaskResponse  # noqa: E402
+from src.infrastructure.serialization import msgpack_codec  # noqa: E402
+from src.infrastructure.serialization.task_codec import micros_to_datetime  # noqa: E402
+
+
+def make_tasks(count):
+    users = [uuid4() for _ in range(50)]
+    tasks = []
+    for i in range(count):
+        task = Task.create(f"Task {i}", f"Description of generated task number {i}", users[i % 50] if i % 4 else None)
+        if i % 3 == 0:
+            task = task.update_status(TaskStatus.IN_PROGRESS)
+        tasks.append(task)
+    return tasks
+
+
+def json_encode(tasks, adapter):
+    return adapter.dump_json([TaskResponse.model_validate(task) for task in tasks])
+
+
+def msgpack_encode(tasks):
+    fields = TaskResponse.model_fields
+    return msgpack_codec.packb([{name: getattr(task, name) for name in fields} for task in tasks])
+
+
+def optional(value, convert):
+    return convert(value) if value is not None else None
+
+
+def json_decode(body):
+    return [
+        (
+            UUID(row["id"]), row["title"], row["description"], row["status"],
+            optional(row["assigned_to"], UUID),
+            datetime.fromisoformat(row["created_at"]), datetime.fromisoformat(row["updated_at"]),
+            optional(row["due_at"], datetime.fromisoformat),
+        )
+        for row in json.loads(body)
+    ]
+
+
+def msgpack_decode(body):
+    return [
+        (
+            UUID(bytes=row["id"]), row["title"], row["description"], row["status"],
+            optional(row["assigned_to"], lambda value: UUID(bytes=value)),
+            micros_to_datetime(row["created_at"]), micros_to_datetime(row["updated_at"]),
+            optional(row["due_at"], micros_to_datetime),
+        )
+        for row in msgpack_codec.unpackb(body)
+    ]
+
+
+def best(repeat, function, *args):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - started)
+    return min(times), result
+
+
+def compare(label, tasks, repeat):
+    adapter = TypeAdapter(List[TaskResponse])
+    json_encode_s, json_body = best(repeat, json_encode, tasks, adapter)
+    msgpack_encode_s, msgpack_body = best(repeat, msgpack_encode, tasks)
+    json_decode_s, json_rows = best(repeat, json_decode, json_body)
+    msgpack_decode_s, msgpack_rows = best(repeat, msgpack_decode, msgpack_body)
+    assert json_rows == msgpack_rows
+
+    unit, scale = ("µs", 1e6) if len(tasks) == 1 else ("ms", 1e3)
+    print(f"{label}")
+    print(f"  {'':<8} {'encode':>12} {'decode':>12} {'bytes':>12}")
+    for name, encode_s, decode_s, body in (
+        ("json", json_encode_s, json_decode_s, json_body),
+        ("msgpack", msgpack_encode_s, msgpack_decode_s, msgpack_body),
+    ):
+        print(f"  {name:<8} {encode_s * scale:>9.1f} {unit} {decode_s * scale:>9.1f} {unit} {len(body):>12,}")
+    print(
+        f"  msgpack/json: encode {msgpack_encode_s / json_encode_s:.2f}x, "
+        f"decode {msgpack_decode_s / json_decode_s:.2f}x, size {len(msgpack_body) / len(json_body):.2f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    if not msgpack_codec.AVAILABLE:
+        sys.exit("msgpack is not installed: pip install msgpack")
+
+    tasks = make_tasks(args.tasks)
+    compare("single task", tasks[:1], args.repeat * 50)
+    compare(f"list of {args.tasks:,} tasks", tasks, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
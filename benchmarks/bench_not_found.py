@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+bench_not_found.py
+Measure the cost of a 404 on GET /api/v1/tasks/{task_id}.
+
+"before" replays the previous miss path: TaskService raises ValueError, the
+controller logs it at error level with the traceback attached, and the route
+converts it into an HTTPException. "after" is the application as shipped.
+Log output goes to /dev/null so formatting cost is measured, not the terminal.
+
+Usage:
+    python benchmarks/bench_not_found.py [--requests 5000]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi import Depends, FastAPI, HTTPException  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.application.controllers.task_controller import TaskController  # noqa: E402
+from src.domain.services.task_service import TaskService  # noqa: E402
+from src.infrastructure.api.dependencies import get_logger, get_repository  # noqa: E402
+from src.main import app  # noqa: E402
+
+
+class LegacyTaskService(TaskService):
+    async def get_task(self, task_id: UUID):
+        task = await self.task_repository.find_by_id(task_id)
+        if not task:
+            raise ValueError("Task not found")
+        return task
+
+
+class LegacyTaskController(TaskController):
+    async def get_task(self, task_id: UUID):
+        try:
+            self.logger.info("Retrieving task", {"task_id": task_id})
+            return await self.task_service.get_task(task_id)
+        except Exception as error:
+            self.logger.error("Error retrieving task", error, {"task_id": task_id})
+            raise
+
+
+async def get_legacy_controller(repository=Depends(get_repository), logger=Depends(get_logger)):
+    yield LegacyTaskController(LegacyTaskService(repository), logger)
+
+
+legacy_app = FastAPI()
+
+
+@legacy_app.get("/api/v1/tasks/{task_id}")
+async def legacy_get_task(task_id: UUID, controller: TaskController = Depends(get_legacy_controller)):
+    try:
+        return await controller.get_task(task_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+
+def bench_http(label, target, requests):
+    ids = [uuid4() for _ in range(requests)]
+    with TestClient(target) as client:
+        for id in ids[:100]:
+            client.get(f"/api/v1/tasks/{id}")
+        start = time.perf_counter()
+        for id in ids:
+            assert client.get(f"/api/v1/tasks/{id}").status_code == 404
+        elapsed = time.perf_counter() - start
+    print(f"http       {label:<7} {elapsed / requests * 1e6:>9.1f} us/request")
+
+
+def bench_controller(label, controller, requests):
+    ids = [uuid4() for _ in range(requests)]
+
+    async def miss(id):
+        try:
+            return await controller.get_task(id)
+        except ValueError:
+            return None
+
+    async def run():
+        start = time.perf_counter()
+        for id in ids:
+            await miss(id)
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    print(f"controller {label:<7} {elapsed / requests * 1e6:>9.1f} us/miss")
+
+
+async def build_controllers():
+    repository = await get_repository().__anext__()
+    logger = await get_logger().__anext__()
+    return (
+        LegacyTaskController(LegacyTaskService(repository), logger),
+        TaskController(TaskService(repository), logger),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    legacy, current = asyncio.run(build_controllers())
+    logging.getLogger().handlers[:] = [logging.StreamHandler(open(os.devnull, "w"))]
+
+    bench_controller("before", legacy, args.requests)
+    bench_controller("after", current, args.requests)
+    bench_http("before", legacy_app, args.requests)
+    bench_http("after", app, args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py
+Measure cold-start cost in fresh interpreters: importing src.main, building
+the app with create_app(), time until /readyz reports ready, and latency of
+the first and second real request.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--no-warm-up]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def child(warm_up):
+    started = time.perf_counter()
+    import src.main
+    imported = time.perf_counter()
+
+    from src.infrastructure.config.settings import Settings
+    app = src.main.create_app(Settings(warm_up=warm_up))
+    created = time.perf_counter()
+
+    import logging
+    logging.disable(logging.CRITICAL)
+    from fastapi.testclient import TestClient
+    client_imported = time.perf_counter()
+    with TestClient(app) as client:
+        while client.get("/readyz").status_code != 200:
+            time.sleep(0.001)
+        ready = time.perf_counter()
+        client.post("/api/v1/tasks/", json={"title": "first", "description": "first request"})
+        first = time.perf_counter()
+        client.post("/api/v1/tasks/", json={"title": "second", "description": "second request"})
+        second = time.perf_counter()
+
+    print(json.dumps({
+        "import src.main": imported - started,
+        "create_app()": created - imported,
+        "startup to ready": ready - client_imported,
+        "first request": first - ready,
+        "second request": second - first,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--no-warm-up", action="store_true")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, str(ROOT))
+        child(not args.no_warm_up)
+        return
+
+    command = [sys.executable, "-W", "ignore", __file__, "--child"] + (["--no-warm-up"] if args.no_warm_up else [])
+    samples = {}
+    for _ in range(args.runs):
+        output = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True, env=dict(os.environ))
+        for name, seconds in json.loads(output.stdout.strip().splitlines()[-1]).items():
+            samples.setdefault(name, []).append(seconds)
+
+    print(f"warm-up {'off' if args.no_warm_up else 'on'}, median of {args.runs} runs")
+    for name, values in samples.items():
+        print(f"{name:<18} {statistics.median(values) * 1000:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+bench_task_ids.py
+Compare random (UUIDv4) and time-ordered (UUIDv7) task IDs as the primary key
+of a persistent SQLite table: insert throughput and resulting index size.
+
+Usage:
+    python benchmarks/bench_task_ids.py [--rows 500000] [--batch 1000]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.domain.entities.identifiers import uuid7  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE tasks (
+    id BLOB PRIMARY KEY,
+    title TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def run(label, id_factory, rows, batch, directory):
+    path = Path(directory) / f"{label}.db"
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(SCHEMA)
+    conn.commit()
+
+    start = time.perf_counter()
+    for offset in range(0, rows, batch):
+        now = time.time_ns() // 1000
+        conn.executemany(
+            "INSERT INTO tasks (id, title, status, created_at) VALUES (?, ?, ?, ?)",
+            [(id_factory().bytes, f"task {offset + i}", "PENDING", now) for i in range(min(batch, rows - offset))],
+        )
+        conn.commit()
+    elapsed = time.perf_counter() - start
+
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    pages = conn.execute("PRAGMA page_count").fetchone()[0]
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    conn.close()
+    size = os.path.getsize(path)
+    print(
+        f"{label:<8} {rows / elapsed:>12,.0f} rows/s {elapsed:>8.2f} s "
+        f"{pages:>9,} pages {pages * page_size / 2**20:>8.1f} MiB ({size / 2**20:.1f} MiB on disk)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--batch", type=int, default=1_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"Inserting {args.rows:,} rows in batches of {args.batch:,}")
+        run("uuid4", uuid4, args.rows, args.batch, directory)
+        run("uuid7", uuid7, args.rows, args.batch, directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,19 @@
 # src/application/controllers/task_controller.py
-from typing import Optional, List
+from datetime import datetime
+from typing import AsyncIterator, Optional, List
 from uuid import UUID
 from ...domain.services.task_service import TaskService
 from ...infrastructure.logging.logger import Logger
-from ..dtos.task_dto import CreateTaskDTO, UpdateTaskDTO, TaskResponseDTO
-from ...domain.entities.task import Task
+from ..dtos.task_dto import (
+    CreateTaskDTO,
+    UpdateTaskDTO,
+    TaskResponseDTO,
+    ReassignTasksDTO,
+    TransitionTasksDTO,
+    BulkUpdateResultDTO
+)
+from ...domain.entities.task import Task, TaskStatus
+from ...domain.entities.task_history import TaskChange
 
 class TaskController:
     def __init__(self, task_service: TaskService, logger: Logger):
@@ -17,16 +26,20 @@ class TaskController:
             return await self.task_service.create_task(
                 dto.title,
                 dto.description,
-                dto.assigned_to
+                dto.assigned_to,
+                dto.due_at
             )
         except Exception as error:
             self.logger.error("Error creating task", error, {"dto": dto.__dict__})
             raise
 
-    async def assign_task(self, task_id: UUID, user_id: UUID) -> Task:
+    async def assign_task(self, task_id: UUID, user_id: UUID) -> Optional[Task]:
         try:
             self.logger.info("Assigning task", {"task_id": task_id, "user_id": user_id})
-            return await self.task_service.assign_task(task_id, user_id)
+            task = await self.task_service.assign_task(task_id, user_id)
+            if task is None:
+                self.logger.debug("Task not found", {"task_id": task_id})
+            return task
         except Exception as error:
             self.logger.error(
                 "Error assigning task",
@@ -35,35 +48,130 @@ class TaskController:
             )
             raise
 
-    async def get_task(self, task_id: UUID) -> Task:
+    async def reassign_tasks(self, dto: ReassignTasksDTO) -> BulkUpdateResultDTO:
+        try:
+            self.logger.info("Reassigning tasks", {"dto": dto.__dict__})
+            tasks = await self.task_service.reassign_tasks(dto.from_user, dto.to_user, dto.statuses)
+            return BulkUpdateResultDTO(affected=len(tasks), task_ids=[task.id for task in tasks])
+        except Exception as error:
+            self.logger.error("Error reassigning tasks", error, {"dto": dto.__dict__})
+            raise
+
+    async def transition_tasks(self, dto: TransitionTasksDTO) -> BulkUpdateResultDTO:
         try:
-            self.logger.info("Retrieving task", {"task_id": task_id})
-            return await self.task_service.get_task(task_id)
+            self.logger.info("Transitioning tasks", {"dto": dto.__dict__})
+            tasks = await self.task_service.transition_tasks(dto.statuses, dto.to_status, dto.assigned_to)
+            return BulkUpdateResultDTO(affected=len(tasks), task_ids=[task.id for task in tasks])
+        except Exception as error:
+            self.logger.error("Error transitioning tasks", error, {"dto": dto.__dict__})
+            raise
+
+    async def stream_reassign_tasks(self, dto: ReassignTasksDTO) -> AsyncIterator[List[UUID]]:
+        """Yield the IDs of the reassigned tasks chunk by chunk as they are saved."""
+        try:
+            self.logger.info("Reassigning tasks", {"dto": dto.__dict__, "stream": True})
+            async for tasks in self.task_service.iter_reassign_tasks(dto.from_user, dto.to_user, dto.statuses):
+                yield [task.id for task in tasks]
+        except Exception as error:
+            self.logger.error("Error reassigning tasks", error, {"dto": dto.__dict__})
+            raise
+
+    async def stream_transition_tasks(self, dto: TransitionTasksDTO) -> AsyncIterator[List[UUID]]:
+        """Yield the IDs of the transitioned tasks chunk by chunk as they are saved."""
+        try:
+            self.logger.info("Transitioning tasks", {"dto": dto.__dict__, "stream": True})
+            async for tasks in self.task_service.iter_transition_tasks(dto.statuses, dto.to_status, dto.assigned_to):
+                yield [task.id for task in tasks]
+        except Exception as error:
+            self.logger.error("Error transitioning tasks", error, {"dto": dto.__dict__})
+            raise
+
+    async def get_task(self, task_id: UUID, as_of: Optional[datetime] = None) -> Optional[Task]:
+        try:
+            self.logger.info("Retrieving task", {"task_id": task_id, "as_of": as_of})
+            task = await self.task_service.get_task(task_id, as_of)
+            if task is None:
+                self.logger.debug("Task not found", {"task_id": task_id})
+            return task
         except Exception as error:
             self.logger.error("Error retrieving task", error, {"task_id": task_id})
             raise
 
-    async def list_tasks(self) -> List[Task]:
+    async def get_tasks(self, task_ids: List[UUID]) -> List[Task]:
+        try:
+            self.logger.info("Retrieving tasks", {"count": len(task_ids)})
+            return await self.task_service.get_tasks(task_ids)
+        except Exception as error:
+            self.logger.error("Error retrieving tasks", error, {"count": len(task_ids)})
+            raise
+
+    async def get_task_history(self, task_id: UUID) -> Optional[List[TaskChange]]:
+        try:
+            self.logger.info("Retrieving task history", {"task_id": task_id})
+            history = await self.task_service.get_task_history(task_id)
+            if history is None:
+                self.logger.debug("Task not found", {"task_id": task_id})
+            return history
+        except Exception as error:
+            self.logger.error("Error retrieving task history", error, {"task_id": task_id})
+            raise
+
+    async def list_tasks(
+        self,
+        after: Optional[UUID] = None,
+        limit: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        assigned_to: Optional[UUID] = None
+    ) -> List[Task]:
         try:
-            self.logger.info("Listing all tasks")
-            return await self.task_service.list_tasks()
+            self.logger.info("Listing all tasks", {
+                "after": after, "limit": limit, "status": status, "assigned_to": assigned_to
+            })
+            return await self.task_service.list_tasks(after, limit, status, assigned_to)
         except Exception as error:
             self.logger.error("Error listing tasks", error)
             raise
 
-    async def update_task(self, task_id: UUID, dto: UpdateTaskDTO) -> Task:
+    async def list_overdue_tasks(self) -> List[Task]:
         try:
-            self.logger.info("Updating task", {"task_id": task_id, "dto": dto.__dict__})
-            task = await self.task_service.get_task(task_id)
-            
-            if dto.status is not None:
-                task.update_status(dto.status)
-            if dto.assigned_to is not None:
-                task.assign(dto.assigned_to)
-            if dto.title is not None and dto.description is not None:
-                task.update(dto.title, dto.description)
+            self.logger.info("Listing overdue tasks")
+            return await self.task_service.list_overdue_tasks()
+        except Exception as error:
+            self.logger.error("Error listing overdue tasks", error)
+            raise
 
-            await self.task_service.task_repository.save(task)
+    async def list_tasks_created_between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        status: Optional[TaskStatus] = None,
+        assigned_to: Optional[UUID] = None,
+        after: Optional[UUID] = None,
+        limit: Optional[int] = None
+    ) -> List[Task]:
+        try:
+            self.logger.info("Listing tasks by creation time", {"start": start, "end": end})
+            return await self.task_service.list_tasks_created_between(
+                start, end, status, assigned_to, after, limit
+            )
+        except Exception as error:
+            self.logger.error("Error listing tasks by creation time", error)
+            raise
+
+    async def update_task(self, task_id: UUID, dto: UpdateTaskDTO) -> Optional[Task]:
+        try:
+            self.logger.info("Updating task", {"task_id": task_id, "dto": dto.__dict__})
+            task = await self.task_service.update_task(
+                task_id,
+                title=dto.title,
+                description=dto.description,
+                status=dto.status,
+                assigned_to=dto.assigned_to,
+                due_at=dto.due_at,
+                clear_due_at=dto.clear_due_at
+            )
+            if task is None:
+                self.logger.debug("Task not found", {"task_id": task_id})
             return task
         except Exception as error:
             self.logger.error("Error updating task", error, {
@@ -1,7 +1,7 @@
 # src/application/dtos/task_dto.py
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from ...domain.entities.task import TaskStatus
 
@@ -10,6 +10,7 @@ class CreateTaskDTO:
     title: str
     description: str
     assigned_to: Optional[UUID] = None
+    due_at: Optional[datetime] = None
 
 @dataclass
 class UpdateTaskDTO:
@@ -17,6 +18,26 @@ class UpdateTaskDTO:
     description: Optional[str] = None
     status: Optional[TaskStatus] = None
     assigned_to: Optional[UUID] = None
+    due_at: Optional[datetime] = None
+    # None in due_at means "unchanged"; set this to remove the due date.
+    clear_due_at: bool = False
+
+@dataclass
+class ReassignTasksDTO:
+    from_user: UUID
+    to_user: UUID
+    statuses: Optional[List[TaskStatus]] = None
+
+@dataclass
+class TransitionTasksDTO:
+    statuses: List[TaskStatus]
+    to_status: TaskStatus
+    assigned_to: Optional[UUID] = None
+
+@dataclass
+class BulkUpdateResultDTO:
+    affected: int
+    task_ids: List[UUID]
 
 @dataclass
 class TaskResponseDTO:
@@ -27,3 +48,4 @@ class TaskResponseDTO:
     assigned_to: Optional[UUID]
     created_at: datetime
     updated_at: datetime
+    due_at: Optional[datetime] = None
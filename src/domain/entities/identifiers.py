@@ -0,0 +1,62 @@
+# src/domain/entities/identifiers.py
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+_VERSION_AND_VARIANT = (0x7 << 76) | (0b10 << 62)
+_COUNTER_MAX = 0xFFF
+_RAND_B_MASK = (1 << 62) - 1
+
+
+class UUID7Generator:
+    """
+    Monotonic UUIDv7 generator (RFC 9562, method 1).
+
+    The 48-bit unix millisecond timestamp leads the ID, followed by a 12-bit
+    counter that is re-seeded every millisecond. IDs produced by one generator
+    are strictly increasing even when the clock stalls or steps backwards.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def __call__(self) -> UUID:
+        rand = int.from_bytes(os.urandom(10), "big")
+        now_ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                # Leave the top counter bit clear so a burst within one
+                # millisecond has at least 2048 increments of headroom.
+                self._counter = (rand >> 64) & 0x7FF
+            else:
+                self._counter += 1
+                if self._counter > _COUNTER_MAX:
+                    self._last_ms += 1
+                    self._counter = 0
+            ms, counter = self._last_ms, self._counter
+        return UUID(int=(ms << 80) | _VERSION_AND_VARIANT | (counter << 64) | (rand & _RAND_B_MASK))
+
+
+uuid7 = UUID7Generator()
+
+
+def _to_unix_ms(moment: datetime) -> int:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return (moment - _UNIX_EPOCH) // timedelta(milliseconds=1)
+
+
+def uuid7_min(moment: datetime) -> UUID:
+    """Smallest UUIDv7 that can be generated at ``moment`` (naive times are UTC)."""
+    return UUID(int=(_to_unix_ms(moment) << 80) | _VERSION_AND_VARIANT)
+
+
+def uuid7_timestamp(id: UUID) -> datetime:
+    """Creation time (naive UTC, millisecond precision) encoded in a UUIDv7."""
+    return _UNIX_EPOCH + timedelta(milliseconds=id.int >> 80)
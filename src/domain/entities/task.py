@@ -1,9 +1,10 @@
 # src/domain/entities/task.py
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID
 from typing import Optional
+from .identifiers import uuid7
 
 class TaskStatus(str, Enum):
     PENDING = "PENDING"
@@ -11,8 +12,16 @@ class TaskStatus(str, Enum):
     COMPLETED = "COMPLETED"
     CANCELLED = "CANCELLED"
 
-@dataclass
+    @property
+    def is_terminal(self) -> bool:
+        return self in (TaskStatus.COMPLETED, TaskStatus.CANCELLED)
+
+@dataclass(frozen=True)
 class Task:
+    """
+    An immutable task version. Mutators return a new version and leave the
+    receiver untouched, so versions held by readers never change under them.
+    """
     id: UUID
     title: str
     description: str
@@ -20,29 +29,40 @@ class Task:
     assigned_to: Optional[UUID]
     created_at: datetime
     updated_at: datetime
+    # Naive UTC, like the other timestamps; None means no deadline.
+    due_at: Optional[datetime] = None
 
     @classmethod
-    def create(cls, title: str, description: str, assigned_to: Optional[UUID] = None) -> "Task":
+    def create(
+        cls,
+        title: str,
+        description: str,
+        assigned_to: Optional[UUID] = None,
+        due_at: Optional[datetime] = None
+    ) -> "Task":
         now = datetime.utcnow()
         return cls(
-            id=uuid4(),
+            id=uuid7(),
             title=title,
             description=description,
             status=TaskStatus.PENDING,
             assigned_to=assigned_to,
             created_at=now,
-            updated_at=now
+            updated_at=now,
+            due_at=due_at
         )
 
-    def assign(self, user_id: UUID) -> None:
-        self.assigned_to = user_id
-        self.updated_at = datetime.utcnow()
+    def is_overdue(self, now: datetime) -> bool:
+        return self.due_at is not None and self.due_at <= now and not self.status.is_terminal
+
+    def assign(self, user_id: UUID) -> "Task":
+        return replace(self, assigned_to=user_id, updated_at=datetime.utcnow())
+
+    def update_status(self, status: TaskStatus) -> "Task":
+        return replace(self, status=status, updated_at=datetime.utcnow())
 
-    def update_status(self, status: TaskStatus) -> None:
-        self.status = status
-        self.updated_at = datetime.utcnow()
+    def update(self, title: str, description: str) -> "Task":
+        return replace(self, title=title, description=description, updated_at=datetime.utcnow())
 
-    def update(self, title: str, description: str) -> None:
-        self.title = title
-        self.description = description
-        self.updated_at = datetime.utcnow()
\ No newline at end of file
+    def reschedule(self, due_at: Optional[datetime]) -> "Task":
+        return replace(self, due_at=due_at, updated_at=datetime.utcnow())
@@ -0,0 +1,13 @@
+# src/domain/entities/task_events.py
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+@dataclass(frozen=True)
+class TaskOverdue:
+    """
+    Published once when an open task passes its due date.
+    """
+    task_id: UUID
+    due_at: datetime
+    detected_at: datetime
@@ -0,0 +1,16 @@
+# src/domain/entities/task_history.py
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+
+@dataclass(frozen=True)
+class TaskChange:
+    """
+    One recorded mutation of a task: the fields it set and their new values.
+    Version 0 is the creation of the task and lists every field.
+    """
+    task_id: UUID
+    version: int
+    changed_at: datetime
+    changes: Dict[str, Any]
@@ -0,0 +1,10 @@
+# src/domain/events/event_publisher.py
+from abc import ABC, abstractmethod
+
+class EventPublisher(ABC):
+    @abstractmethod
+    async def publish(self, event: object) -> None:
+        """
+        Deliver a domain event, such as TaskOverdue, to its subscribers.
+        """
+        pass
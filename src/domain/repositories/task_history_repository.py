@@ -0,0 +1,27 @@
+# src/domain/repositories/task_history_repository.py
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from ..entities.task import Task
+from ..entities.task_history import TaskChange
+
+class TaskHistoryRepository(ABC):
+    @abstractmethod
+    async def record(self, previous: Optional[Task], current: Task) -> None:
+        """
+        Append the change from ``previous`` to ``current``. ``previous`` is
+        None when the task was just created.
+        """
+        pass
+
+    @abstractmethod
+    async def find_history(self, task_id: UUID) -> List[TaskChange]:
+        pass
+
+    @abstractmethod
+    async def find_as_of(self, task_id: UUID, as_of: datetime) -> Optional[Task]:
+        """
+        Return the task as it was at ``as_of``, or None if it did not exist yet.
+        """
+        pass
@@ -1,27 +1,121 @@
 # src/domain/repositories/task_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import ContextManager, Iterable, List, Optional, Sequence
 from uuid import UUID
-from ..entities.task import Task
+from ..entities.task import Task, TaskStatus
+
+class TaskSnapshot(ABC):
+    """
+    A point-in-time, read-only view of a TaskRepository. Writes made after
+    the snapshot was taken are not visible through it.
+    """
+    @abstractmethod
+    async def find_by_id(self, id: UUID) -> Optional[Task]:
+        pass
+
+    @abstractmethod
+    async def find_all(self) -> List[Task]:
+        pass
+
+    @abstractmethod
+    async def find_by_assignee(self, user_id: UUID) -> List[Task]:
+        pass
 
 class TaskRepository(ABC):
     @abstractmethod
     async def save(self, task: Task) -> None:
         pass
 
+    async def save_many(self, tasks: Iterable[Task]) -> None:
+        """
+        Save several tasks in one call. Backends with a batch write path
+        should override this; the default saves one task at a time.
+        """
+        for task in tasks:
+            await self.save(task)
+
+    async def delete_many(self, ids: Iterable[UUID]) -> None:
+        for id in ids:
+            await self.delete(id)
+
     @abstractmethod
     async def find_by_id(self, id: UUID) -> Optional[Task]:
         pass
 
+    async def find_many_by_ids(self, ids: Sequence[UUID]) -> List[Optional[Task]]:
+        """
+        Look up several tasks in one call. The result is aligned with ``ids``,
+        with None for missing tasks. Backends where a lookup is a round trip
+        should override this; the default calls ``find_by_id`` per ID.
+        """
+        return [await self.find_by_id(id) for id in ids]
+
     @abstractmethod
     async def find_all(self) -> List[Task]:
         pass
 
     @abstractmethod
-    async def find_by_assignee(self, user_id: UUID) -> List[Task]:
+    async def find_by_assignee(
+        self, user_id: UUID, statuses: Optional[Iterable[TaskStatus]] = None
+    ) -> List[Task]:
+        """
+        Return tasks assigned to ``user_id`` ordered by ID, optionally only
+        those in ``statuses``. Backends that partition by status can use the
+        filter to skip partitions.
+        """
+        pass
+
+    async def find_by_status(self, status: TaskStatus) -> List[Task]:
+        """
+        Return tasks with ``status`` ordered by ID. The default filters
+        ``find_all``; backends that can skip whole partitions should override it.
+        """
+        return [task for task in await self.find_all() if task.status == status]
+
+    @abstractmethod
+    async def find_page(self, after: Optional[UUID] = None, limit: int = 100) -> List[Task]:
+        """
+        Return up to ``limit`` tasks ordered by ID, starting after ``after``.
+        Task IDs are time-ordered, so this is also creation order.
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_id_range(self, start: UUID, end: UUID) -> List[Task]:
+        """
+        Return tasks with ``start <= id < end`` ordered by ID.
+        """
         pass
 
     @abstractmethod
     async def delete(self, id: UUID) -> None:
         pass
 
+    def start(self) -> None:
+        """
+        Start background work owned by the repository. Called from a running
+        event loop; the default does nothing.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Stop background work and release resources. The default does nothing.
+        """
+        pass
+
+    async def warm_up(self) -> None:
+        """
+        Build indexes and caches ahead of the first request. The default
+        does nothing.
+        """
+        pass
+
+    @abstractmethod
+    def snapshot(self) -> ContextManager[TaskSnapshot]:
+        """
+        Open a consistent read view; use as ``with repository.snapshot() as s:``.
+        Opening a snapshot must not block writers.
+        """
+        pass
+
@@ -0,0 +1,132 @@
+# src/domain/services/overdue_scheduler.py
+import asyncio
+import heapq
+import itertools
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+from ..entities.task import Task
+from ..entities.task_events import TaskOverdue
+from ..events.event_publisher import EventPublisher
+
+class OverdueScheduler:
+    """
+    Tracks the due dates of open tasks and reports each task once when it
+    becomes overdue.
+
+    Pending deadlines live in a min-heap. Cancelling a deadline only marks its
+    heap entry dead (O(1)); rescheduling pushes a new entry (O(log N)). Dead
+    entries are dropped when they reach the top, and the heap is rebuilt once
+    they make up more than half of it. Tasks whose deadline has passed move to
+    the overdue index, which answers "what is overdue" without a scan.
+
+    ``track`` must see every write of a task; TaskService calls it on save.
+    ``start()`` runs a timer that fires deadlines as they pass and publishes
+    a TaskOverdue event for each.
+    """
+    def __init__(
+        self,
+        publisher: Optional[EventPublisher] = None,
+        clock: Callable[[], datetime] = datetime.utcnow
+    ):
+        self.publisher = publisher
+        self.clock = clock
+        # Entries are [due_at, sequence, task_id, live].
+        self._heap: List[list] = []
+        self._entries: Dict[UUID, list] = {}
+        self._dead = 0
+        self._sequence = itertools.count()
+        # Overdue task ID -> the deadline it missed.
+        self._overdue: Dict[UUID, datetime] = {}
+        self._wakeup = asyncio.Event()
+        self._timer: Optional[asyncio.Task] = None
+
+    def track(self, task: Task) -> None:
+        """Schedule, reschedule or cancel the deadline of ``task``."""
+        due_at = None if task.status.is_terminal else task.due_at
+        if due_at is None:
+            self.cancel(task.id)
+            return
+        entry = self._entries.get(task.id)
+        if (entry is not None and entry[0] == due_at) or self._overdue.get(task.id) == due_at:
+            return
+
+        self.cancel(task.id)
+        entry = [due_at, next(self._sequence), task.id, True]
+        self._entries[task.id] = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            # The timer is sleeping until a later deadline.
+            self._wakeup.set()
+
+    def track_all(self, tasks: Iterable[Task]) -> None:
+        for task in tasks:
+            self.track(task)
+
+    def cancel(self, task_id: UUID) -> None:
+        self._overdue.pop(task_id, None)
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return
+        entry[3] = False
+        self._dead += 1
+        if self._dead > 64 and self._dead * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if entry[3]]
+            heapq.heapify(self._heap)
+            self._dead = 0
+
+    def next_due(self) -> Optional[datetime]:
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+            self._dead -= 1
+        return self._heap[0][0] if self._heap else None
+
+    async def advance(self, now: Optional[datetime] = None) -> List[TaskOverdue]:
+        """
+        Move every task whose deadline is at or before ``now`` to the overdue
+        index and publish its TaskOverdue event.
+        """
+        now = now or self.clock()
+        events = []
+        while (due_at := self.next_due()) is not None and due_at <= now:
+            _, _, task_id, _ = heapq.heappop(self._heap)
+            del self._entries[task_id]
+            self._overdue[task_id] = due_at
+            events.append(TaskOverdue(task_id=task_id, due_at=due_at, detected_at=now))
+        if self.publisher is not None:
+            for event in events:
+                await self.publisher.publish(event)
+        return events
+
+    def overdue(self) -> List[UUID]:
+        """IDs of overdue tasks, most overdue first, as of the last ``advance``."""
+        return [task_id for task_id, _ in sorted(self._overdue.items(), key=lambda item: item[1])]
+
+    def start(self) -> None:
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._run_timer())
+
+    async def close(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            try:
+                await self._timer
+            except asyncio.CancelledError:
+                pass
+            self._timer = None
+
+    async def _run_timer(self) -> None:
+        while True:
+            due_at = self.next_due()
+            timeout = None if due_at is None else max((due_at - self.clock()).total_seconds(), 0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.advance()
+            except Exception:
+                # A failing subscriber must not stop the timer; the overdue
+                # index was already updated.
+                pass
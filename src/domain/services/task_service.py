@@ -1,43 +1,290 @@
 # src/domain/services/task_service.py
-from typing import Optional, List
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID
+from ..entities.identifiers import uuid7_min
 from ..entities.task import Task, TaskStatus
+from ..entities.task_history import TaskChange
 from ..repositories.task_repository import TaskRepository
+from ..repositories.task_history_repository import TaskHistoryRepository
+from .overdue_scheduler import OverdueScheduler
+
+# Bulk updates are saved, recorded and streamed this many tasks at a time.
+BULK_CHUNK_SIZE = 500
 
 class TaskService:
-    def __init__(self, task_repository: TaskRepository):
+    def __init__(
+        self,
+        task_repository: TaskRepository,
+        history_repository: Optional[TaskHistoryRepository] = None,
+        scheduler: Optional[OverdueScheduler] = None
+    ):
         self.task_repository = task_repository
+        self.history_repository = history_repository
+        self.scheduler = scheduler
+
+    async def _save(self, previous: Optional[Task], task: Task) -> None:
+        await self.task_repository.save(task)
+        if self.history_repository is not None:
+            await self.history_repository.record(previous, task)
+        if self.scheduler is not None:
+            self.scheduler.track(task)
+
+    async def _save_many(self, changes: List[Tuple[Optional[Task], Task]]) -> None:
+        await self.task_repository.save_many(task for _, task in changes)
+        for previous, task in changes:
+            if self.history_repository is not None:
+                await self.history_repository.record(previous, task)
+            if self.scheduler is not None:
+                self.scheduler.track(task)
 
     async def create_task(
-        self, title: str, description: str, assigned_to: Optional[UUID] = None
+        self,
+        title: str,
+        description: str,
+        assigned_to: Optional[UUID] = None,
+        due_at: Optional[datetime] = None
     ) -> Task:
-        task = Task.create(title, description, assigned_to)
-        await self.task_repository.save(task)
+        task = Task.create(title, description, assigned_to, due_at)
+        await self._save(None, task)
         return task
 
-    async def assign_task(self, task_id: UUID, user_id: UUID) -> Task:
+    async def create_tasks(
+        self, rows: Iterable[Tuple[str, str, Optional[UUID], Optional[datetime]]]
+    ) -> List[Task]:
+        """
+        Create one task per ``(title, description, assigned_to, due_at)`` row
+        with a single ``save_many``. Returns the new tasks in row order.
+        """
+        tasks = [
+            Task.create(title, description, assigned_to, due_at)
+            for title, description, assigned_to, due_at in rows
+        ]
+        await self._save_many([(None, task) for task in tasks])
+        return tasks
+
+    async def assign_task(self, task_id: UUID, user_id: UUID) -> Optional[Task]:
         task = await self.task_repository.find_by_id(task_id)
         if not task:
-            raise ValueError("Task not found")
+            return None
 
-        task.assign(user_id)
-        await self.task_repository.save(task)
-        return task
+        updated = task.assign(user_id)
+        await self._save(task, updated)
+        return updated
 
-    async def update_task_status(self, task_id: UUID, status: TaskStatus) -> Task:
+    async def update_task_status(self, task_id: UUID, status: TaskStatus) -> Optional[Task]:
         task = await self.task_repository.find_by_id(task_id)
         if not task:
-            raise ValueError("Task not found")
+            return None
 
-        task.update_status(status)
-        await self.task_repository.save(task)
-        return task
+        updated = task.update_status(status)
+        await self._save(task, updated)
+        return updated
 
-    async def get_task(self, task_id: UUID) -> Task:
+    async def update_task(
+        self,
+        task_id: UUID,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        assigned_to: Optional[UUID] = None,
+        due_at: Optional[datetime] = None,
+        clear_due_at: bool = False
+    ) -> Optional[Task]:
         task = await self.task_repository.find_by_id(task_id)
         if not task:
-            raise ValueError("Task not found")
-        return task
+            return None
+
+        updated = task
+        if status is not None:
+            updated = updated.update_status(status)
+        if assigned_to is not None:
+            updated = updated.assign(assigned_to)
+        if title is not None or description is not None:
+            updated = updated.update(
+                title if title is not None else updated.title,
+                description if description is not None else updated.description
+            )
+        if due_at is not None or clear_due_at:
+            updated = updated.reschedule(due_at)
+        await self._save(task, updated)
+        return updated
+
+    async def reassign_tasks(
+        self,
+        from_user: UUID,
+        to_user: UUID,
+        statuses: Optional[Iterable[TaskStatus]] = None
+    ) -> List[Task]:
+        """
+        Assign every task of ``from_user``, optionally only those in
+        ``statuses``, to ``to_user``. Returns the changed tasks.
+        """
+        return [task async for chunk in self.iter_reassign_tasks(from_user, to_user, statuses) for task in chunk]
+
+    async def iter_reassign_tasks(
+        self,
+        from_user: UUID,
+        to_user: UUID,
+        statuses: Optional[Iterable[TaskStatus]] = None
+    ) -> AsyncIterator[List[Task]]:
+        """
+        Like ``reassign_tasks``, but saves the changes ``BULK_CHUNK_SIZE`` at
+        a time and yields each saved chunk.
+        """
+        if from_user == to_user:
+            return
+        wanted = set(statuses) if statuses is not None else None
+        candidates = await self.task_repository.find_by_assignee(from_user, wanted)
+
+        def change(task: Task) -> Optional[Task]:
+            if task.assigned_to != from_user or (wanted is not None and task.status not in wanted):
+                return None
+            return task.assign(to_user)
+
+        async for chunk in self._apply_in_chunks([task.id for task in candidates], change):
+            yield chunk
+
+    async def transition_tasks(
+        self,
+        statuses: Iterable[TaskStatus],
+        to_status: TaskStatus,
+        assigned_to: Optional[UUID] = None
+    ) -> List[Task]:
+        """
+        Move every task in ``statuses``, optionally only those assigned to
+        ``assigned_to``, to ``to_status``. Returns the changed tasks ordered
+        by ID.
+        """
+        return [task async for chunk in self.iter_transition_tasks(statuses, to_status, assigned_to) for task in chunk]
+
+    async def iter_transition_tasks(
+        self,
+        statuses: Iterable[TaskStatus],
+        to_status: TaskStatus,
+        assigned_to: Optional[UUID] = None
+    ) -> AsyncIterator[List[Task]]:
+        """
+        Like ``transition_tasks``, but saves the changes ``BULK_CHUNK_SIZE``
+        at a time and yields each saved chunk.
+        """
+        wanted = set(statuses) - {to_status}
+        if assigned_to is not None:
+            candidates = await self.task_repository.find_by_assignee(assigned_to, wanted)
+        else:
+            candidates = []
+            for status in wanted:
+                candidates.extend(await self.task_repository.find_by_status(status))
+            candidates.sort(key=lambda task: task.id)
+
+        def change(task: Task) -> Optional[Task]:
+            if task.status not in wanted or (assigned_to is not None and task.assigned_to != assigned_to):
+                return None
+            return task.update_status(to_status)
+
+        async for chunk in self._apply_in_chunks([task.id for task in candidates], change):
+            yield chunk
+
+    async def _apply_in_chunks(
+        self, ids: List[UUID], change: Callable[[Task], Optional[Task]]
+    ) -> AsyncIterator[List[Task]]:
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            # Other requests may have changed or deleted these tasks since
+            # they were selected, so each chunk is re-read and re-checked.
+            changes: List[Tuple[Optional[Task], Task]] = []
+            for task in await self.task_repository.find_many_by_ids(ids[start:start + BULK_CHUNK_SIZE]):
+                updated = change(task) if task is not None else None
+                if updated is not None:
+                    changes.append((task, updated))
+            if changes:
+                await self._save_many(changes)
+                yield [task for _, task in changes]
+
+    async def get_task(self, task_id: UUID, as_of: Optional[datetime] = None) -> Optional[Task]:
+        # A miss is an expected outcome (stale links, pollers of deleted
+        # tasks), so it is reported as None rather than raised.
+        if as_of is not None:
+            return await self._history().find_as_of(task_id, as_of)
+        return await self.task_repository.find_by_id(task_id)
+
+    async def get_tasks(self, task_ids: Sequence[UUID]) -> List[Task]:
+        """
+        Return the tasks that exist among ``task_ids``, in request order.
+        The lookups run concurrently, so a batching repository answers them
+        with a single round trip.
+        """
+        unique = list(dict.fromkeys(task_ids))
+        tasks = await asyncio.gather(*(self.task_repository.find_by_id(task_id) for task_id in unique))
+        return [task for task in tasks if task is not None]
+
+    async def get_task_history(self, task_id: UUID) -> Optional[List[TaskChange]]:
+        history = await self._history().find_history(task_id)
+        return history or None
+
+    def _history(self) -> TaskHistoryRepository:
+        if self.history_repository is None:
+            raise ValueError("Task history is not enabled")
+        return self.history_repository
+
+    async def list_overdue_tasks(self) -> List[Task]:
+        scheduler = self._scheduler()
+        await scheduler.advance()
+        tasks = await self.task_repository.find_many_by_ids(scheduler.overdue())
+        return [task for task in tasks if task is not None]
+
+    def _scheduler(self) -> OverdueScheduler:
+        if self.scheduler is None:
+            raise ValueError("Overdue tracking is not enabled")
+        return self.scheduler
+
+    async def list_tasks(
+        self,
+        after: Optional[UUID] = None,
+        limit: Optional[int] = None,
+        status: Optional[TaskStatus] = None,
+        assigned_to: Optional[UUID] = None
+    ) -> List[Task]:
+        """
+        Return tasks ordered by ID, optionally only those with ``status`` and
+        ``assigned_to``. Filters are applied before the ``after``/``limit``
+        page is cut, so a short page means there are no more matches.
+        """
+        if assigned_to is not None:
+            tasks = await self.task_repository.find_by_assignee(
+                assigned_to, [status] if status is not None else None
+            )
+        elif status is not None:
+            tasks = await self.task_repository.find_by_status(status)
+        elif after is None and limit is None:
+            return await self.task_repository.find_all()
+        else:
+            return await self.task_repository.find_page(after, limit or 100)
+        if after is None and limit is None:
+            return tasks
+        if after is not None:
+            tasks = [task for task in tasks if task.id > after]
+        return tasks[:limit or 100]
 
-    async def list_tasks(self) -> List[Task]:
-        return await self.task_repository.find_all()
+    async def list_tasks_created_between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        status: Optional[TaskStatus] = None,
+        assigned_to: Optional[UUID] = None,
+        after: Optional[UUID] = None,
+        limit: Optional[int] = None
+    ) -> List[Task]:
+        # Task IDs are UUIDv7, so a creation window maps onto an ID range.
+        lower = uuid7_min(start) if start is not None else UUID(int=0)
+        upper = uuid7_min(end) if end is not None else UUID(int=(1 << 128) - 1)
+        if after is not None and after >= lower:
+            # Keyset continuation: start the scan just past ``after``.
+            lower = UUID(int=after.int + 1)
+        tasks = await self.task_repository.find_by_id_range(lower, upper)
+        tasks = [
+            task for task in tasks
+            if (status is None or task.status == status)
+            and (assigned_to is None or task.assigned_to == assigned_to)
+        ]
+        return tasks[:limit] if limit is not None else tasks
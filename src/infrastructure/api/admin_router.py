@@ -0,0 +1,76 @@
+# src/infrastructure/api/admin_router.py
+import hmac
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request
+from fastapi.responses import PlainTextResponse
+from typing import List, Optional
+from uuid import UUID
+from ..profiling.profiler import RequestProfiler, format_collapsed
+from .dependencies import settings
+from .models import ProfileResponse
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Allow the request only if it carries the configured admin token.
+    """
+    expected = settings().admin_token
+    if not expected or not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+def get_profiler(request: Request) -> RequestProfiler:
+    return request.app.state.profiler
+
+router = APIRouter(
+    prefix="/api/v1/admin/profiles",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+    responses={403: {"description": "Missing or invalid X-Admin-Token"}}
+)
+
+@router.get(
+    "/hot-stacks",
+    response_class=PlainTextResponse,
+    summary="Dump aggregated hot stacks",
+    response_description="Collapsed stacks, one 'frame;frame;frame count' line per stack"
+)
+async def hot_stacks(
+    limit: Optional[int] = Query(None, ge=1, description="Only the N most frequent stacks"),
+    reset: bool = Query(False, description="Clear the aggregate after dumping it"),
+    profiler: RequestProfiler = Depends(get_profiler)
+) -> PlainTextResponse:
+    """
+    Stacks sampled from sampled and on-demand profiled requests, in the
+    collapsed format read by flamegraph.pl and speedscope.
+    """
+    content = format_collapsed(profiler.sampler.hot_stacks, limit)
+    if reset:
+        profiler.sampler.reset()
+    return PlainTextResponse(content)
+
+@router.get(
+    "",
+    response_model=List[ProfileResponse],
+    summary="List stored request profiles"
+)
+async def list_profiles(profiler: RequestProfiler = Depends(get_profiler)) -> List[ProfileResponse]:
+    """
+    The most recent on-demand profiles, newest first.
+    """
+    return [ProfileResponse.from_orm(profile) for profile in profiler.list()]
+
+@router.get(
+    "/{profile_id}",
+    response_class=PlainTextResponse,
+    summary="Get a stored request profile",
+    response_description="Collapsed stacks: sample counts (sample mode) or microseconds (cprofile mode)"
+)
+async def get_profile(
+    profile_id: UUID = Path(..., description="The ID from the X-Profile-Id response header"),
+    profiler: RequestProfiler = Depends(get_profiler)
+) -> PlainTextResponse:
+    """
+    Return one stored profile.
+    """
+    profile = profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(profile.content)
@@ -1,19 +1,149 @@
 # src/infrastructure/api/dependencies.py
 from fastapi import Depends
-from typing import AsyncGenerator
+from datetime import timedelta
+from typing import AsyncGenerator, Optional
 from ...domain.repositories.task_repository import TaskRepository
+from ...domain.repositories.task_history_repository import TaskHistoryRepository
+from ...domain.entities.task import TaskStatus
+from ...domain.services.overdue_scheduler import OverdueScheduler
 from ...domain.services.task_service import TaskService
 from ...infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from ...infrastructure.repositories.write_behind_task_repository import WriteBehindTaskRepository
+from ...infrastructure.repositories.tiered_task_repository import TieredTaskRepository
+from ...infrastructure.repositories.batching_task_repository import BatchingTaskRepository
+from ...infrastructure.repositories.in_memory_task_history_repository import InMemoryTaskHistoryRepository
+from ...infrastructure.events.in_memory_event_publisher import InMemoryEventPublisher
 from ...infrastructure.logging.logger import Logger, ConsoleLogger
+from ...infrastructure.config.settings import Settings
+from ...infrastructure.jobs.job_manager import JobManager
+from ...infrastructure.jobs.builtin_jobs import register_builtin_jobs
 from ...application.controllers.task_controller import TaskController
 
+_settings: Optional[Settings] = None
+# Shared across requests so that every request, and every background job,
+# sees the same tasks. Built on first use from the configured settings.
+_repository: Optional[TaskRepository] = None
+_history_repository: Optional[TaskHistoryRepository] = None
+_job_manager: Optional[JobManager] = None
+_event_publisher: Optional[InMemoryEventPublisher] = None
+_scheduler: Optional[OverdueScheduler] = None
+
+def configure(settings: Settings) -> None:
+    """
+    Use ``settings`` for the shared objects. Objects built under previous
+    settings are dropped, so call this before the application starts.
+    """
+    global _settings, _repository, _history_repository, _job_manager, _event_publisher, _scheduler
+    _settings = settings
+    _repository = None
+    _history_repository = None
+    _job_manager = None
+    _event_publisher = None
+    _scheduler = None
+
+def settings() -> Settings:
+    """
+    Return the configured settings, reading them from the environment if
+    ``configure`` has not been called.
+    """
+    global _settings
+    if _settings is None:
+        _settings = Settings.from_env()
+    return _settings
+
+def build_repository(config: Optional[Settings] = None) -> TaskRepository:
+    """
+    Build a repository. ``tiering_enabled`` moves old terminal tasks to a
+    cold tier, and a positive ``write_behind_ms`` durability window puts a
+    write-behind buffer in front of it.
+    """
+    config = config or settings()
+    repository: TaskRepository = InMemoryTaskRepository()
+    if config.tiering_enabled:
+        repository = TieredTaskRepository(
+            repository,
+            directory=config.cold_dir,
+            cold_after=timedelta(seconds=config.cold_after_seconds),
+            interval=config.tiering_interval_seconds
+        )
+    if config.write_behind_ms > 0:
+        repository = WriteBehindTaskRepository(
+            repository,
+            flush_interval=config.write_behind_ms / 1000,
+            max_pending=config.write_behind_max_pending
+        )
+    return repository
+
+def repository() -> TaskRepository:
+    """
+    Return the process-wide TaskRepository, creating it on first use.
+    """
+    global _repository
+    if _repository is None:
+        _repository = build_repository()
+    return _repository
+
+def history_repository() -> TaskHistoryRepository:
+    """
+    Return the process-wide TaskHistoryRepository, creating it on first use.
+    """
+    global _history_repository
+    if _history_repository is None:
+        _history_repository = InMemoryTaskHistoryRepository()
+    return _history_repository
+
+def event_publisher() -> InMemoryEventPublisher:
+    """
+    Return the process-wide EventPublisher, creating it on first use.
+    """
+    global _event_publisher
+    if _event_publisher is None:
+        _event_publisher = InMemoryEventPublisher()
+    return _event_publisher
+
+def overdue_scheduler() -> OverdueScheduler:
+    """
+    Return the process-wide OverdueScheduler, creating it on first use.
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = OverdueScheduler(event_publisher())
+    return _scheduler
+
+async def start_scheduler() -> None:
+    """
+    Load the deadlines of open tasks and start firing overdue events.
+    """
+    scheduler = overdue_scheduler()
+    for status in (TaskStatus.PENDING, TaskStatus.IN_PROGRESS):
+        scheduler.track_all(await repository().find_by_status(status))
+    scheduler.start()
+
+async def shutdown_scheduler() -> None:
+    if _scheduler is not None:
+        await _scheduler.close()
+
 async def get_repository() -> AsyncGenerator[TaskRepository, None]:
     """
     Dependency provider for TaskRepository.
-    Currently using InMemoryTaskRepository, but can be easily switched to another implementation.
+    Wraps the shared repository in a per-request BatchingTaskRepository, so
+    concurrent lookups within a request share round trips and a memo.
     """
-    repository = InMemoryTaskRepository()
-    yield repository
+    yield BatchingTaskRepository(repository())
+
+async def start_repository() -> None:
+    """
+    Start background work owned by the repository, such as write-behind
+    flushing and tiering.
+    """
+    repository().start()
+
+async def shutdown_repository() -> None:
+    """
+    Flush buffered writes and release storage before the process exits.
+    """
+    if _repository is not None:
+        await _repository.close()
 
 async def get_logger() -> AsyncGenerator[Logger, None]:
     """
@@ -22,13 +152,20 @@ async def get_logger() -> AsyncGenerator[Logger, None]:
     logger = ConsoleLogger()
     yield logger
 
+async def get_history_repository() -> AsyncGenerator[TaskHistoryRepository, None]:
+    """
+    Dependency provider for TaskHistoryRepository.
+    """
+    yield history_repository()
+
 async def get_service(
-    repository: TaskRepository = Depends(get_repository)
+    repository: TaskRepository = Depends(get_repository),
+    history_repository: TaskHistoryRepository = Depends(get_history_repository)
 ) -> AsyncGenerator[TaskService, None]:
     """
     Dependency provider for TaskService.
     """
-    service = TaskService(repository)
+    service = TaskService(repository, history_repository, overdue_scheduler())
     yield service
 
 async def get_controller(
@@ -39,4 +176,37 @@ async def get_controller(
     Dependency provider for TaskController.
     """
     controller = TaskController(service, logger)
-    yield controller
\ No newline at end of file
+    yield controller
+
+def job_manager() -> JobManager:
+    """
+    Return the process-wide JobManager, creating it on first use.
+    """
+    global _job_manager
+    if _job_manager is None:
+        current = settings()
+        _job_manager = JobManager(
+            repository(),
+            max_workers=current.job_workers,
+            max_concurrent_jobs=current.max_concurrent_jobs,
+            max_queued=current.max_queued_jobs,
+            chunk_size=current.job_chunk_size,
+            export_dir=current.export_dir
+        )
+        register_builtin_jobs(_job_manager)
+    return _job_manager
+
+async def shutdown_job_manager() -> None:
+    """
+    Cancel running jobs and stop the worker pools.
+    """
+    global _job_manager
+    if _job_manager is not None:
+        await _job_manager.shutdown()
+        _job_manager = None
+
+async def get_job_manager() -> AsyncGenerator[JobManager, None]:
+    """
+    Dependency provider for JobManager.
+    """
+    yield job_manager()
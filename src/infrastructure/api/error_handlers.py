@@ -1,11 +1,23 @@
 # src/infrastructure/api/error_handlers.py
-from fastapi import Request, status
+from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from typing import Dict, Any
+from uuid import UUID
+from ..jobs.job_manager import JobQueueFullError
 
 class TaskNotFoundError(Exception):
     """Raised when a task cannot be found."""
-    pass
+
+    def __init__(self, task_id: UUID):
+        super().__init__(f"Task {task_id} not found")
+        self.task_id = task_id
+
+class JobNotFoundError(Exception):
+    """Raised when a background job cannot be found."""
+
+    def __init__(self, job_id: UUID):
+        super().__init__(f"Job {job_id} not found")
+        self.job_id = job_id
 
 class ValidationError(Exception):
     """Raised when validation fails."""
@@ -25,6 +37,35 @@ async def task_not_found_handler(request: Request, exc: TaskNotFoundError) -> JS
         }
     )
 
+async def job_not_found_handler(request: Request, exc: JobNotFoundError) -> JSONResponse:
+    """
+    Handler for JobNotFoundError.
+    Returns 404 status code with error details.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={
+            "detail": "Job not found",
+            "type": "job_not_found",
+            "status": status.HTTP_404_NOT_FOUND
+        }
+    )
+
+async def job_queue_full_handler(request: Request, exc: JobQueueFullError) -> JSONResponse:
+    """
+    Handler for JobQueueFullError.
+    Returns 429 status code so clients retry later.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={
+            "detail": str(exc),
+            "type": "job_queue_full",
+            "status": status.HTTP_429_TOO_MANY_REQUESTS
+        },
+        headers={"Retry-After": "5"}
+    )
+
 async def validation_error_handler(request: Request, exc: ValidationError) -> JSONResponse:
     """
     Handler for ValidationError.
@@ -52,3 +93,13 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
             "status": status.HTTP_500_INTERNAL_SERVER_ERROR
         }
     )
+
+def register_error_handlers(app: FastAPI) -> None:
+    """
+    Register the API exception handlers on the application.
+    """
+    app.add_exception_handler(TaskNotFoundError, task_not_found_handler)
+    app.add_exception_handler(JobNotFoundError, job_not_found_handler)
+    app.add_exception_handler(JobQueueFullError, job_queue_full_handler)
+    app.add_exception_handler(ValidationError, validation_error_handler)
+    app.add_exception_handler(Exception, general_exception_handler)
@@ -0,0 +1,34 @@
+# src/infrastructure/api/health_router.py
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+router = APIRouter(tags=["health"])
+
+@router.get(
+    "/healthz",
+    summary="Liveness probe",
+    response_description="The process is up"
+)
+async def healthz() -> dict:
+    """
+    Report that the process is alive. Does not check dependencies.
+    """
+    return {"status": "ok"}
+
+@router.get(
+    "/readyz",
+    summary="Readiness probe",
+    response_description="Whether the application accepts traffic",
+    responses={503: {"description": "Still warming up, shutting down, or warm-up failed"}}
+)
+async def readyz(request: Request) -> JSONResponse:
+    """
+    Report ready once warm-up has finished; 503 while starting or shutting
+    down, and 503 with status ``failed`` if warm-up raised.
+    """
+    if getattr(request.app.state, "ready", False):
+        return JSONResponse({"status": "ready"})
+    error = getattr(request.app.state, "warm_up_error", None)
+    if error is not None:
+        return JSONResponse({"status": "failed", "detail": error}, status_code=503)
+    return JSONResponse({"status": "not_ready"}, status_code=503)
@@ -0,0 +1,85 @@
+# src/infrastructure/api/jobs_router.py
+from fastapi import APIRouter, Depends, Path
+from uuid import UUID
+from ..jobs.job_manager import JobManager, UnknownJobError
+from .models import SubmitJobRequest, JobResponse
+from .dependencies import get_job_manager
+from .error_handlers import JobNotFoundError, ValidationError
+
+router = APIRouter(
+    prefix="/api/v1/jobs",
+    tags=["jobs"],
+    responses={
+        404: {
+            "description": "Job not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Job not found"}
+                }
+            }
+        }
+    }
+)
+
+@router.post(
+    "",
+    response_model=JobResponse,
+    status_code=202,
+    summary="Submit a background job",
+    response_description="The queued job",
+    responses={
+        429: {"description": "The job queue is full; retry later"}
+    }
+)
+async def submit_job(
+    request: SubmitJobRequest,
+    manager: JobManager = Depends(get_job_manager)
+) -> JobResponse:
+    """
+    Queue a named job (for example `export` or `stats`) to run outside the request handler.
+
+    - **name**: Registered job name
+    - **params**: Optional job-specific parameters
+    """
+    try:
+        job = manager.submit(request.name, request.params)
+    except UnknownJobError as e:
+        raise ValidationError(str(e))
+    return JobResponse.from_orm(job)
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Get job status",
+    response_description="The job with its progress and result"
+)
+async def get_job(
+    job_id: UUID = Path(..., description="The ID of the job"),
+    manager: JobManager = Depends(get_job_manager)
+) -> JobResponse:
+    """
+    Report a job's status, progress and, once finished, its result location.
+    """
+    job = manager.get(job_id)
+    if job is None:
+        raise JobNotFoundError(job_id)
+    return JobResponse.from_orm(job)
+
+@router.post(
+    "/{job_id}/cancel",
+    response_model=JobResponse,
+    status_code=202,
+    summary="Cancel a job",
+    response_description="The job being cancelled"
+)
+async def cancel_job(
+    job_id: UUID = Path(..., description="The ID of the job to cancel"),
+    manager: JobManager = Depends(get_job_manager)
+) -> JobResponse:
+    """
+    Request cancellation of a queued or running job. Finished jobs are left unchanged.
+    """
+    job = manager.cancel(job_id)
+    if job is None:
+        raise JobNotFoundError(job_id)
+    return JobResponse.from_orm(job)
@@ -1,9 +1,16 @@
 # src/infrastructure/api/models.py
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 from ...domain.entities.task import TaskStatus
+from ..jobs.job_manager import JobStatus
+
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Tasks store naive UTC timestamps.
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
 
 class CreateTaskRequest(BaseModel):
     """
@@ -14,7 +21,8 @@ class CreateTaskRequest(BaseModel):
         {
             "title": "Implement new feature",
             "description": "Add user authentication to the API",
-            "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000"
+            "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000",
+            "due_at": "2024-01-31T17:00:00Z"
         }
         ```
     """
@@ -23,13 +31,15 @@ class CreateTaskRequest(BaseModel):
             "example": {
                 "title": "Implement new feature",
                 "description": "Add user authentication to the API",
-                "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000"
+                "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000",
+                "due_at": "2024-01-31T17:00:00Z"
             }
         }
     }
     title: str = Field(..., min_length=1, max_length=200, description="Task title")
     description: str = Field(..., min_length=1, max_length=1000, description="Task description")
     assigned_to: Optional[UUID] = Field(None, description="UUID of the assigned user")
+    due_at: Optional[datetime] = Field(None, description="Deadline; the task is reported overdue after it")
 
     @validator('title')
     def title_must_not_be_empty(cls, v):
@@ -45,6 +55,10 @@ class CreateTaskRequest(BaseModel):
             raise ValueError('Description must not be empty')
         return v
 
+    @validator('due_at')
+    def due_at_to_utc(cls, v):
+        return _to_naive_utc(v)
+
 class UpdateTaskRequest(BaseModel):
     """
     Model for updating an existing task.
@@ -55,7 +69,8 @@ class UpdateTaskRequest(BaseModel):
             "title": "Updated feature implementation",
             "description": "Add OAuth2 authentication to the API",
             "status": "IN_PROGRESS",
-            "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000"
+            "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000",
+            "due_at": "2024-01-31T17:00:00Z"
         }
         ```
     """
@@ -65,7 +80,8 @@ class UpdateTaskRequest(BaseModel):
                 "title": "Updated feature implementation",
                 "description": "Add OAuth2 authentication to the API",
                 "status": "IN_PROGRESS",
-                "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000"
+                "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000",
+                "due_at": "2024-01-31T17:00:00Z"
             }
         }
     }
@@ -73,6 +89,7 @@ class UpdateTaskRequest(BaseModel):
     description: Optional[str] = Field(None, min_length=1, max_length=1000)
     status: Optional[TaskStatus] = Field(None)
     assigned_to: Optional[UUID] = Field(None)
+    due_at: Optional[datetime] = Field(None, description="New deadline; null removes it")
 
     @validator('title')
     def title_must_not_be_empty(cls, v):
@@ -90,6 +107,10 @@ class UpdateTaskRequest(BaseModel):
                 raise ValueError('Description must not be empty')
         return v
 
+    @validator('due_at')
+    def due_at_to_utc(cls, v):
+        return _to_naive_utc(v)
+
 class TaskResponse(BaseModel):
     """
     Model for task response data.
@@ -101,6 +122,7 @@ class TaskResponse(BaseModel):
     assigned_to: Optional[UUID]
     created_at: datetime
     updated_at: datetime
+    due_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
@@ -108,3 +130,132 @@ class TaskResponse(BaseModel):
             datetime: lambda v: v.isoformat(),
             UUID: lambda v: str(v)
         }
+
+class ReassignTasksRequest(BaseModel):
+    """
+    Model for reassigning every task of one user to another.
+
+    Example:
+        ```json
+        {
+            "from_user": "987fcdeb-51a2-12d3-a456-426614174000",
+            "to_user": "123e4567-e89b-12d3-a456-426614174000",
+            "statuses": ["PENDING", "IN_PROGRESS"]
+        }
+        ```
+    """
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "from_user": "987fcdeb-51a2-12d3-a456-426614174000",
+                "to_user": "123e4567-e89b-12d3-a456-426614174000",
+                "statuses": ["PENDING", "IN_PROGRESS"]
+            }
+        }
+    }
+    from_user: UUID = Field(..., description="Current assignee")
+    to_user: UUID = Field(..., description="New assignee")
+    statuses: Optional[List[TaskStatus]] = Field(None, min_length=1, description="Only tasks in these statuses; all if omitted")
+
+class TransitionTasksRequest(BaseModel):
+    """
+    Model for moving every task in some statuses to a new status.
+
+    Example:
+        ```json
+        {
+            "statuses": ["PENDING", "IN_PROGRESS"],
+            "to_status": "CANCELLED",
+            "assigned_to": null
+        }
+        ```
+    """
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "statuses": ["PENDING", "IN_PROGRESS"],
+                "to_status": "CANCELLED",
+                "assigned_to": None
+            }
+        }
+    }
+    statuses: List[TaskStatus] = Field(..., min_length=1, description="Tasks currently in these statuses")
+    to_status: TaskStatus = Field(..., description="New status")
+    assigned_to: Optional[UUID] = Field(None, description="Only tasks assigned to this user")
+
+class BulkUpdateResponse(BaseModel):
+    """
+    Model for the outcome of a bulk operation.
+    """
+    affected: int = Field(..., description="Number of tasks changed")
+
+    class Config:
+        from_attributes = True
+
+class TaskChangeResponse(BaseModel):
+    """
+    Model for one entry of a task's change history.
+    """
+    version: int
+    changed_at: datetime
+    changes: Dict[str, Any] = Field(..., description="Fields set by this change and their new values")
+
+    class Config:
+        from_attributes = True
+
+class SubmitJobRequest(BaseModel):
+    """
+    Model for submitting a background job.
+
+    Example:
+        ```json
+        {
+            "name": "export",
+            "params": {}
+        }
+        ```
+    """
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "name": "export",
+                "params": {}
+            }
+        }
+    }
+    name: str = Field(..., min_length=1, description="Name of a registered job, e.g. 'export' or 'stats'")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Job-specific parameters")
+
+class JobResponse(BaseModel):
+    """
+    Model for background job status.
+    """
+    id: UUID
+    name: str
+    status: JobStatus
+    progress: float = Field(..., ge=0, le=1, description="Fraction of tasks processed")
+    processed: int
+    total: int
+    result: Optional[Dict[str, Any]] = None
+    result_location: Optional[str] = Field(None, description="Where the job wrote its output, if anywhere")
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class ProfileResponse(BaseModel):
+    """
+    Model for a stored request profile's metadata.
+    """
+    id: UUID
+    method: str
+    path: str
+    mode: str = Field(..., description="'sample' or 'cprofile'")
+    duration: float = Field(..., description="Request duration in seconds")
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,163 @@
+# src/infrastructure/api/negotiation.py
+"""
+Content negotiation between JSON (the default) and MessagePack.
+
+``MessagePackRoute`` decodes ``application/msgpack`` request bodies before
+FastAPI validates them and answers 406 when the client only accepts
+MessagePack but the server cannot produce it; ``render`` encodes a route's
+result as MessagePack when the client's Accept header prefers it.
+"""
+import inspect
+from datetime import datetime
+from typing import Any, AsyncGenerator, Callable, Coroutine, Dict, FrozenSet, List, Optional, Type, get_args, get_type_hints
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from ..serialization import msgpack_codec
+from ..serialization.task_codec import micros_to_datetime
+
+def _media_ranges(accept: str) -> List[tuple]:
+    ranges = []
+    for position, part in enumerate(accept.split(",")):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        ranges.append((-quality, position, media_type.lower()))
+    return sorted(ranges)
+
+def wants_msgpack(request: Request) -> bool:
+    """
+    True if the Accept header ranks MessagePack above JSON. Ties go to the
+    type listed first; wildcards count as JSON.
+    """
+    accept = request.headers.get("accept")
+    if not accept or not msgpack_codec.AVAILABLE or "msgpack" not in accept:
+        return False
+    for quality, _, media_type in _media_ranges(accept):
+        if quality == 0:
+            return False
+        if media_type in msgpack_codec.MEDIA_TYPES:
+            return True
+        if media_type in ("application/json", "application/*", "*/*"):
+            return False
+    return False
+
+def _requires_msgpack(request: Request) -> bool:
+    """
+    True if the Accept header asks for MessagePack and rules out JSON, which
+    the server cannot honour when msgpack is not installed.
+    """
+    accept = request.headers.get("accept")
+    if not accept or "msgpack" not in accept:
+        return False
+    return not any(
+        quality < 0 and media_type in ("application/json", "application/*", "*/*")
+        for quality, _, media_type in _media_ranges(accept)
+    )
+
+def _is_msgpack(content_type: Optional[str]) -> bool:
+    return content_type is not None and content_type.split(";")[0].strip().lower() in msgpack_codec.MEDIA_TYPES
+
+def _datetime_fields(model: Type[BaseModel]) -> FrozenSet[str]:
+    return frozenset(
+        name for name, field in model.model_fields.items()
+        if field.annotation is datetime or datetime in get_args(field.annotation)
+    )
+
+class _DecodedRequest(Request):
+    """
+    A request whose body has already been read and decoded. FastAPI reads the
+    body through ``body()`` and ``json()``, so both are answered from the
+    decoded MessagePack instead of the (already consumed) receive channel.
+    """
+    def __init__(self, request: Request, body: bytes, data: Any):
+        scope = dict(request.scope)
+        scope["headers"] = [
+            (key, value) for key, value in request.scope["headers"] if key != b"content-type"
+        ] + [(b"content-type", b"application/json")]
+        super().__init__(scope, request.receive)
+        self._raw_body = body
+        self._decoded = data
+
+    async def stream(self) -> AsyncGenerator[bytes, None]:
+        yield self._raw_body
+
+    async def body(self) -> bytes:
+        return self._raw_body
+
+    async def json(self) -> Any:
+        return self._decoded
+
+class MessagePackRoute(APIRoute):
+    """
+    Accepts ``application/msgpack`` request bodies on any route that takes a
+    pydantic body. The body is decoded and handed to FastAPI as if it had been
+    JSON, with integer timestamps turned back into datetimes; 16-byte UUIDs
+    are accepted by pydantic as they are.
+    """
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, endpoint, **kwargs)
+        hints = get_type_hints(endpoint)
+        self._body_datetimes: FrozenSet[str] = frozenset()
+        for name in inspect.signature(endpoint).parameters:
+            hint = hints.get(name)
+            if inspect.isclass(hint) and issubclass(hint, BaseModel):
+                self._body_datetimes = _datetime_fields(hint)
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            if not msgpack_codec.AVAILABLE and _requires_msgpack(request):
+                raise HTTPException(status_code=406, detail="MessagePack is not supported by this server")
+            if _is_msgpack(request.headers.get("content-type")):
+                request = await self._as_json(request)
+            return await handler(request)
+
+        return route_handler
+
+    async def _as_json(self, request: Request) -> Request:
+        if not msgpack_codec.AVAILABLE:
+            raise HTTPException(status_code=415, detail="MessagePack is not supported by this server")
+        body = await request.body()
+        try:
+            data = msgpack_codec.unpackb(body) if body else None
+        except Exception:
+            raise RequestValidationError([{
+                "type": "msgpack_invalid",
+                "loc": ("body",),
+                "msg": "MessagePack decode error",
+                "input": {}
+            }])
+        if isinstance(data, dict):
+            for name in self._body_datetimes & data.keys():
+                if isinstance(data[name], int):
+                    data[name] = micros_to_datetime(data[name])
+        return _DecodedRequest(request, body, data)
+
+def _to_wire(value: Any, fields: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: getattr(value, name) for name in fields}
+
+def render(request: Request, content: Any, model: Type[BaseModel], status_code: int = 200) -> Any:
+    """
+    Return ``content`` (a domain object or a list of them) as ``model``. JSON
+    goes through FastAPI's usual response_model serialization; MessagePack is
+    encoded straight from the domain objects.
+    """
+    if wants_msgpack(request):
+        fields = model.model_fields
+        if isinstance(content, list):
+            payload: Any = [_to_wire(item, fields) for item in content]
+        else:
+            payload = _to_wire(content, fields)
+        return Response(msgpack_codec.packb(payload), status_code=status_code, media_type=msgpack_codec.MEDIA_TYPE)
+    if isinstance(content, list):
+        return [model.from_orm(item) for item in content]
+    return model.from_orm(content)
@@ -1,17 +1,38 @@
 
 # src/infrastructure/api/router.py
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, Body
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Body, Request
+from fastapi.responses import StreamingResponse
 from typing import Dict, Any
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
+from datetime import datetime
 from ...application.controllers.task_controller import TaskController
-from .models import CreateTaskRequest, UpdateTaskRequest, TaskResponse
+from ...application.dtos.task_dto import (
+    CreateTaskDTO,
+    UpdateTaskDTO,
+    ReassignTasksDTO,
+    TransitionTasksDTO
+)
+from .models import (
+    CreateTaskRequest,
+    UpdateTaskRequest,
+    ReassignTasksRequest,
+    TransitionTasksRequest,
+    BulkUpdateResponse,
+    TaskResponse,
+    TaskChangeResponse
+)
 from .dependencies import get_controller
+from .error_handlers import TaskNotFoundError, ValidationError
+from .negotiation import MessagePackRoute, render
 from ...domain.entities.task import TaskStatus
 
 router = APIRouter(
     prefix="/api/v1/tasks",
     tags=["tasks"],
+    # Every route also speaks application/msgpack; see negotiation.py.
+    route_class=MessagePackRoute,
     responses={
         404: {
             "description": "Task not found",
@@ -66,12 +87,14 @@ router = APIRouter(
     }
 )
 async def create_task(
+    http_request: Request,
     request: CreateTaskRequest = Body(
         ...,
         example={
             "title": "Implement new feature",
             "description": "Add user authentication to the API",
-            "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000"
+            "assigned_to": "987fcdeb-51k2-12d3-a456-426614174000",
+            "due_at": "2024-01-31T17:00:00Z"
         }
     ),
     controller: TaskController = Depends(get_controller)
@@ -82,13 +105,102 @@ async def create_task(
     - **title**: Task title (1-200 characters)
     - **description**: Task description (1-1000 characters)
     - **assigned_to**: Optional UUID of the user to assign the task to
+    - **due_at**: Optional deadline; the task is reported overdue once it passes
     """
     try:
-        task = await controller.create_task(request.dict())
-        return TaskResponse.from_orm(task)
+        task = await controller.create_task(CreateTaskDTO(**request.dict()))
+        return render(http_request, task, TaskResponse, status_code=201)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+MAX_IDS_PER_REQUEST = 1000
+
+def _parse_ids(ids: str) -> List[UUID]:
+    parts = [part.strip() for part in ids.split(",") if part.strip()]
+    if len(parts) > MAX_IDS_PER_REQUEST:
+        raise ValidationError(f"At most {MAX_IDS_PER_REQUEST} IDs can be requested at once")
+    try:
+        return [UUID(part) for part in parts]
+    except ValueError:
+        raise ValidationError("ids must be a comma-separated list of task UUIDs")
+
+async def _stream_affected(chunks: AsyncIterator[List[UUID]]) -> StreamingResponse:
+    """
+    Stream affected task IDs as NDJSON while the update is applied, followed
+    by the total count. The first chunk is applied before answering so that
+    errors up front still become regular error responses.
+    """
+    first = await anext(chunks, None)
+
+    async def lines():
+        affected = 0
+        chunk = first
+        try:
+            while chunk is not None:
+                affected += len(chunk)
+                yield "".join(f'{{"id": "{task_id}"}}\n' for task_id in chunk)
+                chunk = await anext(chunks, None)
+            yield f'{{"affected": {affected}}}\n'
+        finally:
+            # A client that goes away must not leave the update half applied.
+            with anyio.CancelScope(shield=True):
+                async for _ in chunks:
+                    pass
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.post(
+    ":reassign",
+    response_model=BulkUpdateResponse,
+    summary="Reassign all tasks of a user",
+    response_description="Number of reassigned tasks"
+)
+async def reassign_tasks(
+    http_request: Request,
+    request: ReassignTasksRequest,
+    stream: bool = Query(False, description="Stream the affected task IDs as NDJSON"),
+    controller: TaskController = Depends(get_controller)
+) -> BulkUpdateResponse:
+    """
+    Assign every task of one user to another in a single server-side pass.
+
+    - **from_user** / **to_user**: current and new assignee
+    - **statuses**: optional; only reassign tasks in these statuses
+    - **stream**: return `{"id": ...}` lines for each task and a final `{"affected": n}` line
+    """
+    dto = ReassignTasksDTO(**request.dict())
+    if stream:
+        return await _stream_affected(controller.stream_reassign_tasks(dto))
+    result = await controller.reassign_tasks(dto)
+    return render(http_request, result, BulkUpdateResponse)
+
+@router.post(
+    ":transition",
+    response_model=BulkUpdateResponse,
+    summary="Move all tasks in some statuses to a new status",
+    response_description="Number of transitioned tasks"
+)
+async def transition_tasks(
+    http_request: Request,
+    request: TransitionTasksRequest,
+    stream: bool = Query(False, description="Stream the affected task IDs as NDJSON"),
+    controller: TaskController = Depends(get_controller)
+) -> BulkUpdateResponse:
+    """
+    Change the status of every matching task in a single server-side pass,
+    e.g. to close out a sprint.
+
+    - **statuses**: tasks currently in these statuses
+    - **to_status**: their new status
+    - **assigned_to**: optional; only tasks assigned to this user
+    - **stream**: return `{"id": ...}` lines for each task and a final `{"affected": n}` line
+    """
+    dto = TransitionTasksDTO(**request.dict())
+    if stream:
+        return await _stream_affected(controller.stream_transition_tasks(dto))
+    result = await controller.transition_tasks(dto)
+    return render(http_request, result, BulkUpdateResponse)
+
 @router.get(
     "/",
     response_model=List[TaskResponse],
@@ -112,7 +224,7 @@ async def create_task(
                         "title": "Fix bug in login",
                         "description": "Address issue with password reset",
                         "status": "PENDING",
-                        "assigned_to": null,
+                        "assigned_to": None,
                         "created_at": "2024-01-16T11:00:00.000Z",
                         "updated_at": "2024-01-16T11:00:00.000Z"
                     }]
@@ -122,22 +234,56 @@ async def create_task(
     }
 )
 async def list_tasks(
+    http_request: Request,
+    ids: Optional[str] = Query(None, description="Comma-separated task IDs to fetch (at most 1000)"),
     status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
     assigned_to: Optional[UUID] = Query(None, description="Filter by assigned user"),
+    after: Optional[UUID] = Query(None, description="Return tasks created after this task ID"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum number of tasks to return"),
+    created_after: Optional[datetime] = Query(None, description="Only tasks created at or after this time (UTC)"),
+    created_before: Optional[datetime] = Query(None, description="Only tasks created before this time (UTC)"),
+    controller: TaskController = Depends(get_controller)
+) -> List[TaskResponse]:
+    """
+    Retrieve all tasks ordered by creation time, with optional filtering by status and assigned user.
+
+    - **after** / **limit**: keyset pagination; pass the last ID of a page as `after` to get the next one
+    - **ids**: fetch these tasks in one batched lookup; unknown IDs are left out
+    - **created_after** / **created_before**: creation-time window, answered by an ID range scan
+    - **status** / **assigned_to**: applied before the page is cut, so a short page is the last one;
+      status queries skip archived (cold) tasks unless a terminal status is requested
+    """
+    if ids is not None:
+        tasks = await controller.get_tasks(_parse_ids(ids))
+        if status:
+            tasks = [task for task in tasks if task.status == status]
+        if assigned_to:
+            tasks = [task for task in tasks if task.assigned_to == assigned_to]
+    elif created_after or created_before:
+        tasks = await controller.list_tasks_created_between(
+            created_after, created_before, status, assigned_to, after, limit
+        )
+    else:
+        tasks = await controller.list_tasks(after, limit, status, assigned_to)
+    return render(http_request, tasks, TaskResponse)
+
+# Declared before "/{task_id}" so "overdue" is not parsed as a task ID.
+@router.get(
+    "/overdue",
+    response_model=List[TaskResponse],
+    summary="List overdue tasks",
+    response_description="Open tasks past their due date, most overdue first"
+)
+async def list_overdue_tasks(
+    http_request: Request,
     controller: TaskController = Depends(get_controller)
 ) -> List[TaskResponse]:
     """
-    Retrieve all tasks, with optional filtering by status and assigned user.
+    Retrieve open (PENDING or IN_PROGRESS) tasks whose due date has passed.
+    Answered from the overdue scheduler's index rather than a scan.
     """
-    tasks = await controller.list_tasks()
-    
-    # Apply filters if provided
-    if status:
-        tasks = [task for task in tasks if task.status == status]
-    if assigned_to:
-        tasks = [task for task in tasks if task.assigned_to == assigned_to]
-        
-    return [TaskResponse.from_orm(task) for task in tasks]
+    tasks = await controller.list_overdue_tasks()
+    return render(http_request, tasks, TaskResponse)
 
 @router.get(
     "/{task_id}",
@@ -146,17 +292,37 @@ async def list_tasks(
     response_description="The requested task"
 )
 async def get_task(
+    http_request: Request,
     task_id: UUID = Path(..., description="The ID of the task to retrieve"),
+    as_of: Optional[datetime] = Query(None, description="Return the task as it was at this time (UTC)"),
     controller: TaskController = Depends(get_controller)
 ) -> TaskResponse:
     """
-    Retrieve a specific task by its ID.
+    Retrieve a specific task by its ID, optionally as it was at an earlier point in time.
     """
-    try:
-        task = await controller.get_task(task_id)
-        return TaskResponse.from_orm(task)
-    except ValueError:
-        raise HTTPException(status_code=404, detail="Task not found")
+    task = await controller.get_task(task_id, as_of)
+    if task is None:
+        raise TaskNotFoundError(task_id)
+    return render(http_request, task, TaskResponse)
+
+@router.get(
+    "/{task_id}/history",
+    response_model=List[TaskChangeResponse],
+    summary="Get the change history of a task",
+    response_description="The task's changes, oldest first"
+)
+async def get_task_history(
+    http_request: Request,
+    task_id: UUID = Path(..., description="The ID of the task"),
+    controller: TaskController = Depends(get_controller)
+) -> List[TaskChangeResponse]:
+    """
+    Retrieve every recorded change of a task. Version 0 is its creation.
+    """
+    history = await controller.get_task_history(task_id)
+    if history is None:
+        raise TaskNotFoundError(task_id)
+    return render(http_request, history, TaskChangeResponse)
 
 @router.patch(
     "/{task_id}",
@@ -165,6 +331,7 @@ async def get_task(
     response_description="The updated task"
 )
 async def update_task(
+    http_request: Request,
     request: UpdateTaskRequest,
     task_id: UUID = Path(..., description="The ID of the task to update"),
     controller: TaskController = Depends(get_controller)
@@ -176,12 +343,16 @@ async def update_task(
     - **description**: Optional new description (1-1000 characters)
     - **status**: Optional new status
     - **assigned_to**: Optional new assigned user UUID
+    - **due_at**: Optional new deadline; `null` removes it
     """
-    try:
-        task = await controller.update_task(task_id, request.dict(exclude_unset=True))
-        return TaskResponse.from_orm(task)
-    except ValueError:
-        raise HTTPException(status_code=404, detail="Task not found")
+    fields = request.dict(exclude_unset=True)
+    if "due_at" in fields and fields["due_at"] is None:
+        del fields["due_at"]
+        fields["clear_due_at"] = True
+    task = await controller.update_task(task_id, UpdateTaskDTO(**fields))
+    if task is None:
+        raise TaskNotFoundError(task_id)
+    return render(http_request, task, TaskResponse)
 
 @router.post(
     "/{task_id}/assign/{user_id}",
@@ -190,6 +361,7 @@ async def update_task(
     response_description="The updated task"
 )
 async def assign_task(
+    http_request: Request,
     task_id: UUID = Path(..., description="The ID of the task to assign"),
     user_id: UUID = Path(..., description="The ID of the user to assign the task to"),
     controller: TaskController = Depends(get_controller)
@@ -197,11 +369,10 @@ async def assign_task(
     """
     Assign a task to a specific user.
     """
-    try:
-        task = await controller.assign_task(task_id, user_id)
-        return TaskResponse.from_orm(task)
-    except ValueError:
-        raise HTTPException(status_code=404, detail="Task not found")
+    task = await controller.assign_task(task_id, user_id)
+    if task is None:
+        raise TaskNotFoundError(task_id)
+    return render(http_request, task, TaskResponse)
 
 @router.post(
     "/{task_id}/status/{status}",
@@ -210,6 +381,7 @@ async def assign_task(
     response_description="The updated task"
 )
 async def update_task_status(
+    http_request: Request,
     task_id: UUID = Path(..., description="The ID of the task to update"),
     status: TaskStatus = Path(..., description="The new status"),
     controller: TaskController = Depends(get_controller)
@@ -217,8 +389,7 @@ async def update_task_status(
     """
     Update the status of a specific task.
     """
-    try:
-        task = await controller.update_task(task_id, {"status": status})
-        return TaskResponse.from_orm(task)
-    except ValueError:
-        raise HTTPException(status_code=404, detail="Task not found")
\ No newline at end of file
+    task = await controller.update_task(task_id, UpdateTaskDTO(status=status))
+    if task is None:
+        raise TaskNotFoundError(task_id)
+    return render(http_request, task, TaskResponse)
\ No newline at end of file
@@ -0,0 +1,47 @@
+# src/infrastructure/api/warm_up.py
+import asyncio
+from fastapi import FastAPI
+from ...domain.entities.task import Task
+from ...domain.entities.task_history import TaskChange
+from ..jobs.job_manager import Job
+from . import dependencies
+from .models import (
+    CreateTaskRequest,
+    UpdateTaskRequest,
+    ReassignTasksRequest,
+    TransitionTasksRequest,
+    TaskResponse,
+    TaskChangeResponse,
+    SubmitJobRequest,
+    JobResponse
+)
+
+def _warm_models() -> None:
+    """
+    Run every API model through validation and JSON serialization once, so
+    the first real request does not pay for lazily built pydantic internals.
+    """
+    task = Task.create("Warm-up", "Warm-up task")
+    for model in (CreateTaskRequest, UpdateTaskRequest, ReassignTasksRequest, TransitionTasksRequest, SubmitJobRequest):
+        example = model.model_config["json_schema_extra"]["example"]
+        model.model_validate_json(model.model_validate(
+            {key: value for key, value in example.items() if key != "assigned_to"}
+        ).model_dump_json())
+    TaskResponse.model_validate(task).model_dump_json()
+    TaskChangeResponse.model_validate(
+        TaskChange(task_id=task.id, version=0, changed_at=task.created_at, changes={"title": task.title})
+    ).model_dump_json()
+    JobResponse.model_validate(Job(id=task.id, name="warm-up", params={})).model_dump_json()
+
+async def warm_up(app: FastAPI) -> None:
+    """
+    Prepare the application for traffic: build the shared repositories and
+    their indexes, exercise the API models and render the OpenAPI schema.
+    """
+    await dependencies.repository().warm_up()
+    dependencies.history_repository()
+    dependencies.job_manager()
+    # Both are pure CPU work that takes tens of milliseconds; run them off the
+    # event loop so /healthz and early requests are not stalled meanwhile.
+    await asyncio.to_thread(_warm_models)
+    await asyncio.to_thread(app.openapi)
@@ -0,0 +1,70 @@
+# src/infrastructure/config/settings.py
+import os
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+def _flag(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Application settings. ``from_env`` reads each field from the matching
+    upper-case ``TASKFLOW_`` environment variable, e.g. TASKFLOW_WRITE_BEHIND_MS.
+    """
+    title: str = "TaskFlow Architect"
+    # Write-behind durability window in milliseconds; 0 disables the buffer.
+    write_behind_ms: float = 0
+    write_behind_max_pending: int = 1000
+    # Move terminal tasks untouched for cold_after_seconds into compressed
+    # segment files under cold_dir (default: the system temp directory).
+    tiering_enabled: bool = False
+    cold_dir: Optional[str] = None
+    cold_after_seconds: float = 7 * 24 * 3600
+    tiering_interval_seconds: float = 300.0
+    job_workers: Optional[int] = None
+    max_concurrent_jobs: int = 2
+    max_queued_jobs: int = 16
+    job_chunk_size: int = 5000
+    export_dir: Optional[str] = None
+    # Build caches and validators before /readyz reports ready.
+    warm_up: bool = True
+    # Token required by admin endpoints and on-demand profiling; None disables both.
+    admin_token: Optional[str] = None
+    # Profiling hooks are only installed when enabled.
+    profiling_enabled: bool = False
+    # Profile one in N requests with the stack sampler; 0 disables sampled mode.
+    profile_sample_rate: int = 0
+    profile_interval_ms: float = 5.0
+    max_stored_profiles: int = 32
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "Settings":
+        def get(name: str) -> Optional[str]:
+            return environ.get(f"TASKFLOW_{name.upper()}")
+
+        values = {}
+        for name, convert in (
+            ("title", str),
+            ("write_behind_ms", float),
+            ("write_behind_max_pending", int),
+            ("tiering_enabled", _flag),
+            ("cold_dir", str),
+            ("cold_after_seconds", float),
+            ("tiering_interval_seconds", float),
+            ("job_workers", int),
+            ("max_concurrent_jobs", int),
+            ("max_queued_jobs", int),
+            ("job_chunk_size", int),
+            ("export_dir", str),
+            ("warm_up", _flag),
+            ("admin_token", str),
+            ("profiling_enabled", _flag),
+            ("profile_sample_rate", int),
+            ("profile_interval_ms", float),
+            ("max_stored_profiles", int),
+        ):
+            raw = get(name)
+            if raw is not None and raw != "":
+                values[name] = convert(raw)
+        return cls(**values)
@@ -0,0 +1,23 @@
+# src/infrastructure/events/in_memory_event_publisher.py
+from collections import deque
+from typing import Awaitable, Callable, Deque, List
+from ...domain.events.event_publisher import EventPublisher
+
+EventHandler = Callable[[object], Awaitable[None]]
+
+class InMemoryEventPublisher(EventPublisher):
+    """
+    Delivers events to in-process subscribers and keeps the most recent ones
+    for inspection.
+    """
+    def __init__(self, max_recent: int = 1000):
+        self.recent: Deque[object] = deque(maxlen=max_recent)
+        self._handlers: List[EventHandler] = []
+
+    def subscribe(self, handler: EventHandler) -> None:
+        self._handlers.append(handler)
+
+    async def publish(self, event: object) -> None:
+        self.recent.append(event)
+        for handler in self._handlers:
+            await handler(event)
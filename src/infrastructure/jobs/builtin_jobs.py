@@ -0,0 +1,81 @@
+# src/infrastructure/jobs/builtin_jobs.py
+import json
+import os
+import tempfile
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+from ..serialization.task_codec import decode_chunk, micros_to_datetime
+from .job_manager import ExecutorKind, Job, JobDefinition, JobManager
+
+def _export_dir(params: Dict[str, Any]) -> str:
+    root = params.get("export_dir") or os.path.join(tempfile.gettempdir(), "taskflow-exports")
+    return os.path.join(root, params["job_id"])
+
+def export_chunk(chunk: bytes, params: Dict[str, Any]) -> Tuple[int, str]:
+    """Write one chunk as a JSON Lines part file; return the row count and directory."""
+    directory = _export_dir(params)
+    os.makedirs(directory, exist_ok=True)
+    records = decode_chunk(chunk)
+    path = os.path.join(directory, f"part-{params['chunk_index']:05d}.jsonl")
+    with open(path, "w", encoding="utf-8") as out:
+        for id, title, description, status, assigned_to, created_at, updated_at, due_at in records:
+            out.write(json.dumps({
+                "id": str(UUID(bytes=id)),
+                "title": title,
+                "description": description,
+                "status": status,
+                "assigned_to": str(UUID(bytes=assigned_to)) if assigned_to is not None else None,
+                "created_at": micros_to_datetime(created_at).isoformat(),
+                "updated_at": micros_to_datetime(updated_at).isoformat(),
+                "due_at": micros_to_datetime(due_at).isoformat() if due_at is not None else None,
+            }))
+            out.write("\n")
+    return len(records), directory
+
+def _combine_export(total: Tuple[int, Optional[str]], part: Tuple[int, str]) -> Tuple[int, Optional[str]]:
+    return total[0] + part[0], part[1]
+
+def _finalize_export(total: Tuple[int, Optional[str]], job: Job) -> Dict[str, Any]:
+    rows, directory = total
+    job.result_location = directory
+    return {"rows": rows, "format": "jsonl"}
+
+def stats_chunk(chunk: bytes, params: Dict[str, Any]) -> Dict[str, Counter]:
+    """Count tasks per status and per assignee in one chunk."""
+    by_status: Counter = Counter()
+    by_assignee: Counter = Counter()
+    for record in decode_chunk(chunk):
+        by_status[record[3]] += 1
+        by_assignee[record[4]] += 1
+    return {"by_status": by_status, "by_assignee": by_assignee}
+
+def _combine_stats(total: Dict[str, Counter], part: Dict[str, Counter]) -> Dict[str, Counter]:
+    total["by_status"].update(part["by_status"])
+    total["by_assignee"].update(part["by_assignee"])
+    return total
+
+def _finalize_stats(total: Dict[str, Counter], job: Job) -> Dict[str, Any]:
+    by_assignee = total["by_assignee"]
+    return {
+        "total": job.processed,
+        "by_status": dict(total["by_status"]),
+        "unassigned": by_assignee.pop(None, 0),
+        "by_assignee": {str(UUID(bytes=user)): count for user, count in by_assignee.most_common()},
+    }
+
+def register_builtin_jobs(manager: JobManager) -> None:
+    manager.register("export", JobDefinition(
+        map_chunk=export_chunk,
+        combine=_combine_export,
+        initial=lambda: (0, None),
+        finalize=_finalize_export,
+        executor=ExecutorKind.PROCESS
+    ))
+    manager.register("stats", JobDefinition(
+        map_chunk=stats_chunk,
+        combine=_combine_stats,
+        initial=lambda: {"by_status": Counter(), "by_assignee": Counter()},
+        finalize=_finalize_stats,
+        executor=ExecutorKind.PROCESS
+    ))
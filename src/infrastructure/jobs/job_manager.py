@@ -0,0 +1,219 @@
+# src/infrastructure/jobs/job_manager.py
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+from ...domain.entities.identifiers import uuid7
+from ...domain.repositories.task_repository import TaskRepository
+from ..serialization.task_codec import encode_chunk
+
+class JobStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+class ExecutorKind(str, Enum):
+    PROCESS = "process"
+    THREAD = "thread"
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while the job queue is full."""
+    pass
+
+class UnknownJobError(ValueError):
+    """Raised when a job name has not been registered."""
+    pass
+
+@dataclass
+class JobDefinition:
+    """
+    A job runs ``map_chunk(chunk, params)`` in an executor for every chunk of
+    tasks, folds the results with ``combine`` on the event loop and turns the
+    final accumulator into the job result with ``finalize``.
+
+    ``map_chunk`` receives a chunk encoded by ``task_codec.encode_chunk`` and
+    must be a module-level function so it can be sent to worker processes.
+    """
+    map_chunk: Callable[[bytes, Dict[str, Any]], Any]
+    combine: Callable[[Any, Any], Any]
+    initial: Callable[[], Any]
+    finalize: Callable[[Any, "Job"], Dict[str, Any]]
+    executor: ExecutorKind = ExecutorKind.PROCESS
+
+@dataclass
+class Job:
+    id: UUID
+    name: str
+    params: Dict[str, Any]
+    status: JobStatus = JobStatus.QUEUED
+    processed: int = 0
+    total: int = 0
+    result: Optional[Dict[str, Any]] = None
+    result_location: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def progress(self) -> float:
+        if self.status == JobStatus.COMPLETED:
+            return 1.0
+        return self.processed / self.total if self.total else 0.0
+
+class JobManager:
+    """
+    Runs registered jobs off the event loop.
+
+    At most ``max_concurrent_jobs`` jobs run at once and at most ``max_queued``
+    jobs may be waiting or running; further submissions are rejected. Each
+    job reads a repository snapshot, so it sees a consistent view of tasks
+    while requests keep writing.
+    """
+    def __init__(
+        self,
+        repository: TaskRepository,
+        max_workers: Optional[int] = None,
+        max_concurrent_jobs: int = 2,
+        max_queued: int = 16,
+        chunk_size: int = 5000,
+        max_finished_jobs: int = 1000,
+        export_dir: Optional[str] = None
+    ):
+        self.repository = repository
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.chunk_size = chunk_size
+        self.max_finished_jobs = max_finished_jobs
+        self.export_dir = export_dir
+        self._definitions: Dict[str, JobDefinition] = {}
+        self._jobs: "OrderedDict[UUID, Job]" = OrderedDict()
+        self._running: Dict[UUID, asyncio.Task] = {}
+        self._slots = asyncio.Semaphore(max_concurrent_jobs)
+        self._executors: Dict[ExecutorKind, Executor] = {}
+
+    def register(self, name: str, definition: JobDefinition) -> None:
+        self._definitions[name] = definition
+
+    @property
+    def job_names(self) -> List[str]:
+        return sorted(self._definitions)
+
+    def submit(self, name: str, params: Optional[Dict[str, Any]] = None) -> Job:
+        definition = self._definitions.get(name)
+        if definition is None:
+            raise UnknownJobError(f"Unknown job '{name}'. Available jobs: {', '.join(self.job_names)}")
+        if len(self._running) >= self.max_queued:
+            raise JobQueueFullError(f"Job queue is full ({self.max_queued} jobs)")
+
+        job = Job(id=uuid7(), name=name, params=dict(params or {}))
+        self._jobs[job.id] = job
+        task = asyncio.create_task(self._run(job, definition))
+        task.add_done_callback(lambda task: self._finished(job, task))
+        self._running[job.id] = task
+        self._prune()
+        return job
+
+    def get(self, job_id: UUID) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: UUID) -> Optional[Job]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        running = self._running.get(job_id)
+        if running is not None:
+            running.cancel()
+        return job
+
+    async def shutdown(self) -> None:
+        for running in list(self._running.values()):
+            running.cancel()
+        if self._running:
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
+
+    def _executor(self, kind: ExecutorKind) -> Executor:
+        executor = self._executors.get(kind)
+        if executor is None:
+            # Imported here: the pool modules pull in multiprocessing, which
+            # is only worth paying for once a job actually runs.
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+            if kind == ExecutorKind.PROCESS:
+                executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="taskflow-job")
+            self._executors[kind] = executor
+        return executor
+
+    async def _run(self, job: Job, definition: JobDefinition) -> None:
+        try:
+            async with self._slots:
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.utcnow()
+                job.result = await self._execute(job, definition)
+                job.status = JobStatus.COMPLETED
+        except asyncio.CancelledError:
+            job.status = JobStatus.CANCELLED
+        except Exception as error:
+            job.status = JobStatus.FAILED
+            job.error = str(error)
+        finally:
+            job.finished_at = datetime.utcnow()
+
+    def _finished(self, job: Job, task: asyncio.Task) -> None:
+        # Runs even if the task was cancelled before _run started, in which
+        # case nothing above has recorded the outcome.
+        self._running.pop(job.id, None)
+        if job.status in (JobStatus.QUEUED, JobStatus.RUNNING):
+            job.status = JobStatus.CANCELLED if task.cancelled() else JobStatus.FAILED
+            job.finished_at = datetime.utcnow()
+
+    async def _execute(self, job: Job, definition: JobDefinition) -> Dict[str, Any]:
+        with self.repository.snapshot() as snapshot:
+            tasks = await snapshot.find_all()
+        job.total = len(tasks)
+
+        loop = asyncio.get_running_loop()
+        executor = self._executor(definition.executor)
+        params = dict(job.params, job_id=str(job.id), export_dir=self.export_dir)
+        # Keep a bounded window of chunks in flight so cancellation takes
+        # effect quickly and encoded chunks do not pile up in memory.
+        window = max(2, 2 * (getattr(executor, "_max_workers", None) or 1))
+        pending: Dict[asyncio.Future, int] = {}
+        accumulator = definition.initial()
+        try:
+            for index, start in enumerate(range(0, len(tasks), self.chunk_size)):
+                chunk = tasks[start:start + self.chunk_size]
+                params_for_chunk = dict(params, chunk_index=index)
+                future = loop.run_in_executor(executor, definition.map_chunk, encode_chunk(chunk), params_for_chunk)
+                pending[future] = len(chunk)
+                if len(pending) >= window:
+                    accumulator = await self._drain(job, definition, pending, accumulator, asyncio.FIRST_COMPLETED)
+            while pending:
+                accumulator = await self._drain(job, definition, pending, accumulator, asyncio.ALL_COMPLETED)
+        finally:
+            for future in pending:
+                future.cancel()
+        return definition.finalize(accumulator, job)
+
+    async def _drain(self, job, definition, pending, accumulator, return_when):
+        done, _ = await asyncio.wait(pending, return_when=return_when)
+        for future in done:
+            size = pending.pop(future)
+            accumulator = definition.combine(accumulator, future.result())
+            job.processed += size
+        return accumulator
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id in self._jobs if job_id not in self._running]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
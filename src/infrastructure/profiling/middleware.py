@@ -0,0 +1,128 @@
+# src/infrastructure/profiling/middleware.py
+import cProfile
+import hmac
+import threading
+import time
+from itertools import count
+from typing import Optional
+from urllib.parse import parse_qs
+from starlette.responses import JSONResponse
+from ...domain.entities.identifiers import uuid7
+from .profiler import ProfileMode, RequestProfiler, StoredProfile, collapse_profile, format_collapsed
+
+PROFILE_HEADER = b"x-profile"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+MODES = (ProfileMode.SAMPLE, ProfileMode.DETERMINISTIC)
+
+# cProfile hooks are process-wide: on Python 3.12+ a second enabled profiler
+# raises, and before that it silently replaces the first. Only one
+# deterministic profile can run at a time.
+_deterministic = threading.Lock()
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware for on-demand and sampled request profiling.
+
+    On demand: a request carrying a valid ``X-Admin-Token`` and either an
+    ``X-Profile: sample|cprofile`` header or a ``?profile=sample|cprofile``
+    query flag runs under the chosen profiler. The profile is stored and its
+    ID returned in the ``X-Profile-Id`` response header. Unknown modes are
+    rejected with 400, and a ``cprofile`` request is rejected with 409 while
+    another one is running.
+
+    Sampled: with ``sample_rate`` N > 0, one in N requests is recorded by the
+    stack sampler into the aggregated hot stacks.
+
+    The middleware is only installed when profiling is enabled, so a disabled
+    profiler adds no per-request work.
+    """
+    def __init__(self, app, profiler: RequestProfiler, admin_token: Optional[str] = None, sample_rate: int = 0):
+        self.app = app
+        self.profiler = profiler
+        self.admin_token = admin_token.encode() if admin_token else None
+        self.sample_rate = sample_rate
+        self._requests = count(1)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        mode = self._requested_mode(scope)
+        if mode is not None:
+            if mode not in MODES:
+                detail = f"Unknown profile mode '{mode}'; use one of: {', '.join(MODES)}"
+                return await _error(400, detail, "profile_mode_invalid")(scope, receive, send)
+            return await self._profile(mode, scope, receive, send)
+        if self.sample_rate and next(self._requests) % self.sample_rate == 0:
+            token = self.profiler.sampler.begin(threading.get_ident())
+            try:
+                return await self.app(scope, receive, send)
+            finally:
+                self.profiler.sampler.end(token)
+        return await self.app(scope, receive, send)
+
+    def _requested_mode(self, scope) -> Optional[str]:
+        if self.admin_token is None:
+            return None
+        headers = dict(scope["headers"])
+        requested = headers.get(PROFILE_HEADER, b"").decode("latin-1")
+        if not requested and b"profile=" in scope.get("query_string", b""):
+            requested = parse_qs(scope["query_string"].decode("latin-1")).get("profile", [""])[0]
+        if not requested:
+            return None
+        if not hmac.compare_digest(headers.get(ADMIN_TOKEN_HEADER, b""), self.admin_token):
+            return None
+        return requested.strip().lower()
+
+    async def _profile(self, mode: str, scope, receive, send):
+        profile_id = uuid7()
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message = dict(message, headers=list(message.get("headers", [])) + [
+                    (b"x-profile-id", str(profile_id).encode())
+                ])
+            await send(message)
+
+        started = time.perf_counter()
+        # Both profilers observe the event loop thread, so work from other
+        # requests interleaved with this one shows up in its profile too.
+        if mode == ProfileMode.DETERMINISTIC:
+            if not _deterministic.acquire(blocking=False):
+                return await _busy()(scope, receive, send)
+            try:
+                profile = cProfile.Profile()
+                try:
+                    profile.enable()
+                except ValueError:
+                    # Another profiler, e.g. a debugger or coverage tool, owns the hooks.
+                    return await _busy()(scope, receive, send)
+                try:
+                    await self.app(scope, receive, send_with_id)
+                finally:
+                    profile.disable()
+            finally:
+                _deterministic.release()
+            content = format_collapsed(collapse_profile(profile))
+        else:
+            token = self.profiler.sampler.begin(threading.get_ident(), keep=True)
+            try:
+                await self.app(scope, receive, send_with_id)
+            finally:
+                samples = self.profiler.sampler.end(token)
+            content = format_collapsed(samples)
+
+        self.profiler.store(StoredProfile(
+            id=profile_id,
+            method=scope["method"],
+            path=scope["path"],
+            mode=mode,
+            duration=time.perf_counter() - started,
+            content=content
+        ))
+
+def _error(status_code: int, detail: str, type: str) -> JSONResponse:
+    return JSONResponse(status_code=status_code, content={"detail": detail, "type": type, "status": status_code})
+
+def _busy() -> JSONResponse:
+    return _error(409, "Another deterministic profile is running; retry or use X-Profile: sample", "profiler_busy")
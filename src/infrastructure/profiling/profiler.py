@@ -0,0 +1,166 @@
+# src/infrastructure/profiling/profiler.py
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import CodeType, FrameType
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+class ProfileMode:
+    SAMPLE = "sample"
+    DETERMINISTIC = "cprofile"
+
+@dataclass
+class StoredProfile:
+    id: UUID
+    method: str
+    path: str
+    mode: str
+    duration: float
+    # Collapsed stacks ("frame;frame;frame count" per line): sample counts
+    # for sampled profiles, microseconds of self time for deterministic ones.
+    content: str
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+class StackSampler:
+    """
+    Samples thread stacks from a background thread while at least one
+    recording is active, and folds them into collapsed-stack counts that
+    flamegraph.pl, speedscope and similar tools read directly.
+
+    The sampler thread only runs while something is being recorded.
+    """
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.hot_stacks: Counter = Counter()
+        self._recordings: Dict[int, Tuple[int, Optional[Counter]]] = {}
+        self._next_token = 0
+        self._labels: Dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def begin(self, thread_id: int, keep: bool = False) -> int:
+        """
+        Start recording ``thread_id``. Samples always feed ``hot_stacks``;
+        with ``keep`` they are also returned by ``end``.
+        """
+        with self._lock:
+            self._next_token += 1
+            token = self._next_token
+            self._recordings[token] = (thread_id, Counter() if keep else None)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="taskflow-stack-sampler", daemon=True)
+                self._thread.start()
+        return token
+
+    def end(self, token: int) -> Counter:
+        with self._lock:
+            _, samples = self._recordings.pop(token)
+        return samples if samples is not None else Counter()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hot_stacks = Counter()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while True:
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+            with self._lock:
+                if not self._recordings:
+                    self._thread = None
+                    return
+                stacks: Dict[int, Optional[str]] = {}
+                for thread_id, samples in self._recordings.values():
+                    if thread_id == own_id:
+                        continue
+                    if thread_id not in stacks:
+                        frame = frames.get(thread_id)
+                        stacks[thread_id] = self._collapse(frame) if frame is not None else None
+                        if stacks[thread_id] is not None:
+                            self.hot_stacks[stacks[thread_id]] += 1
+                    if samples is not None and stacks[thread_id] is not None:
+                        samples[stacks[thread_id]] += 1
+
+    def _collapse(self, frame: FrameType) -> str:
+        labels: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                self._labels[code] = label
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        return ";".join(labels)
+
+def format_collapsed(samples: Counter, limit: Optional[int] = None) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in samples.most_common(limit))
+
+def _pstats_label(func: Tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+def collapse_profile(profile: cProfile.Profile, min_fraction: float = 1e-4) -> Counter:
+    """
+    Fold a deterministic profile into collapsed stacks weighted by self time
+    in microseconds, the format ``StackSampler`` produces.
+
+    cProfile only keeps caller/callee pairs, so each function's time is split
+    across the paths leading to it in proportion to the time spent on each
+    edge. Paths worth less than ``min_fraction`` of the total are dropped.
+    """
+    stats = pstats.Stats(profile).stats
+    callees: Dict[Tuple, List[Tuple[Tuple, float]]] = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, edge_time) in callers.items():
+            callees.setdefault(caller, []).append((func, edge_time))
+    roots = [func for func, entry in stats.items() if not any(caller in stats for caller in entry[4])]
+    threshold = sum(stats[func][3] for func in roots) * min_fraction
+
+    folded: Counter = Counter()
+    # (function, labels of the path to it, functions on that path, seconds of its time on this path)
+    pending = [(func, (), frozenset(), stats[func][3]) for func in roots]
+    while pending:
+        func, path, on_path, share = pending.pop()
+        _, _, self_time, total_time, _ = stats[func]
+        if share <= threshold or not total_time:
+            continue
+        fraction = share / total_time
+        path = path + (_pstats_label(func),)
+        folded[";".join(path)] += round(self_time * fraction * 1e6)
+        on_path = on_path | {func}
+        for callee, edge_time in callees.get(func, ()):
+            if callee not in on_path:
+                pending.append((callee, path, on_path, edge_time * fraction))
+    return +folded
+
+class RequestProfiler:
+    """
+    Holds the stack sampler and the most recent on-demand request profiles.
+    """
+    def __init__(self, interval: float = 0.005, max_profiles: int = 32):
+        self.sampler = StackSampler(interval)
+        self.max_profiles = max_profiles
+        self._profiles: "OrderedDict[UUID, StoredProfile]" = OrderedDict()
+
+    def store(self, profile: StoredProfile) -> None:
+        self._profiles[profile.id] = profile
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: UUID) -> Optional[StoredProfile]:
+        return self._profiles.get(profile_id)
+
+    def list(self) -> List[StoredProfile]:
+        return list(reversed(self._profiles.values()))
@@ -0,0 +1,173 @@
+# src/infrastructure/repositories/batching_task_repository.py
+import asyncio
+from typing import ContextManager, Dict, Iterable, List, Optional, Sequence, Set
+from uuid import UUID
+from ...domain.entities.task import Task, TaskStatus
+from ...domain.repositories.task_repository import TaskRepository, TaskSnapshot
+
+class BatchingTaskRepository(TaskRepository):
+    """
+    Request-scoped, DataLoader-style wrapper around another TaskRepository.
+
+    ``find_by_id`` calls issued in the same event-loop iteration, e.g. by
+    handlers running under ``asyncio.gather``, are collected and sent as a
+    single ``find_many_by_ids`` call. The first caller of an iteration yields
+    once so the others can join, then loads the batch itself; the others
+    wait on a future each. ``find_many_by_ids`` loads its misses at once.
+    Results are memoized for the lifetime of the wrapper, so create one per
+    request. Writes through the wrapper update the memo; writes made
+    elsewhere are not seen by IDs already loaded.
+
+    Everything other than ``find_by_id`` and ``find_many_by_ids`` is passed
+    straight through.
+    """
+    def __init__(self, inner: TaskRepository, max_batch_size: int = 1000):
+        self.inner = inner
+        self.max_batch_size = max_batch_size
+        # Calls to the inner find_many_by_ids, for observability and benchmarks.
+        self.round_trips = 0
+        # Loaded or written tasks by ID; None records a known miss.
+        self._memo: Dict[UUID, Optional[Task]] = {}
+        # IDs that are queued or being loaded, with the futures of the callers
+        # waiting for them. Each caller has its own future, so cancelling one
+        # caller leaves the others alone.
+        self._waiting: Dict[UUID, List[asyncio.Future]] = {}
+        self._queue: List[UUID] = []
+        # Loads taken over from a cancelled caller; kept so they are not
+        # garbage collected while in flight.
+        self._detached: Set[asyncio.Task] = set()
+
+    async def find_by_id(self, id: UUID) -> Optional[Task]:
+        if id in self._memo:
+            return self._memo[id]
+        if id in self._waiting:
+            return await self._wait_for(id)
+        self._waiting[id] = []
+        self._queue.append(id)
+        if len(self._queue) > 1:
+            # The first caller of this iteration loads the whole batch.
+            return await self._wait_for(id)
+        try:
+            # Let the other callers of this iteration join the batch.
+            await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            ids, self._queue = self._queue, []
+            self._hand_off(ids)
+            raise
+        ids, self._queue = self._queue, []
+        await self._load_all(ids)
+        return self._memo[id]
+
+    async def find_many_by_ids(self, ids: Sequence[UUID]) -> List[Optional[Task]]:
+        missing = [id for id in dict.fromkeys(ids) if id not in self._memo and id not in self._waiting]
+        if missing:
+            for id in missing:
+                self._waiting[id] = []
+            await self._load_all(missing)
+        # Anything still missing is being loaded by another caller.
+        return [self._memo[id] if id in self._memo else await self._wait_for(id) for id in ids]
+
+    async def _wait_for(self, id: UUID) -> Optional[Task]:
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[id].append(future)
+        return await future
+
+    async def _load_all(self, ids: List[UUID]) -> None:
+        try:
+            if len(ids) <= self.max_batch_size:
+                await self._load(ids)
+                return
+            results = await asyncio.gather(
+                *(self._load(ids[start:start + self.max_batch_size])
+                  for start in range(0, len(ids), self.max_batch_size)),
+                return_exceptions=True
+            )
+        except asyncio.CancelledError:
+            self._hand_off(ids)
+            raise
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _load(self, ids: List[UUID]) -> None:
+        self.round_trips += 1
+        try:
+            tasks = await self.inner.find_many_by_ids(ids)
+        except Exception as error:
+            # Nothing is memoized, so a later call retries.
+            for id in ids:
+                for future in self._waiting.pop(id, ()):
+                    if not future.done():
+                        future.set_exception(error)
+            raise
+        for id, task in zip(ids, tasks):
+            # A write through this wrapper while the load was in flight wins.
+            task = self._memo.setdefault(id, task)
+            for future in self._waiting.pop(id, ()):
+                if not future.done():
+                    future.set_result(task)
+
+    def _hand_off(self, ids: List[UUID]) -> None:
+        """Finish loading ``ids`` for their other callers after the loading caller was cancelled."""
+        pending = []
+        for id in ids:
+            if self._waiting.get(id):
+                pending.append(id)
+            else:
+                self._waiting.pop(id, None)
+        if pending:
+            task = asyncio.ensure_future(self._load_detached(pending))
+            self._detached.add(task)
+            task.add_done_callback(self._detached.discard)
+
+    async def _load_detached(self, ids: List[UUID]) -> None:
+        try:
+            await self._load_all(ids)
+        except Exception:
+            pass  # Already delivered to every waiting caller.
+
+    def _prime(self, id: UUID, task: Optional[Task]) -> None:
+        self._memo[id] = task
+
+    async def save(self, task: Task) -> None:
+        await self.inner.save(task)
+        self._prime(task.id, task)
+
+    async def save_many(self, tasks: Iterable[Task]) -> None:
+        tasks = list(tasks)
+        await self.inner.save_many(tasks)
+        for task in tasks:
+            self._prime(task.id, task)
+
+    async def delete(self, id: UUID) -> None:
+        await self.inner.delete(id)
+        self._prime(id, None)
+
+    async def delete_many(self, ids: Iterable[UUID]) -> None:
+        ids = list(ids)
+        await self.inner.delete_many(ids)
+        for id in ids:
+            self._prime(id, None)
+
+    async def find_all(self) -> List[Task]:
+        return await self.inner.find_all()
+
+    async def find_by_assignee(
+        self, user_id: UUID, statuses: Optional[Iterable[TaskStatus]] = None
+    ) -> List[Task]:
+        return await self.inner.find_by_assignee(user_id, statuses)
+
+    async def find_by_status(self, status: TaskStatus) -> List[Task]:
+        return await self.inner.find_by_status(status)
+
+    async def find_page(self, after: Optional[UUID] = None, limit: int = 100) -> List[Task]:
+        return await self.inner.find_page(after, limit)
+
+    async def find_by_id_range(self, start: UUID, end: UUID) -> List[Task]:
+        return await self.inner.find_by_id_range(start, end)
+
+    async def warm_up(self) -> None:
+        await self.inner.warm_up()
+
+    def snapshot(self) -> ContextManager[TaskSnapshot]:
+        return self.inner.snapshot()
@@ -0,0 +1,179 @@
+# src/infrastructure/repositories/cold_segment.py
+"""
+Immutable, compressed task segment files for the cold tier.
+
+Layout (all integers little-endian):
+
+    magic                 8 bytes  b"TFSEG\\x00\\x00\\x01"
+    blocks                zlib-compressed JSON arrays of task records
+    id index              task_count * (16-byte task ID, u32 block number), sorted by ID
+    block table           block_count * (u64 offset, u32 length)
+    footer                u32 task_count, u32 block_count, u64 index offset,
+                          u64 table offset, 8-byte magic
+
+Records inside a block are sorted by ID. Readers memory-map the file and
+binary-search the ID index in place, so an open segment costs a file
+mapping and a small block cache rather than live Task objects.
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+from uuid import UUID
+from ...domain.entities.task import Task, TaskStatus
+from ..serialization.task_codec import datetime_to_micros, micros_to_datetime
+
+MAGIC = b"TFSEG\x00\x00\x01"
+_INDEX_ENTRY = struct.Struct("<16sI")
+_TABLE_ENTRY = struct.Struct("<QI")
+_FOOTER = struct.Struct("<IIQQ8s")
+
+def _to_record(task: Task) -> list:
+    return [
+        task.id.hex,
+        task.title,
+        task.description,
+        task.status.value,
+        task.assigned_to.hex if task.assigned_to is not None else None,
+        datetime_to_micros(task.created_at),
+        datetime_to_micros(task.updated_at),
+        datetime_to_micros(task.due_at) if task.due_at is not None else None,
+    ]
+
+def _from_record(record: list) -> Task:
+    id, title, description, status, assigned_to, created_at, updated_at, due_at = record
+    return Task(
+        id=UUID(hex=id),
+        title=title,
+        description=description,
+        status=TaskStatus(status),
+        assigned_to=UUID(hex=assigned_to) if assigned_to is not None else None,
+        created_at=micros_to_datetime(created_at),
+        updated_at=micros_to_datetime(updated_at),
+        due_at=micros_to_datetime(due_at) if due_at is not None else None,
+    )
+
+def write_segment(path: str, tasks: Iterable[Task], block_size: int = 256, ordered: bool = False) -> int:
+    """
+    Write ``tasks`` to a new segment at ``path`` and return the task count.
+    Pass ``ordered=True`` if ``tasks`` is already sorted by ID; it is then
+    streamed a block at a time instead of being collected and sorted.
+    The file is written under a temporary name and renamed into place, so a
+    segment is either complete or absent.
+    """
+    source = iter(tasks if ordered else sorted(tasks, key=lambda task: task.id))
+    partial = f"{path}.partial"
+    with open(partial, "wb") as out:
+        out.write(MAGIC)
+        table = []
+        index = []
+        number = 0
+        while True:
+            block = list(islice(source, block_size))
+            if not block:
+                break
+            payload = zlib.compress(json.dumps([_to_record(task) for task in block], separators=(",", ":")).encode(), 6)
+            table.append((out.tell(), len(payload)))
+            out.write(payload)
+            index.extend((task.id.bytes, number) for task in block)
+            number += 1
+
+        index_offset = out.tell()
+        for entry in index:
+            out.write(_INDEX_ENTRY.pack(*entry))
+        table_offset = out.tell()
+        for entry in table:
+            out.write(_TABLE_ENTRY.pack(*entry))
+        out.write(_FOOTER.pack(len(index), len(table), index_offset, table_offset, MAGIC))
+        out.flush()
+        os.fsync(out.fileno())
+    os.replace(partial, path)
+    return len(index)
+
+class ColdSegment:
+    def __init__(self, path: str, cached_blocks: int = 8):
+        self.path = path
+        # The mapping holds its own file descriptor, so the file can be closed
+        # right away and an unreferenced segment needs no explicit close.
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        footer = self._map[-_FOOTER.size:]
+        self.task_count, self.block_count, self._index_offset, self._table_offset, magic = _FOOTER.unpack(footer)
+        if magic != MAGIC or self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a task segment")
+        self._cached_blocks = cached_blocks
+        self._blocks: "OrderedDict[int, List[Task]]" = OrderedDict()
+        # ID bounds let callers skip the index for IDs outside the segment,
+        # which is the common case for freshly created tasks.
+        self.min_id = UUID(bytes=self._id_at(0)) if self.task_count else None
+        self.max_id = UUID(bytes=self._id_at(self.task_count - 1)) if self.task_count else None
+
+    def close(self) -> None:
+        self._map.close()
+
+    def _id_at(self, position: int) -> bytes:
+        offset = self._index_offset + position * _INDEX_ENTRY.size
+        return self._map[offset:offset + 16]
+
+    def _block_at(self, position: int) -> int:
+        offset = self._index_offset + position * _INDEX_ENTRY.size
+        return _INDEX_ENTRY.unpack_from(self._map, offset)[1]
+
+    def _bisect(self, id: bytes) -> int:
+        """Position of the first index entry whose ID is >= ``id``."""
+        lo, hi = 0, self.task_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._id_at(mid) < id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _block(self, number: int) -> List[Task]:
+        tasks = self._blocks.get(number)
+        if tasks is not None:
+            self._blocks.move_to_end(number)
+            return tasks
+        offset, length = _TABLE_ENTRY.unpack_from(self._map, self._table_offset + number * _TABLE_ENTRY.size)
+        tasks = [_from_record(record) for record in json.loads(zlib.decompress(self._map[offset:offset + length]))]
+        self._blocks[number] = tasks
+        if len(self._blocks) > self._cached_blocks:
+            self._blocks.popitem(last=False)
+        return tasks
+
+    def contains(self, id: UUID) -> bool:
+        if not self.task_count or id < self.min_id or id > self.max_id:
+            return False
+        position = self._bisect(id.bytes)
+        return position < self.task_count and self._id_at(position) == id.bytes
+
+    def find_by_id(self, id: UUID) -> Optional[Task]:
+        if not self.task_count or id < self.min_id or id > self.max_id:
+            return None
+        position = self._bisect(id.bytes)
+        if position >= self.task_count or self._id_at(position) != id.bytes:
+            return None
+        for task in self._block(self._block_at(position)):
+            if task.id == id:
+                return task
+        return None
+
+    def iter_from(self, start: Optional[UUID] = None) -> Iterator[Task]:
+        """Yield tasks in ID order, starting at the first ID >= ``start``."""
+        position = self._bisect(start.bytes) if start is not None else 0
+        if position >= self.task_count:
+            return
+        first_block = self._block_at(position)
+        for number in range(first_block, self.block_count):
+            for task in self._block(number):
+                if start is None or task.id >= start:
+                    yield task
+
+    def __iter__(self) -> Iterator[Task]:
+        return self.iter_from()
@@ -0,0 +1,90 @@
+# src/infrastructure/repositories/in_memory_task_history_repository.py
+from bisect import bisect_right
+from dataclasses import fields
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+from ...domain.entities.task import Task
+from ...domain.entities.task_history import TaskChange
+from ...domain.repositories.task_history_repository import TaskHistoryRepository
+
+_FIELDS = tuple(field.name for field in fields(Task))
+
+# Field-index/value pairs for the fields one mutation changed.
+Delta = Tuple[Tuple[int, Any], ...]
+
+def _state(task: Task) -> tuple:
+    return tuple(getattr(task, name) for name in _FIELDS)
+
+class _Timeline:
+    """
+    The versions of one task. ``times`` is the version index used to answer
+    time-travel reads by bisection; every ``keyframe_interval``-th version
+    also stores the full task state so a read replays a bounded number of
+    deltas.
+    """
+    __slots__ = ("times", "deltas", "keyframes")
+
+    def __init__(self):
+        self.times: List[datetime] = []
+        self.deltas: List[Delta] = []
+        self.keyframes: List[tuple] = []
+
+class InMemoryTaskHistoryRepository(TaskHistoryRepository):
+    def __init__(self, keyframe_interval: int = 16):
+        self.keyframe_interval = keyframe_interval
+        self._timelines: Dict[UUID, _Timeline] = {}
+
+    async def record(self, previous: Optional[Task], current: Task) -> None:
+        timeline = self._timelines.get(current.id)
+        if timeline is None:
+            timeline = self._timelines[current.id] = _Timeline()
+
+        state = _state(current)
+        if previous is None or not timeline.times:
+            delta = tuple(enumerate(state))
+        else:
+            before = _state(previous)
+            delta = tuple((i, value) for i, value in enumerate(state) if value != before[i])
+            if not delta:
+                return
+
+        # Keep the index sorted even if the wall clock steps backwards.
+        changed_at = current.updated_at
+        if timeline.times and changed_at < timeline.times[-1]:
+            changed_at = timeline.times[-1]
+        if len(timeline.times) % self.keyframe_interval == 0:
+            timeline.keyframes.append(state)
+        timeline.times.append(changed_at)
+        timeline.deltas.append(delta)
+
+    async def find_history(self, task_id: UUID) -> List[TaskChange]:
+        timeline = self._timelines.get(task_id)
+        if timeline is None:
+            return []
+        return [
+            TaskChange(
+                task_id=task_id,
+                version=version,
+                changed_at=changed_at,
+                changes={_FIELDS[i]: value for i, value in delta}
+            )
+            for version, (changed_at, delta) in enumerate(zip(timeline.times, timeline.deltas))
+        ]
+
+    async def find_as_of(self, task_id: UUID, as_of: datetime) -> Optional[Task]:
+        timeline = self._timelines.get(task_id)
+        if timeline is None:
+            return None
+        if as_of.tzinfo is not None:
+            as_of = as_of.astimezone(timezone.utc).replace(tzinfo=None)
+
+        version = bisect_right(timeline.times, as_of) - 1
+        if version < 0:
+            return None
+        keyframe = version // self.keyframe_interval
+        state = list(timeline.keyframes[keyframe])
+        for delta in timeline.deltas[keyframe * self.keyframe_interval + 1:version + 1]:
+            for i, value in delta:
+                state[i] = value
+        return Task(*state)
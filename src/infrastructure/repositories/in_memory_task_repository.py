@@ -1,24 +1,235 @@
 # src/infrastructure/repositories/in_memory_task_repository.py
-from typing import Dict, List, Optional
+import threading
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
-from ...domain.entities.task import Task
-from ...domain.repositories.task_repository import TaskRepository
+from ...domain.entities.task import Task, TaskStatus
+from ...domain.repositories.task_repository import TaskRepository, TaskSnapshot
 
 class InMemoryTaskRepository(TaskRepository):
+    """
+    Multi-version in-memory repository.
+
+    Every write is stamped with a version number. Superseded versions are only
+    retained while an open snapshot may still see them, and are reclaimed as
+    soon as the last snapshot that references them is closed.
+    """
     def __init__(self):
         self.tasks: Dict[UUID, Task] = {}
+        # Sorted ID index. Time-ordered IDs make inserts a plain append.
+        self._ids: List[UUID] = []
+        # Secondary indexes over current tasks.
+        self._by_assignee: Dict[Optional[UUID], Set[UUID]] = {}
+        self._by_status: Dict[TaskStatus, Set[UUID]] = {}
+        self._version = 0
+        # Version of the write that produced the current value of each ID.
+        # Deleted IDs keep their stamp while snapshots are open.
+        self._stamps: Dict[UUID, int] = {}
+        # Superseded (version, task-or-None) pairs per ID, oldest first.
+        self._previous: Dict[UUID, List[Tuple[int, Optional[Task]]]] = {}
+        # Open snapshot versions -> number of snapshots open at that version.
+        self._snapshots: Dict[int, int] = {}
+        # Highest open snapshot version, or -1 when none is open. Versions
+        # only grow, so opening a snapshot just raises it.
+        self._newest_snapshot = -1
+        # IDs deleted while snapshots were open; their stamps are kept so
+        # older snapshots can still resolve them.
+        self._tombstones: Set[UUID] = set()
+        # Serializes writers with each other and with snapshot bookkeeping.
+        # Readers, including snapshot readers, never take it.
+        self._lock = threading.Lock()
+
+    def _write(self, id: UUID, task: Optional[Task]) -> None:
+        with self._lock:
+            self._version += 1
+            stamp = self._stamps.get(id)
+            if stamp is not None and stamp <= self._newest_snapshot:
+                self._previous.setdefault(id, []).append((stamp, self.tasks.get(id)))
+            self._reindex(id, self.tasks.get(id), task)
+            # The stamp is published before the value, so a lock-free snapshot
+            # reader that sees the new value also sees the new stamp.
+            if task is not None:
+                self._stamps[id] = self._version
+                if id not in self.tasks:
+                    if not self._ids or id > self._ids[-1]:
+                        self._ids.append(id)
+                    else:
+                        insort(self._ids, id)
+                self.tasks[id] = task
+            elif self.tasks.pop(id, None) is not None:
+                if self._snapshots:
+                    self._stamps[id] = self._version
+                    self._tombstones.add(id)
+                else:
+                    del self._stamps[id]
+                del self._ids[bisect_left(self._ids, id)]
+
+    @staticmethod
+    def _unindex(index: Dict[Any, Set[UUID]], key: Any, id: UUID) -> None:
+        # Drop emptied sets so users who no longer own tasks do not pile up.
+        ids = index[key]
+        ids.discard(id)
+        if not ids:
+            del index[key]
+
+    def _reindex(self, id: UUID, old: Optional[Task], new: Optional[Task]) -> None:
+        if old is not None and (new is None or new.assigned_to != old.assigned_to):
+            self._unindex(self._by_assignee, old.assigned_to, id)
+        if old is not None and (new is None or new.status != old.status):
+            self._unindex(self._by_status, old.status, id)
+        if new is not None:
+            self._by_assignee.setdefault(new.assigned_to, set()).add(id)
+            self._by_status.setdefault(new.status, set()).add(id)
+
+    def _indexed(self, ids: Optional[Set[UUID]]) -> List[Task]:
+        # Copy the index before sorting; writers may change it meanwhile.
+        tasks = self.tasks
+        return [tasks[id] for id in sorted(list(ids or ())) if id in tasks]
 
     async def save(self, task: Task) -> None:
-        self.tasks[task.id] = task
+        self._write(task.id, task)
+
+    async def save_many(self, tasks: Iterable[Task]) -> None:
+        for task in tasks:
+            self._write(task.id, task)
 
     async def find_by_id(self, id: UUID) -> Optional[Task]:
         return self.tasks.get(id)
 
+    async def find_many_by_ids(self, ids: Sequence[UUID]) -> List[Optional[Task]]:
+        tasks = self.tasks
+        return [tasks.get(id) for id in ids]
+
     async def find_all(self) -> List[Task]:
-        return list(self.tasks.values())
+        return [self.tasks[id] for id in self._ids]
 
-    async def find_by_assignee(self, user_id: UUID) -> List[Task]:
-        return [task for task in self.tasks.values() if task.assigned_to == user_id]
+    async def find_by_assignee(
+        self, user_id: UUID, statuses: Optional[Iterable[TaskStatus]] = None
+    ) -> List[Task]:
+        tasks = self._indexed(self._by_assignee.get(user_id))
+        if statuses is None:
+            return tasks
+        wanted = set(statuses)
+        return [task for task in tasks if task.status in wanted]
+
+    async def find_by_status(self, status: TaskStatus) -> List[Task]:
+        return self._indexed(self._by_status.get(status))
+
+    async def find_page(self, after: Optional[UUID] = None, limit: int = 100) -> List[Task]:
+        start = bisect_right(self._ids, after) if after is not None else 0
+        return [self.tasks[id] for id in self._ids[start:start + limit]]
+
+    async def find_by_id_range(self, start: UUID, end: UUID) -> List[Task]:
+        lo = bisect_left(self._ids, start)
+        hi = bisect_left(self._ids, end, lo)
+        return [self.tasks[id] for id in self._ids[lo:hi]]
 
     async def delete(self, id: UUID) -> None:
-        self.tasks.pop(id, None)
+        self._write(id, None)
+
+    async def warm_up(self) -> None:
+        # Tasks placed directly into ``tasks`` (e.g. fixtures) bypass the ID index.
+        if len(self._ids) != len(self.tasks):
+            with self._lock:
+                self._ids = sorted(self.tasks)
+                self._by_assignee = {}
+                self._by_status = {}
+                for id, task in self.tasks.items():
+                    self._stamps.setdefault(id, self._version)
+                    self._reindex(id, None, task)
+
+    @contextmanager
+    def snapshot(self) -> Iterator[TaskSnapshot]:
+        with self._lock:
+            version = self._version
+            self._snapshots[version] = self._snapshots.get(version, 0) + 1
+            self._newest_snapshot = version
+        try:
+            yield InMemoryTaskSnapshot(self, version)
+        finally:
+            self._release(version)
+
+    def _release(self, version: int) -> None:
+        with self._lock:
+            if self._snapshots[version] > 1:
+                self._snapshots[version] -= 1
+                return
+            del self._snapshots[version]
+            if not self._snapshots:
+                # Only state created while snapshots were open needs
+                # reclaiming, so this is proportional to the writes made
+                # since the oldest snapshot, not to the table size.
+                self._newest_snapshot = -1
+                self._previous = {}
+                self._drop_tombstones(self._tombstones)
+                return
+            if version == self._newest_snapshot:
+                self._newest_snapshot = max(self._snapshots)
+
+            open_versions = sorted(self._snapshots)
+            previous = {}
+            for id, chain in self._previous.items():
+                # An entry stays live while some open snapshot falls between
+                # its own stamp and the stamp of the write that replaced it.
+                successors = [stamp for stamp, _ in chain[1:]] + [self._stamps.get(id, self._version + 1)]
+                live = []
+                for entry, successor in zip(chain, successors):
+                    i = bisect_left(open_versions, entry[0])
+                    if i < len(open_versions) and open_versions[i] < successor:
+                        live.append(entry)
+                if live:
+                    previous[id] = live
+            # Swap rather than mutate so concurrent readers see either map whole.
+            self._previous = previous
+            # A tombstone is only needed while an older version is retained.
+            self._drop_tombstones([id for id in self._tombstones if id not in previous])
+
+    def _drop_tombstones(self, ids: Iterable[UUID]) -> None:
+        for id in list(ids):
+            if id not in self.tasks:
+                self._stamps.pop(id, None)
+            self._tombstones.discard(id)
+
+    def _resolve(self, id: UUID, version: int) -> Optional[Task]:
+        task = self.tasks.get(id)
+        stamp = self._stamps.get(id)
+        if stamp is None:
+            return None
+        if stamp <= version:
+            return task
+        for stamp, previous in reversed(self._previous.get(id, ())):
+            if stamp <= version:
+                return previous
+        return None
+
+class InMemoryTaskSnapshot(TaskSnapshot):
+    def __init__(self, repository: InMemoryTaskRepository, version: int):
+        self._repository = repository
+        self.version = version
+
+    async def find_by_id(self, id: UUID) -> Optional[Task]:
+        return self._repository._resolve(id, self.version)
+
+    async def find_all(self) -> List[Task]:
+        repository = self._repository
+        tasks = []
+        ids = list(repository._ids)
+        for id in ids:
+            task = repository._resolve(id, self.version)
+            if task is not None:
+                tasks.append(task)
+        # Compare against the copied index rather than ``tasks``: an ID
+        # deleted after the copy was taken has already been resolved.
+        seen = set(ids)
+        deleted = [id for id in list(repository._previous) if id not in seen]
+        for id in deleted:
+            task = repository._resolve(id, self.version)
+            if task is not None:
+                tasks.append(task)
+        if deleted:
+            tasks.sort(key=lambda task: task.id)
+        return tasks
+
+    async def find_by_assignee(self, user_id: UUID) -> List[Task]:
+        return [task for task in await self.find_all() if task.assigned_to == user_id]
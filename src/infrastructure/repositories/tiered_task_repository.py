@@ -0,0 +1,395 @@
+# src/infrastructure/repositories/tiered_task_repository.py
+import asyncio
+import heapq
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+from ...domain.entities.task import Task, TaskStatus
+from ...domain.repositories.task_repository import TaskRepository, TaskSnapshot
+from ..logging.logger import ConsoleLogger, Logger
+from .cold_segment import ColdSegment, write_segment
+
+TERMINAL_STATUSES = (TaskStatus.COMPLETED, TaskStatus.CANCELLED)
+
+@dataclass
+class TieringMetrics:
+    runs: int = 0
+    moved: int = 0
+    failed_runs: int = 0
+    compactions: int = 0
+    segments: int = 0
+    shadowed: int = 0
+    last_run_seconds: float = 0.0
+    last_compaction_seconds: float = 0.0
+
+class _ColdTier:
+    """
+    An immutable view of the cold segments.
+
+    A task can be copied to cold storage more than once (moved, updated, then
+    moved again), and a cold task can be updated or deleted through the hot
+    tier. ``shadowed`` maps such IDs to the number of segments that existed
+    at the time, and copies in segments below that watermark are ignored, so
+    at most one cold copy of a task is ever visible.
+    """
+    def __init__(self, segments: Tuple[ColdSegment, ...], shadowed: Dict[UUID, int]):
+        self.segments = segments
+        self.shadowed = shadowed
+
+    def _visible(self, number: int, id: UUID) -> bool:
+        return number >= self.shadowed.get(id, 0)
+
+    def contains(self, id: UUID) -> bool:
+        return any(
+            segment.contains(id) and self._visible(number, id)
+            for number, segment in enumerate(self.segments)
+        )
+
+    def find_by_id(self, id: UUID) -> Optional[Task]:
+        for number in range(len(self.segments) - 1, -1, -1):
+            if self._visible(number, id):
+                task = self.segments[number].find_by_id(id)
+                if task is not None:
+                    return task
+        return None
+
+    def scan(
+        self,
+        start: Optional[UUID] = None,
+        matches: Callable[[Task], bool] = lambda task: True
+    ) -> Iterator[Task]:
+        """Yield visible tasks with ``id >= start`` in ID order."""
+        def visible(number: int, segment: ColdSegment) -> Iterator[Task]:
+            for task in segment.iter_from(start):
+                if self._visible(number, task.id) and matches(task):
+                    yield task
+
+        return heapq.merge(
+            *(visible(number, segment) for number, segment in enumerate(self.segments)),
+            key=lambda task: task.id
+        )
+
+class TieredTaskRepository(TaskRepository):
+    """
+    Keeps active tasks in a hot repository and moves terminal ones to cold
+    storage.
+
+    Tasks that have been COMPLETED or CANCELLED for at least ``cold_after`` are
+    moved by a background task into immutable, zlib-compressed segment files
+    that are memory-mapped and looked up through their sorted ID index, so
+    they no longer cost live objects or slow down scans of the hot tier.
+
+    ``find_by_id`` falls back to the cold tier. Status queries for active
+    statuses never touch it. Updating or deleting a cold task goes through the
+    hot tier as usual and hides the cold copy.
+
+    Every run writes a new segment, and segment ID ranges overlap because IDs
+    follow creation time rather than completion time. Once there are more than
+    ``max_segments`` segments, or more than ``max_shadowed`` hidden copies,
+    the segments are compacted into one that holds only the visible copies,
+    which also empties the shadow map.
+
+    The cold tier lives exactly as long as the hot one: segments are written
+    to a private directory under ``directory`` that ``close()`` removes.
+    """
+    def __init__(
+        self,
+        hot: TaskRepository,
+        directory: Optional[str] = None,
+        cold_after: timedelta = timedelta(days=7),
+        interval: float = 300.0,
+        block_size: int = 256,
+        max_segments: int = 8,
+        max_shadowed: int = 10_000,
+        logger: Optional[Logger] = None
+    ):
+        self.hot = hot
+        self.cold_after = cold_after
+        self.interval = interval
+        self.block_size = block_size
+        self.max_segments = max_segments
+        self.max_shadowed = max_shadowed
+        self.logger = logger or ConsoleLogger()
+        self.metrics = TieringMetrics()
+        self._segment_seq = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix="taskflow-cold-", dir=directory)
+        # Replaced wholesale, never mutated, so snapshots can share it.
+        self._cold = _ColdTier((), {})
+        self._tier_lock = asyncio.Lock()
+        self._tierer: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.hot.start()
+        if self._tierer is None:
+            self._tierer = asyncio.create_task(self._run_tierer())
+
+    async def close(self) -> None:
+        if self._tierer is not None:
+            self._tierer.cancel()
+            try:
+                await self._tierer
+            except asyncio.CancelledError:
+                pass
+            self._tierer = None
+        await self.hot.close()
+        cold, self._cold = self._cold, _ColdTier((), {})
+        for segment in cold.segments:
+            segment.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    async def _run_tierer(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.move_to_cold()
+            except Exception as error:
+                # Nothing is removed from the hot tier before its segment is
+                # published, so a failed run is simply retried next tick.
+                self.metrics.failed_runs += 1
+                self.logger.error("Moving tasks to cold storage failed; will retry", error, {
+                    "segments": len(self._cold.segments)
+                })
+
+    def _segment_path(self) -> str:
+        self._segment_seq += 1
+        return os.path.join(self.directory, f"segment-{self._segment_seq:06d}.seg")
+
+    async def move_to_cold(self, now: Optional[datetime] = None) -> int:
+        """
+        Move terminal tasks last updated before ``now - cold_after`` into a
+        new segment, then compact the cold tier if it needs it. Returns the
+        number of tasks moved.
+        """
+        async with self._tier_lock:
+            started = time.perf_counter()
+            cutoff = (now or datetime.utcnow()) - self.cold_after
+            candidates = [
+                task
+                for status in TERMINAL_STATUSES
+                for task in await self.hot.find_by_status(status)
+                if task.updated_at <= cutoff
+            ]
+            if not candidates:
+                if self._needs_compaction():
+                    await self._compact()
+                return 0
+
+            path = self._segment_path()
+            await asyncio.to_thread(write_segment, path, candidates, self.block_size)
+            segment = ColdSegment(path)
+            # Publish the segment before removing anything from the hot tier,
+            # so every task stays readable throughout the move.
+            self._cold = _ColdTier(self._cold.segments + (segment,), self._cold.shadowed)
+
+            moved = []
+            for task in candidates:
+                # Tasks are immutable, so identity tells whether the task
+                # changed while the segment was being written.
+                if await self.hot.find_by_id(task.id) is task:
+                    moved.append(task.id)
+                else:
+                    self._shadow([task.id])
+            await self.hot.delete_many(moved)
+
+            self.metrics.runs += 1
+            self.metrics.moved += len(moved)
+            self.metrics.last_run_seconds = time.perf_counter() - started
+            if self._needs_compaction():
+                await self._compact()
+            self._update_gauges()
+            return len(moved)
+
+    def _needs_compaction(self) -> bool:
+        cold = self._cold
+        return len(cold.segments) > self.max_segments or len(cold.shadowed) > self.max_shadowed
+
+    async def compact(self) -> None:
+        """
+        Merge every cold segment into one that holds only visible copies,
+        and drop the shadow entries that hid the others.
+        """
+        async with self._tier_lock:
+            await self._compact()
+
+    async def _compact(self) -> None:
+        base = self._cold
+        if not base.segments or (len(base.segments) == 1 and not base.shadowed):
+            return
+        started = time.perf_counter()
+        path = self._segment_path()
+        count = await asyncio.to_thread(
+            _compact_segments, [segment.path for segment in base.segments], base.shadowed, path, self.block_size
+        )
+        segments: Tuple[ColdSegment, ...] = ()
+        if count:
+            segments = (ColdSegment(path),)
+        else:
+            os.remove(path)
+
+        # Writes during the compaction shadowed copies that may now be in the
+        # merged segment; hide those again. Moves cannot run meanwhile (the
+        # tier lock is held), so the segment list itself is unchanged.
+        current = self._cold
+        changed = [id for id, watermark in current.shadowed.items() if base.shadowed.get(id) != watermark]
+        self._cold = _ColdTier(
+            segments,
+            {id: 1 for id in changed if segments and segments[0].contains(id)}
+        )
+        for segment in base.segments:
+            _retire(segment)
+
+        self.metrics.compactions += 1
+        self.metrics.last_compaction_seconds = time.perf_counter() - started
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        self.metrics.segments = len(self._cold.segments)
+        self.metrics.shadowed = len(self._cold.shadowed)
+
+    def _shadow(self, ids: Iterable[UUID]) -> None:
+        cold = self._cold
+        hidden = [id for id in ids if cold.contains(id)]
+        if hidden:
+            watermark = len(cold.segments)
+            self._cold = _ColdTier(cold.segments, {**cold.shadowed, **dict.fromkeys(hidden, watermark)})
+            self.metrics.shadowed = len(self._cold.shadowed)
+
+    async def save(self, task: Task) -> None:
+        await self.hot.save(task)
+        self._shadow([task.id])
+
+    async def save_many(self, tasks: Iterable[Task]) -> None:
+        tasks = list(tasks)
+        await self.hot.save_many(tasks)
+        self._shadow(task.id for task in tasks)
+
+    async def delete(self, id: UUID) -> None:
+        await self.hot.delete(id)
+        self._shadow([id])
+
+    async def delete_many(self, ids: Iterable[UUID]) -> None:
+        ids = list(ids)
+        await self.hot.delete_many(ids)
+        self._shadow(ids)
+
+    async def find_by_id(self, id: UUID) -> Optional[Task]:
+        task = await self.hot.find_by_id(id)
+        if task is None:
+            task = self._cold.find_by_id(id)
+        return task
+
+    async def find_many_by_ids(self, ids: Sequence[UUID]) -> List[Optional[Task]]:
+        tasks = await self.hot.find_many_by_ids(ids)
+        return [task if task is not None else self._cold.find_by_id(id) for id, task in zip(ids, tasks)]
+
+    async def find_all(self) -> List[Task]:
+        return _merge(await self.hot.find_all(), self._cold.scan())
+
+    async def find_by_assignee(
+        self, user_id: UUID, statuses: Optional[Iterable[TaskStatus]] = None
+    ) -> List[Task]:
+        wanted = set(statuses) if statuses is not None else None
+        tasks = await self.hot.find_by_assignee(user_id, wanted)
+        if wanted is not None and not any(status.is_terminal for status in wanted):
+            return tasks
+        return _merge(tasks, self._cold.scan(
+            matches=lambda task: task.assigned_to == user_id and (wanted is None or task.status in wanted)
+        ))
+
+    async def find_by_status(self, status: TaskStatus) -> List[Task]:
+        tasks = await self.hot.find_by_status(status)
+        if not status.is_terminal:
+            return tasks
+        return _merge(tasks, self._cold.scan(matches=lambda task: task.status == status))
+
+    async def find_page(self, after: Optional[UUID] = None, limit: int = 100) -> List[Task]:
+        hot = await self.hot.find_page(after, limit)
+        cold = (task for task in self._cold.scan(after) if after is None or task.id > after)
+        return _merge(hot, cold, limit)
+
+    async def find_by_id_range(self, start: UUID, end: UUID) -> List[Task]:
+        return _merge(await self.hot.find_by_id_range(start, end), self._cold.scan(start), upper=end)
+
+    async def warm_up(self) -> None:
+        await self.hot.warm_up()
+
+    @contextmanager
+    def snapshot(self) -> Iterator[TaskSnapshot]:
+        # The cold tier is captured after the hot snapshot is opened, so a
+        # task moved in between is visible in at least one of them.
+        with self.hot.snapshot() as hot:
+            yield TieredTaskSnapshot(hot, self._cold)
+
+class TieredTaskSnapshot(TaskSnapshot):
+    def __init__(self, hot: TaskSnapshot, cold: _ColdTier):
+        self._hot = hot
+        self._cold = cold
+
+    async def find_by_id(self, id: UUID) -> Optional[Task]:
+        task = await self._hot.find_by_id(id)
+        if task is None:
+            task = self._cold.find_by_id(id)
+        return task
+
+    async def find_all(self) -> List[Task]:
+        return _merge(await self._hot.find_all(), self._cold.scan())
+
+    async def find_by_assignee(self, user_id: UUID) -> List[Task]:
+        return _merge(
+            await self._hot.find_by_assignee(user_id),
+            self._cold.scan(matches=lambda task: task.assigned_to == user_id)
+        )
+
+def _compact_segments(paths: List[str], shadowed: Dict[UUID, int], path: str, block_size: int) -> int:
+    """
+    Write the visible tasks of the segments at ``paths`` to one new segment.
+    Runs in a worker thread, so it opens its own readers rather than sharing
+    the block caches of the segments serving requests.
+    """
+    readers = tuple(ColdSegment(segment_path, cached_blocks=1) for segment_path in paths)
+    try:
+        return write_segment(path, _ColdTier(readers, shadowed).scan(), block_size, ordered=True)
+    finally:
+        for reader in readers:
+            reader.close()
+
+def _retire(segment: ColdSegment) -> None:
+    """
+    Remove a compacted-away segment file. The segment is not closed: open
+    snapshots may still read it, and on POSIX the mapping stays valid after
+    the unlink until the last reference is dropped.
+    """
+    try:
+        os.remove(segment.path)
+    except OSError:
+        # e.g. the file is still mapped on Windows; close() removes it.
+        pass
+
+def _merge(
+    hot: List[Task],
+    cold: Iterator[Task],
+    limit: Optional[int] = None,
+    upper: Optional[UUID] = None
+) -> List[Task]:
+    """
+    Merge an ID-ordered hot result with ID-ordered cold tasks. A task being
+    moved can briefly be in both tiers; the hot copy wins.
+    """
+    hot_ids = {task.id for task in hot}
+    cold = (task for task in cold if task.id not in hot_ids)
+    merged = []
+    for task in heapq.merge(hot, cold, key=lambda task: task.id):
+        if upper is not None and task.id >= upper:
+            break
+        merged.append(task)
+        if limit is not None and len(merged) == limit:
+            break
+    return merged
@@ -0,0 +1,255 @@
+# src/infrastructure/repositories/write_behind_task_repository.py
+import asyncio
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from uuid import UUID
+from ...domain.entities.task import Task, TaskStatus
+from ...domain.repositories.task_repository import TaskRepository, TaskSnapshot
+from ..logging.logger import ConsoleLogger, Logger
+
+@dataclass
+class WriteBehindMetrics:
+    writes: int = 0
+    flushed_writes: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    # Failed flushes since the last successful one; non-zero means buffered
+    # writes are not reaching the inner repository.
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+    last_flush_seconds: float = 0.0
+    max_flush_seconds: float = 0.0
+    total_flush_seconds: float = 0.0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """Fraction of writes absorbed by a later write to the same task."""
+        return 1 - self.flushed_writes / self.writes if self.writes else 0.0
+
+    @property
+    def mean_flush_seconds(self) -> float:
+        return self.total_flush_seconds / self.flushes if self.flushes else 0.0
+
+class WriteBehindTaskRepository(TaskRepository):
+    """
+    Buffers writes in front of another TaskRepository.
+
+    Saves and deletes land in an in-memory buffer keyed by task ID, so a burst
+    of updates to one task costs a single write downstream. The buffer is
+    flushed through ``save_many``/``delete_many`` once it holds ``max_pending``
+    tasks or every ``flush_interval`` seconds, whichever comes first; the
+    interval is the durability window. Reads see buffered writes immediately.
+
+    A failed flush is logged and its batch kept for the next attempt;
+    ``metrics.consecutive_failures`` stays non-zero until a flush succeeds.
+
+    Call ``start()`` to run the periodic flusher and ``close()`` at shutdown;
+    ``close()`` flushes whatever is still buffered.
+    """
+    def __init__(
+        self,
+        inner: TaskRepository,
+        flush_interval: float = 0.05,
+        max_pending: int = 1000,
+        logger: Optional[Logger] = None
+    ):
+        self.inner = inner
+        self.logger = logger or ConsoleLogger()
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.metrics = WriteBehindMetrics()
+        # Buffered writes by task ID; None marks a pending delete.
+        self._dirty: Dict[UUID, Optional[Task]] = {}
+        # The batch currently being written downstream, still visible to reads.
+        self._flushing: Dict[UUID, Optional[Task]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self.inner.start()
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run_flusher())
+
+    async def close(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        try:
+            await self.flush()
+        except Exception as error:
+            self.logger.error(
+                "Write-behind flush failed at shutdown; buffered writes are lost",
+                error,
+                {"pending": len(self._dirty)}
+            )
+            raise
+        finally:
+            await self.inner.close()
+
+    async def _run_flusher(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._try_flush()
+
+    async def _try_flush(self) -> None:
+        try:
+            await self.flush()
+        except Exception as error:
+            # The batch was put back into the buffer; the next flush retries it.
+            self.logger.error("Write-behind flush failed; will retry", error, {
+                "pending": len(self._dirty),
+                "consecutive_failures": self.metrics.consecutive_failures
+            })
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._dirty:
+                return
+            self._flushing, self._dirty = self._dirty, {}
+            saves = [task for task in self._flushing.values() if task is not None]
+            deletes = [id for id, task in self._flushing.items() if task is None]
+            started = time.perf_counter()
+            try:
+                if saves:
+                    await self.inner.save_many(saves)
+                if deletes:
+                    await self.inner.delete_many(deletes)
+            except Exception as error:
+                self.metrics.failed_flushes += 1
+                self.metrics.consecutive_failures += 1
+                self.metrics.last_error = repr(error)
+                # Writes buffered during the failed flush are newer and win.
+                self._dirty = {**self._flushing, **self._dirty}
+                raise
+            finally:
+                self._flushing = {}
+            elapsed = time.perf_counter() - started
+            self.metrics.flushes += 1
+            self.metrics.consecutive_failures = 0
+            self.metrics.flushed_writes += len(saves) + len(deletes)
+            self.metrics.last_flush_seconds = elapsed
+            self.metrics.max_flush_seconds = max(self.metrics.max_flush_seconds, elapsed)
+            self.metrics.total_flush_seconds += elapsed
+
+    async def _buffer(self, id: UUID, task: Optional[Task]) -> None:
+        self.metrics.writes += 1
+        self._dirty.pop(id, None)
+        self._dirty[id] = task
+        if len(self._dirty) >= self.max_pending:
+            # The write is already buffered, so a failed flush is retried
+            # later rather than failing this save.
+            await self._try_flush()
+
+    def _pending(self) -> Dict[UUID, Optional[Task]]:
+        return {**self._flushing, **self._dirty}
+
+    async def save(self, task: Task) -> None:
+        await self._buffer(task.id, task)
+
+    async def save_many(self, tasks: Iterable[Task]) -> None:
+        for task in tasks:
+            await self._buffer(task.id, task)
+
+    async def delete(self, id: UUID) -> None:
+        await self._buffer(id, None)
+
+    async def find_by_id(self, id: UUID) -> Optional[Task]:
+        for pending in (self._dirty, self._flushing):
+            if id in pending:
+                return pending[id]
+        return await self.inner.find_by_id(id)
+
+    async def find_many_by_ids(self, ids: Sequence[UUID]) -> List[Optional[Task]]:
+        pending = self._pending()
+        missing = [id for id in ids if id not in pending]
+        found = dict(zip(missing, await self.inner.find_many_by_ids(missing))) if missing else {}
+        return [pending[id] if id in pending else found[id] for id in ids]
+
+    async def find_all(self) -> List[Task]:
+        return _overlay(await self.inner.find_all(), self._pending())
+
+    async def find_by_assignee(
+        self, user_id: UUID, statuses: Optional[Iterable[TaskStatus]] = None
+    ) -> List[Task]:
+        wanted = set(statuses) if statuses is not None else None
+        return _overlay(
+            await self.inner.find_by_assignee(user_id, wanted),
+            self._pending(),
+            lambda task: task.assigned_to == user_id and (wanted is None or task.status in wanted)
+        )
+
+    async def find_by_status(self, status: TaskStatus) -> List[Task]:
+        return _overlay(
+            await self.inner.find_by_status(status),
+            self._pending(),
+            lambda task: task.status == status
+        )
+
+    async def find_page(self, after: Optional[UUID] = None, limit: int = 100) -> List[Task]:
+        pending = self._pending()
+        # Pending deletes can remove rows from the inner page; over-fetch by
+        # the buffer size so the page can still be filled.
+        tasks = await self.inner.find_page(after, limit + len(pending))
+        upper = tasks[-1].id if len(tasks) == limit + len(pending) else None
+        return _overlay(
+            tasks,
+            pending,
+            lambda task: (after is None or task.id > after) and (upper is None or task.id <= upper)
+        )[:limit]
+
+    async def find_by_id_range(self, start: UUID, end: UUID) -> List[Task]:
+        return _overlay(
+            await self.inner.find_by_id_range(start, end),
+            self._pending(),
+            lambda task: start <= task.id < end
+        )
+
+    async def warm_up(self) -> None:
+        await self.inner.warm_up()
+
+    @contextmanager
+    def snapshot(self) -> Iterator[TaskSnapshot]:
+        with self.inner.snapshot() as inner:
+            yield WriteBehindSnapshot(inner, self._pending())
+
+class WriteBehindSnapshot(TaskSnapshot):
+    def __init__(self, inner: TaskSnapshot, pending: Dict[UUID, Optional[Task]]):
+        self._inner = inner
+        self._pending = pending
+
+    async def find_by_id(self, id: UUID) -> Optional[Task]:
+        if id in self._pending:
+            return self._pending[id]
+        return await self._inner.find_by_id(id)
+
+    async def find_all(self) -> List[Task]:
+        return _overlay(await self._inner.find_all(), self._pending)
+
+    async def find_by_assignee(self, user_id: UUID) -> List[Task]:
+        return _overlay(
+            await self._inner.find_by_assignee(user_id),
+            self._pending,
+            lambda task: task.assigned_to == user_id
+        )
+
+def _overlay(
+    tasks: List[Task],
+    pending: Dict[UUID, Optional[Task]],
+    matches: Callable[[Task], bool] = lambda task: True
+) -> List[Task]:
+    """Apply buffered writes to an ID-ordered query result."""
+    if not pending:
+        return tasks
+    merged = {task.id: task for task in tasks}
+    for id, task in pending.items():
+        if task is not None and matches(task):
+            merged[id] = task
+        else:
+            merged.pop(id, None)
+    return sorted(merged.values(), key=lambda task: task.id)
@@ -0,0 +1,38 @@
+# src/infrastructure/serialization/msgpack_codec.py
+"""
+MessagePack encoding of API payloads for internal clients.
+
+UUIDs travel as 16-byte binaries and timestamps as integer microseconds
+since the unix epoch (UTC), the same conventions as ``task_codec`` records.
+
+msgpack is an optional dependency; ``AVAILABLE`` is False without it and the
+API then only speaks JSON.
+"""
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+from .task_codec import datetime_to_micros
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+MEDIA_TYPE = "application/msgpack"
+MEDIA_TYPES = (MEDIA_TYPE, "application/x-msgpack")
+AVAILABLE = msgpack is not None
+
+def _default(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return value.bytes
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return datetime_to_micros(value)
+    raise TypeError(f"cannot encode {type(value).__name__} as MessagePack")
+
+def packb(value: Any) -> bytes:
+    return msgpack.packb(value, default=_default)
+
+def unpackb(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False)
@@ -0,0 +1,56 @@
+# src/infrastructure/serialization/task_codec.py
+"""
+Compact task records for moving tasks across process boundaries.
+
+A record is a flat tuple of primitives: UUIDs as 16 raw bytes, timestamps as
+integer microseconds since the unix epoch. A chunk is a marshal-encoded list
+of records, which is several times smaller and faster to decode than pickled
+Task objects. Chunks are a transport format only and must not be persisted.
+"""
+import marshal
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+from ...domain.entities.task import Task, TaskStatus
+
+TaskRecord = Tuple[bytes, str, str, str, Optional[bytes], int, int, Optional[int]]
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def datetime_to_micros(value: datetime) -> int:
+    return (value - _UNIX_EPOCH) // _MICROSECOND
+
+def micros_to_datetime(value: int) -> datetime:
+    return _UNIX_EPOCH + timedelta(microseconds=value)
+
+def task_to_record(task: Task) -> TaskRecord:
+    return (
+        task.id.bytes,
+        task.title,
+        task.description,
+        task.status.value,
+        task.assigned_to.bytes if task.assigned_to is not None else None,
+        datetime_to_micros(task.created_at),
+        datetime_to_micros(task.updated_at),
+        datetime_to_micros(task.due_at) if task.due_at is not None else None,
+    )
+
+def task_from_record(record: TaskRecord) -> Task:
+    id, title, description, status, assigned_to, created_at, updated_at, due_at = record
+    return Task(
+        id=UUID(bytes=id),
+        title=title,
+        description=description,
+        status=TaskStatus(status),
+        assigned_to=UUID(bytes=assigned_to) if assigned_to is not None else None,
+        created_at=micros_to_datetime(created_at),
+        updated_at=micros_to_datetime(updated_at),
+        due_at=micros_to_datetime(due_at) if due_at is not None else None,
+    )
+
+def encode_chunk(tasks: Iterable[Task]) -> bytes:
+    return marshal.dumps([task_to_record(task) for task in tasks])
+
+def decode_chunk(chunk: bytes) -> List[TaskRecord]:
+    return marshal.loads(chunk)
@@ -0,0 +1,101 @@
+# src/main.py
+"""
+Application entry point.
+
+``create_app(settings)`` builds the FastAPI application. The module-level
+``app`` used by ``uvicorn src.main:app`` is created on first access, so
+importing this module does not import FastAPI, pydantic or the API models.
+"""
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from .infrastructure.config.settings import Settings
+
+def create_app(settings: Optional["Settings"] = None) -> "FastAPI":
+    """
+    Build the application: routers, error handlers and a lifespan that warms
+    the application up before /readyz reports ready.
+    """
+    import asyncio
+    from contextlib import asynccontextmanager
+    from fastapi import FastAPI
+    from .infrastructure.config.settings import Settings
+    from .infrastructure.api import dependencies
+    from .infrastructure.api.router import router
+    from .infrastructure.api.jobs_router import router as jobs_router
+    from .infrastructure.api.health_router import router as health_router
+    from .infrastructure.api.error_handlers import register_error_handlers
+    from .infrastructure.api.warm_up import warm_up
+    from .infrastructure.logging.logger import ConsoleLogger
+
+    settings = settings or Settings.from_env()
+    dependencies.configure(settings)
+
+    logger = ConsoleLogger()
+
+    async def become_ready(app: FastAPI) -> None:
+        try:
+            if settings.warm_up:
+                await warm_up(app)
+        except Exception as error:
+            # Nothing awaits this task, so record the failure where /readyz
+            # reports it instead of letting it vanish with the task.
+            logger.error("Warm-up failed; the application will not report ready", error)
+            app.state.warm_up_error = f"{type(error).__name__}: {error}"
+            return
+        app.state.ready = True
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        app.state.ready = False
+        app.state.warm_up_error = None
+        await dependencies.start_repository()
+        await dependencies.start_scheduler()
+        # Warm up in the background so /healthz answers while /readyz
+        # still reports 503.
+        warming = asyncio.create_task(become_ready(app))
+        yield
+        app.state.ready = False
+        warming.cancel()
+        await dependencies.shutdown_scheduler()
+        await dependencies.shutdown_job_manager()
+        await dependencies.shutdown_repository()
+
+    app = FastAPI(
+        title=settings.title,
+        description="Task management API built on clean architecture principles",
+        version="1.0.0",
+        lifespan=lifespan
+    )
+    app.include_router(health_router)
+    app.include_router(router)
+    app.include_router(jobs_router)
+    register_error_handlers(app)
+    if settings.profiling_enabled:
+        _install_profiling(app, settings)
+    return app
+
+def _install_profiling(app: "FastAPI", settings: "Settings") -> None:
+    from .infrastructure.api.admin_router import router as admin_router
+    from .infrastructure.profiling.middleware import ProfilingMiddleware
+    from .infrastructure.profiling.profiler import RequestProfiler
+
+    app.state.profiler = RequestProfiler(
+        interval=settings.profile_interval_ms / 1000,
+        max_profiles=settings.max_stored_profiles
+    )
+    app.include_router(admin_router)
+    app.add_middleware(
+        ProfilingMiddleware,
+        profiler=app.state.profiler,
+        admin_token=settings.admin_token,
+        sample_rate=settings.profile_sample_rate
+    )
+
+def __getattr__(name: str):
+    if name == "app":
+        app = create_app()
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,207 @@
+# src/tools/bulk_io.py
+"""
+Streaming bulk import and export of tasks.
+
+Import reads rows in chunks, validates the chunks in parallel on a process
+pool with the same rules as the create-task API, and creates each chunk
+through ``TaskService.create_tasks``, so imported tasks get history and due
+date tracking like tasks created over the API, with one ``save_many`` call
+per chunk. Export pages through the repository by ID, so memory
+use does not grow with the number of tasks.
+"""
+import asyncio
+import csv
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Optional, TextIO, Tuple
+from uuid import UUID
+from pydantic import ValidationError
+from ..domain.entities.task import Task
+from ..domain.repositories.task_repository import TaskRepository
+from ..domain.services.task_service import TaskService
+from ..infrastructure.api.models import CreateTaskRequest
+
+FORMATS = ("jsonl", "csv")
+EXPORT_FIELDS = ("id", "title", "description", "status", "assigned_to", "created_at", "updated_at", "due_at")
+
+# (title, description, assigned_to as 16 bytes or None, due_at or None)
+ValidRow = Tuple[str, str, Optional[bytes], Optional[datetime]]
+# (line number, error message)
+RowError = Tuple[int, str]
+
+@dataclass
+class ImportResult:
+    imported: int = 0
+    rejected: int = 0
+    errors: List[RowError] = field(default_factory=list)
+    seconds: float = 0.0
+
+class Progress:
+    """Reports rows processed and throughput at most once per ``interval`` seconds."""
+
+    def __init__(self, label: str, out: Optional[TextIO] = sys.stderr, interval: float = 1.0):
+        self.label = label
+        self.out = out
+        self.interval = interval
+        self.rows = 0
+        self.started = time.perf_counter()
+        self._reported = self.started
+
+    def update(self, rows: int) -> None:
+        self.rows += rows
+        now = time.perf_counter()
+        if self.out is not None and now - self._reported >= self.interval:
+            self._reported = now
+            self._report(now)
+
+    def finish(self) -> float:
+        now = time.perf_counter()
+        if self.out is not None:
+            self._report(now, final=True)
+        return now - self.started
+
+    def _report(self, now: float, final: bool = False) -> None:
+        elapsed = max(now - self.started, 1e-9)
+        suffix = " done" if final else ""
+        print(
+            f"{self.label}: {self.rows:,} rows in {elapsed:.1f}s ({self.rows / elapsed:,.0f} rows/s){suffix}",
+            file=self.out
+        )
+
+def validate_chunk(first_line: int, rows: List[Any], fmt: str) -> Tuple[List[ValidRow], List[RowError]]:
+    """
+    Validate one chunk of raw rows. Runs in a worker process: JSON Lines rows
+    are unparsed lines, CSV rows are dicts produced by ``csv.DictReader``.
+    """
+    valid: List[ValidRow] = []
+    errors: List[RowError] = []
+    for line, row in enumerate(rows, first_line):
+        try:
+            data = json.loads(row) if fmt == "jsonl" else {
+                key: value for key, value in row.items() if value not in ("", None)
+            }
+            request = CreateTaskRequest.model_validate(data)
+        except ValidationError as error:
+            errors.append((line, "; ".join(
+                f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" for detail in error.errors()
+            )))
+            continue
+        except ValueError as error:
+            errors.append((line, f"invalid JSON: {error}"))
+            continue
+        valid.append((
+            request.title,
+            request.description,
+            request.assigned_to.bytes if request.assigned_to is not None else None,
+            request.due_at
+        ))
+    return valid, errors
+
+def _read_chunks(source: TextIO, fmt: str, chunk_size: int) -> Iterator[Tuple[int, List[Any]]]:
+    if fmt == "jsonl":
+        rows: Iterator[Any] = (line for line in source if line.strip())
+        first_line = 1
+    else:
+        rows = csv.DictReader(source)
+        first_line = 2
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield first_line, chunk
+        first_line += len(chunk)
+
+async def import_tasks(
+    service: TaskService,
+    source: TextIO,
+    fmt: str = "jsonl",
+    chunk_size: int = 10_000,
+    workers: Optional[int] = None,
+    progress: Optional[Progress] = None,
+    max_errors: int = 100
+) -> ImportResult:
+    """
+    Import tasks from ``source``. Invalid rows are skipped and reported;
+    at most ``max_errors`` of them are kept in the result.
+    """
+    result = ImportResult()
+    progress = progress or Progress("import", out=None)
+    loop = asyncio.get_running_loop()
+    executor: Executor = ProcessPoolExecutor(max_workers=workers)
+    window = 2 * (getattr(executor, "_max_workers", None) or 1)
+    in_flight: Deque[asyncio.Future] = deque()
+
+    async def write_oldest() -> None:
+        valid, errors = await in_flight.popleft()
+        tasks = await service.create_tasks(
+            (title, description, UUID(bytes=assigned_to) if assigned_to is not None else None, due_at)
+            for title, description, assigned_to, due_at in valid
+        )
+        result.imported += len(tasks)
+        result.rejected += len(errors)
+        result.errors.extend(errors[:max(0, max_errors - len(result.errors))])
+        progress.update(len(valid) + len(errors))
+
+    try:
+        # Chunks are written in input order, so IDs follow the input order.
+        for first_line, rows in _read_chunks(source, fmt, chunk_size):
+            in_flight.append(loop.run_in_executor(executor, validate_chunk, first_line, rows, fmt))
+            if len(in_flight) >= window:
+                await write_oldest()
+        while in_flight:
+            await write_oldest()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True, cancel_futures=True)
+    result.seconds = progress.finish()
+    return result
+
+def _export_row(task: Task) -> Dict[str, Optional[str]]:
+    return {
+        "id": str(task.id),
+        "title": task.title,
+        "description": task.description,
+        "status": task.status.value,
+        "assigned_to": str(task.assigned_to) if task.assigned_to is not None else None,
+        "created_at": task.created_at.isoformat(),
+        "updated_at": task.updated_at.isoformat(),
+        "due_at": task.due_at.isoformat() if task.due_at is not None else None,
+    }
+
+async def export_tasks(
+    repository: TaskRepository,
+    sink: TextIO,
+    fmt: str = "jsonl",
+    page_size: int = 10_000,
+    progress: Optional[Progress] = None
+) -> int:
+    """
+    Stream every task to ``sink`` in ID (creation) order. Returns the row count.
+    """
+    progress = progress or Progress("export", out=None)
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(sink, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+
+    after: Optional[UUID] = None
+    while True:
+        page = await repository.find_page(after, page_size)
+        if not page:
+            break
+        rows = [_export_row(task) for task in page]
+        if writer is not None:
+            writer.writerows(rows)
+        else:
+            sink.write("".join(json.dumps(row) + "\n" for row in rows))
+        progress.update(len(page))
+        after = page[-1].id
+    progress.finish()
+    return progress.rows
@@ -0,0 +1,106 @@
+# src/tools/tasks.py
+"""
+Bulk import and export of tasks.
+
+Usage:
+    python -m src.tools.tasks --repository mypkg.storage:open_repository import tasks.jsonl
+    python -m src.tools.tasks --repository mypkg.storage:open_repository import tasks.csv --workers 8
+    python -m src.tools.tasks --repository mypkg.storage:open_repository export - > tasks.jsonl
+
+Rows are read and written as JSON Lines (default) or CSV. Imported rows are
+validated like POST /api/v1/tasks/ (title, description, assigned_to) and
+created as new PENDING tasks. ``-`` stands for stdin/stdout.
+
+``--repository module:factory`` names a callable returning the
+TaskRepository to read from or write to. It is required: the API's default
+repository lives in the server process's memory, so a new one built here
+would start empty and be discarded when the command exits.
+"""
+import argparse
+import asyncio
+import importlib
+import sys
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TextIO
+from ..domain.repositories.task_repository import TaskRepository
+from ..domain.services.task_service import TaskService
+from .bulk_io import FORMATS, Progress, export_tasks, import_tasks
+
+def _load_repository(spec: str) -> TaskRepository:
+    module_name, _, attribute = spec.partition(":")
+    factory = getattr(importlib.import_module(module_name), attribute)
+    return factory()
+
+@contextmanager
+def _open(path: str, mode: str) -> Iterator[TextIO]:
+    if path == "-":
+        yield sys.stdin if "r" in mode else sys.stdout
+    else:
+        with open(path, mode, encoding="utf-8", newline="") as stream:
+            yield stream
+
+def _format(args: argparse.Namespace) -> str:
+    if args.format:
+        return args.format
+    return "csv" if args.path.lower().endswith(".csv") else "jsonl"
+
+async def _run_import(args: argparse.Namespace) -> int:
+    repository = _load_repository(args.repository)
+    with _open(args.path, "r") as source:
+        result = await import_tasks(
+            TaskService(repository),
+            source,
+            fmt=_format(args),
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            progress=Progress("import", interval=args.progress_interval)
+        )
+    await repository.close()
+    for line, message in result.errors:
+        print(f"line {line}: {message}", file=sys.stderr)
+    if result.rejected > len(result.errors):
+        print(f"... and {result.rejected - len(result.errors):,} more invalid rows", file=sys.stderr)
+    print(f"imported {result.imported:,} tasks, rejected {result.rejected:,} rows", file=sys.stderr)
+    return 1 if result.rejected else 0
+
+async def _run_export(args: argparse.Namespace) -> int:
+    repository = _load_repository(args.repository)
+    with _open(args.path, "w") as sink:
+        await export_tasks(
+            repository,
+            sink,
+            fmt=_format(args),
+            page_size=args.chunk_size,
+            progress=Progress("export", interval=args.progress_interval)
+        )
+    await repository.close()
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.tools.tasks", description="Bulk import and export of tasks.")
+    parser.add_argument(
+        "--repository",
+        required=True,
+        help="TaskRepository factory as module:callable; must return a persistent store"
+    )
+    parser.add_argument("--progress-interval", type=float, default=1.0, help="Seconds between progress reports")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="Create tasks from a JSON Lines or CSV file")
+    import_parser.add_argument("path", help="Input file, or - for stdin")
+    import_parser.add_argument("--workers", type=int, default=None, help="Validation processes (default: CPU count)")
+    import_parser.set_defaults(handler=_run_import)
+
+    export_parser = commands.add_parser("export", help="Write all tasks to a JSON Lines or CSV file")
+    export_parser.add_argument("path", help="Output file, or - for stdout")
+    export_parser.set_defaults(handler=_run_export)
+
+    for command in (import_parser, export_parser):
+        command.add_argument("--format", choices=FORMATS, help="File format (default: from the file extension)")
+        command.add_argument("--chunk-size", type=int, default=10_000, help="Rows per chunk or page")
+
+    args = parser.parse_args(argv)
+    return asyncio.run(args.handler(args))
+
+if __name__ == "__main__":
+    sys.exit(main())
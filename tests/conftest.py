@@ -29,3 +29,11 @@ async def controller(
 ) -> AsyncGenerator[TaskController, None]:
     controller = TaskController(service, logger)
     yield controller
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+    from src.main import create_app
+    from src.infrastructure.config.settings import Settings
+    with TestClient(create_app(Settings(warm_up=False))) as client:
+        yield client
@@ -0,0 +1,166 @@
+# tests/test_batching_task_repository.py
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+from uuid import UUID, uuid4
+import pytest
+from src.domain.entities.task import Task
+from src.domain.services.overdue_scheduler import OverdueScheduler
+from src.domain.services.task_service import TaskService
+from src.infrastructure.repositories.batching_task_repository import BatchingTaskRepository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+
+class RemoteRepository(InMemoryTaskRepository):
+    """Records every batch and can hold or fail loads."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: List[List[UUID]] = []
+        self.gate: Optional[asyncio.Event] = None
+        self.error: Optional[Exception] = None
+
+    async def find_many_by_ids(self, ids: Sequence[UUID]) -> List[Optional[Task]]:
+        self.batches.append(list(ids))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return await super().find_many_by_ids(ids)
+
+@pytest.fixture
+def remote():
+    return RemoteRepository()
+
+@pytest.fixture
+async def tasks(remote):
+    tasks = [Task.create(f"t{i}", "d") for i in range(10)]
+    await remote.save_many(tasks)
+    return tasks
+
+async def test_concurrent_lookups_share_one_round_trip(remote, tasks):
+    loader = BatchingTaskRepository(remote)
+    ids = [task.id for task in tasks] + [tasks[0].id, uuid4()]
+
+    found = await asyncio.gather(*(loader.find_by_id(id) for id in ids))
+    assert found == tasks + [tasks[0], None]
+    assert loader.round_trips == 1
+    # Duplicates are loaded once.
+    assert remote.batches == [list(dict.fromkeys(ids))]
+
+async def test_batches_are_split_at_max_batch_size(remote, tasks):
+    loader = BatchingTaskRepository(remote, max_batch_size=4)
+    found = await asyncio.gather(*(loader.find_by_id(task.id) for task in tasks))
+    assert found == tasks
+    assert [len(batch) for batch in remote.batches] == [4, 4, 2]
+
+async def test_single_lookup_loads_inline(remote, tasks):
+    loader = BatchingTaskRepository(remote)
+    missing = uuid4()
+    assert await loader.find_by_id(missing) is None
+    assert await loader.find_by_id(tasks[0].id) == tasks[0]
+    assert remote.batches == [[missing], [tasks[0].id]]
+    assert not loader._waiting and not loader._detached
+
+async def test_results_and_misses_are_memoized(remote, tasks):
+    loader = BatchingTaskRepository(remote)
+    missing = uuid4()
+    await asyncio.gather(loader.find_by_id(tasks[0].id), loader.find_by_id(missing))
+    assert await loader.find_by_id(tasks[0].id) == tasks[0]
+    assert await loader.find_by_id(missing) is None
+    assert await loader.find_many_by_ids([missing, tasks[0].id]) == [None, tasks[0]]
+    assert loader.round_trips == 1
+
+async def test_writes_through_the_loader_update_the_memo(remote, tasks):
+    loader = BatchingTaskRepository(remote)
+    await loader.find_by_id(tasks[0].id)
+    renamed = tasks[0].update("renamed", "d")
+    await loader.save(renamed)
+    await loader.delete(tasks[1].id)
+    assert await loader.find_many_by_ids([tasks[0].id, tasks[1].id]) == [renamed, None]
+    assert loader.round_trips == 1
+
+async def test_write_during_load_wins(remote, tasks):
+    loader = BatchingTaskRepository(remote)
+    remote.gate = asyncio.Event()
+    lookup = asyncio.ensure_future(loader.find_by_id(tasks[0].id))
+    await asyncio.sleep(0.01)
+    renamed = tasks[0].update("renamed", "d")
+    await loader.save(renamed)
+    remote.gate.set()
+    assert await lookup == renamed
+
+async def test_many_ids_loads_only_misses_in_one_round_trip(remote, tasks):
+    loader = BatchingTaskRepository(remote)
+    await loader.find_by_id(tasks[0].id)
+    ids = [task.id for task in tasks[:4]] + [tasks[1].id]
+    assert await loader.find_many_by_ids(ids) == tasks[:4] + [tasks[1]]
+    assert remote.batches[1] == [task.id for task in tasks[1:4]]
+    assert loader.round_trips == 2
+
+async def test_many_ids_joins_loads_in_flight(remote, tasks):
+    loader = BatchingTaskRepository(remote)
+    remote.gate = asyncio.Event()
+    single = asyncio.ensure_future(loader.find_by_id(tasks[0].id))
+    await asyncio.sleep(0.01)
+    many = asyncio.ensure_future(loader.find_many_by_ids([tasks[0].id, tasks[1].id]))
+    await asyncio.sleep(0.01)
+    remote.gate.set()
+    assert await many == tasks[:2]
+    assert await single == tasks[0]
+    assert remote.batches == [[tasks[0].id], [tasks[1].id]]
+
+async def test_errors_reach_every_waiter_and_are_not_memoized(remote, tasks):
+    loader = BatchingTaskRepository(remote)
+    remote.error = ConnectionError("store unavailable")
+    ids = [task.id for task in tasks[:3]] + [tasks[0].id]
+
+    results = await asyncio.gather(*(loader.find_by_id(id) for id in ids), return_exceptions=True)
+    assert all(result is remote.error for result in results)
+    assert loader.round_trips == 1
+    with pytest.raises(ConnectionError):
+        await loader.find_many_by_ids([tasks[5].id])
+
+    remote.error = None
+    assert await loader.find_many_by_ids(ids) == tasks[:3] + [tasks[0]]
+    assert not loader._waiting
+
+async def test_cancelled_waiter_leaves_others_alone(remote, tasks):
+    loader = BatchingTaskRepository(remote)
+    remote.gate = asyncio.Event()
+    lookups = [asyncio.ensure_future(loader.find_by_id(tasks[0].id)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    lookups[1].cancel()
+    remote.gate.set()
+    assert await lookups[0] == tasks[0]
+    assert await lookups[2] == tasks[0]
+    assert lookups[1].cancelled()
+
+@pytest.mark.parametrize("delay", [0, 0.01])
+async def test_cancelled_loading_caller_hands_off_the_batch(remote, tasks, delay):
+    loader = BatchingTaskRepository(remote)
+    remote.gate = asyncio.Event()
+    leader = asyncio.ensure_future(loader.find_by_id(tasks[0].id))
+    others = [asyncio.ensure_future(loader.find_by_id(task.id)) for task in tasks[:3]]
+    # Cancelled either before the batch is sent or while it is in flight.
+    await asyncio.sleep(delay)
+    leader.cancel()
+    await asyncio.sleep(0.01)
+    assert len(loader._detached) == 1
+    remote.gate.set()
+    assert await asyncio.gather(*others) == tasks[:3]
+    assert leader.cancelled()
+    await asyncio.sleep(0)
+    assert not loader._detached and not loader._waiting
+
+async def test_overdue_listing_is_one_round_trip(remote, tasks):
+    now = datetime.utcnow()
+    scheduler = OverdueScheduler(clock=lambda: now)
+    overdue = [task.reschedule(now - timedelta(minutes=i + 1)) for i, task in enumerate(tasks[:5])]
+    await remote.save_many(overdue)
+    scheduler.track_all(overdue)
+    await remote.delete(overdue[0].id)
+    loader = BatchingTaskRepository(remote)
+
+    found = await TaskService(loader, scheduler=scheduler).list_overdue_tasks()
+    assert found == overdue[:0:-1]
+    assert loader.round_trips == 1
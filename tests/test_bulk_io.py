@@ -0,0 +1,92 @@
+# tests/test_bulk_io.py
+import csv
+import io
+import json
+from datetime import datetime
+from uuid import uuid4
+import pytest
+from src.domain.entities.task import TaskStatus
+from src.domain.services.overdue_scheduler import OverdueScheduler
+from src.domain.services.task_service import TaskService
+from src.infrastructure.repositories.in_memory_task_history_repository import InMemoryTaskHistoryRepository
+from src.tools.bulk_io import EXPORT_FIELDS, export_tasks, import_tasks, validate_chunk
+from src.tools.tasks import main
+
+def test_validate_chunk_reports_jsonl_errors_by_line():
+    rows = [
+        json.dumps({"title": "ok", "description": "fine"}),
+        "{not json",
+        json.dumps({"description": "no title"}),
+        json.dumps({"title": "", "description": "empty title"}),
+        json.dumps({"title": "bad user", "description": "d", "assigned_to": "nope"}),
+    ]
+
+    valid, errors = validate_chunk(10, rows, "jsonl")
+
+    assert valid == [("ok", "fine", None, None)]
+    assert [line for line, _ in errors] == [11, 12, 13, 14]
+    assert errors[0][1].startswith("invalid JSON")
+    assert errors[1][1].startswith("title:")
+    assert errors[2][1].startswith("title:")
+    assert errors[3][1].startswith("assigned_to:")
+
+def test_validate_chunk_treats_empty_csv_cells_as_missing():
+    user = uuid4()
+    rows = [
+        {"title": "a", "description": "b", "assigned_to": str(user), "due_at": "2024-01-31T17:00:00Z"},
+        {"title": "a", "description": "", "assigned_to": ""},
+    ]
+
+    valid, errors = validate_chunk(2, rows, "csv")
+
+    assert valid == [("a", "b", user.bytes, datetime(2024, 1, 31, 17, 0))]
+    assert [line for line, _ in errors] == [3]
+    assert errors[0][1].startswith("description:")
+
+async def test_import_export_round_trip(repository):
+    history = InMemoryTaskHistoryRepository()
+    scheduler = OverdueScheduler()
+    service = TaskService(repository, history, scheduler)
+    user = uuid4()
+    rows = [
+        {"title": f"Task {i}", "description": f"row {i}",
+         "assigned_to": str(user) if i % 2 else None,
+         "due_at": "2000-01-01T00:00:00" if i == 3 else None}
+        for i in range(25)
+    ]
+    source = io.StringIO("".join(json.dumps(row) + "\n" for row in rows) + '{"title": ""}\n')
+
+    result = await import_tasks(service, source, chunk_size=7, workers=1)
+
+    assert (result.imported, result.rejected) == (25, 1)
+    assert result.errors[0][0] == 26
+
+    sink = io.StringIO()
+    assert await export_tasks(repository, sink, fmt="csv", page_size=4) == 25
+    exported = list(csv.DictReader(io.StringIO(sink.getvalue())))
+    assert tuple(exported[0]) == EXPORT_FIELDS
+    assert [row["title"] for row in exported] == [row["title"] for row in rows]
+    assert all(row["status"] == TaskStatus.PENDING.value for row in exported)
+    assert exported[1]["assigned_to"] == str(user)
+    assert exported[3]["due_at"] == "2000-01-01T00:00:00"
+
+    # Imported tasks went through the service: history and overdue tracking.
+    tasks = await repository.find_all()
+    for task in tasks:
+        assert [change.version for change in await history.find_history(task.id)] == [0]
+    await scheduler.advance()
+    assert scheduler.overdue() == [tasks[3].id]
+
+def test_cli_requires_a_repository(capsys):
+    with pytest.raises(SystemExit) as exit:
+        main(["export", "-"])
+    assert exit.value.code == 2
+    assert "--repository" in capsys.readouterr().err
+
+def test_cli_imports_through_repository_factory(tmp_path, capsys):
+    path = tmp_path / "tasks.jsonl"
+    path.write_text('{"title": "a", "description": "b"}\n{"title": "c", "description": "d"}\n')
+    factory = "src.infrastructure.repositories.in_memory_task_repository:InMemoryTaskRepository"
+
+    assert main(["--repository", factory, "--progress-interval", "60", "import", str(path), "--workers", "1"]) == 0
+    assert "imported 2 tasks, rejected 0 rows" in capsys.readouterr().err
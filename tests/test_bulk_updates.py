@@ -0,0 +1,169 @@
+# tests/test_bulk_updates.py
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+import pytest
+from src.domain.entities.task import TaskStatus
+from src.domain.services import task_service as task_service_module
+from src.domain.services.overdue_scheduler import OverdueScheduler
+from src.domain.services.task_service import TaskService
+from src.infrastructure.repositories.in_memory_task_history_repository import InMemoryTaskHistoryRepository
+
+async def _create(service, count, assigned_to=None, status=None, **kwargs):
+    tasks = []
+    for i in range(count):
+        task = await service.create_task(f"t{i}", "d", assigned_to, **kwargs)
+        if status is not None:
+            task = await service.update_task_status(task.id, status)
+        tasks.append(task)
+    return tasks
+
+async def test_reassign_moves_only_matching_tasks(service, repository):
+    alice, bob = uuid4(), uuid4()
+    pending = await _create(service, 3, alice)
+    done = await _create(service, 2, alice, TaskStatus.COMPLETED)
+
+    moved = await service.reassign_tasks(alice, bob, [TaskStatus.PENDING])
+    assert [task.id for task in moved] == [task.id for task in pending]
+    assert {task.id for task in await repository.find_by_assignee(bob)} == {task.id for task in pending}
+    assert {task.id for task in await repository.find_by_assignee(alice)} == {task.id for task in done}
+
+    moved = await service.reassign_tasks(alice, bob)
+    assert len(moved) == 2
+    assert await repository.find_by_assignee(alice) == []
+    assert await service.reassign_tasks(bob, bob) == []
+
+async def test_transition_filters_by_status_and_assignee(service, repository):
+    alice = uuid4()
+    mine = await _create(service, 2, alice)
+    others = await _create(service, 3)
+    started = await _create(service, 1, alice, TaskStatus.IN_PROGRESS)
+    await _create(service, 1, alice, TaskStatus.COMPLETED)
+
+    moved = await service.transition_tasks([TaskStatus.PENDING], TaskStatus.IN_PROGRESS, assigned_to=alice)
+    assert [task.id for task in moved] == [task.id for task in mine]
+
+    moved = await service.transition_tasks(
+        [TaskStatus.PENDING, TaskStatus.IN_PROGRESS], TaskStatus.CANCELLED
+    )
+    # Sorted by ID across both statuses; completed tasks are left alone.
+    assert [task.id for task in moved] == sorted(task.id for task in mine + others + started)
+    assert len(await repository.find_by_status(TaskStatus.CANCELLED)) == 6
+    assert len(await repository.find_by_status(TaskStatus.COMPLETED)) == 1
+    # Tasks already in the target status are not counted.
+    assert await service.transition_tasks([TaskStatus.CANCELLED], TaskStatus.CANCELLED) == []
+
+async def test_bulk_updates_record_history_and_reschedule(repository, monkeypatch):
+    monkeypatch.setattr(task_service_module, "BULK_CHUNK_SIZE", 2)
+    history = InMemoryTaskHistoryRepository()
+    now = datetime.utcnow()
+    scheduler = OverdueScheduler(clock=lambda: now)
+    service = TaskService(repository, history, scheduler)
+    alice, bob = uuid4(), uuid4()
+    tasks = await _create(service, 5, alice, due_at=now - timedelta(minutes=1))
+    await scheduler.advance()
+    assert len(scheduler.overdue()) == 5
+
+    await service.reassign_tasks(alice, bob)
+    moved = await service.transition_tasks([TaskStatus.PENDING], TaskStatus.COMPLETED, assigned_to=bob)
+    assert len(moved) == 5
+    for task in tasks:
+        assert len(await history.find_history(task.id)) == 3
+    # Completed tasks are no longer tracked as overdue.
+    assert scheduler.overdue() == []
+    assert scheduler.next_due() is None
+
+async def test_bulk_updates_are_saved_in_chunks(service, repository, monkeypatch):
+    monkeypatch.setattr(task_service_module, "BULK_CHUNK_SIZE", 2)
+    alice, bob = uuid4(), uuid4()
+    await _create(service, 5, alice)
+
+    sizes = []
+    async for chunk in service.iter_reassign_tasks(alice, bob):
+        sizes.append(len(chunk))
+        # Each chunk is saved before it is yielded.
+        for task in chunk:
+            assert (await repository.find_by_id(task.id)).assigned_to == bob
+    assert sizes == [2, 2, 1]
+
+async def test_writes_between_chunks_are_not_overwritten(service, repository, monkeypatch):
+    monkeypatch.setattr(task_service_module, "BULK_CHUNK_SIZE", 2)
+    alice, bob, carol = uuid4(), uuid4(), uuid4()
+    tasks = await _create(service, 6, alice)
+
+    chunks = service.iter_reassign_tasks(alice, bob, [TaskStatus.PENDING])
+    first = await anext(chunks)
+    # Other requests run between chunks.
+    edited = await service.update_task(tasks[2].id, title="edited concurrently")
+    await service.update_task_status(tasks[3].id, TaskStatus.COMPLETED)
+    await service.assign_task(tasks[4].id, carol)
+    await repository.delete(tasks[5].id)
+    rest = [task async for chunk in chunks for task in chunk]
+
+    assert [task.id for task in first + rest] == [task.id for task in tasks[:3]]
+    assert [(task.title, task.assigned_to) for task in rest] == [(edited.title, bob)]
+    assert (await repository.find_by_id(tasks[2].id)).title == "edited concurrently"
+    assert (await repository.find_by_id(tasks[3].id)).assigned_to == alice
+    assert (await repository.find_by_id(tasks[4].id)).assigned_to == carol
+    assert await repository.find_by_id(tasks[5].id) is None
+
+async def test_transition_rechecks_status_of_later_chunks(service, repository, monkeypatch):
+    monkeypatch.setattr(task_service_module, "BULK_CHUNK_SIZE", 2)
+    tasks = await _create(service, 4)
+
+    chunks = service.iter_transition_tasks([TaskStatus.PENDING], TaskStatus.IN_PROGRESS)
+    await anext(chunks)
+    await service.update_task_status(tasks[3].id, TaskStatus.COMPLETED)
+    rest = [task async for chunk in chunks for task in chunk]
+
+    assert [task.id for task in rest] == [tasks[2].id]
+    assert (await repository.find_by_id(tasks[3].id)).status == TaskStatus.COMPLETED
+
+async def test_emptied_index_entries_are_dropped(service, repository):
+    alice, bob = uuid4(), uuid4()
+    await _create(service, 3, alice)
+    await service.reassign_tasks(alice, bob)
+    assert alice not in repository._by_assignee
+    await service.transition_tasks([TaskStatus.PENDING], TaskStatus.COMPLETED)
+    assert TaskStatus.PENDING not in repository._by_status
+    assert set(repository._by_status) == {TaskStatus.COMPLETED}
+
+def _create_via_api(client, count, assigned_to):
+    return [
+        client.post("/api/v1/tasks/", json={"title": f"t{i}", "description": "d", "assigned_to": assigned_to}).json()
+        for i in range(count)
+    ]
+
+def test_api_reports_affected_counts(client):
+    alice, bob = str(uuid4()), str(uuid4())
+    _create_via_api(client, 3, alice)
+
+    response = client.post("/api/v1/tasks:reassign", json={"from_user": alice, "to_user": bob})
+    assert response.status_code == 200
+    assert response.json()["affected"] == 3
+    response = client.post(
+        "/api/v1/tasks:transition",
+        json={"statuses": ["PENDING"], "to_status": "COMPLETED", "assigned_to": bob}
+    )
+    assert response.json()["affected"] == 3
+    assert {task["status"] for task in client.get(f"/api/v1/tasks/?assigned_to={bob}").json()} == {"COMPLETED"}
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 500])
+def test_api_streams_affected_ids(client, monkeypatch, chunk_size):
+    monkeypatch.setattr(task_service_module, "BULK_CHUNK_SIZE", chunk_size)
+    alice, bob = str(uuid4()), str(uuid4())
+    created = _create_via_api(client, 4, alice)
+
+    response = client.post("/api/v1/tasks:reassign?stream=true", json={"from_user": alice, "to_user": bob})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[:-1] == [{"id": task["id"]} for task in created]
+    assert lines[-1] == {"affected": 4}
+
+def test_api_stream_with_nothing_to_do(client):
+    response = client.post(
+        "/api/v1/tasks:transition?stream=true",
+        json={"statuses": ["PENDING"], "to_status": "COMPLETED", "assigned_to": str(uuid4())}
+    )
+    assert response.text == '{"affected": 0}\n'
@@ -0,0 +1,81 @@
+# tests/test_error_handling.py
+import logging
+from uuid import uuid4
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.infrastructure.api.error_handlers import (
+    JobNotFoundError,
+    TaskNotFoundError,
+    ValidationError,
+    register_error_handlers
+)
+
+async def test_service_reports_missing_task_as_none(service):
+    assert await service.get_task(uuid4()) is None
+    assert await service.assign_task(uuid4(), uuid4()) is None
+    assert await service.update_task(uuid4(), title="x") is None
+
+async def test_controller_miss_is_not_logged_as_error(controller, caplog):
+    with caplog.at_level(logging.DEBUG):
+        assert await controller.get_task(uuid4()) is None
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+    assert any(record.getMessage() == "Task not found" for record in caplog.records)
+
+@pytest.mark.parametrize("method, path", [
+    ("get", "/api/v1/tasks/{id}"),
+    ("get", "/api/v1/tasks/{id}/history"),
+    ("patch", "/api/v1/tasks/{id}"),
+    ("post", "/api/v1/tasks/{id}/assign/" + str(uuid4())),
+    ("post", "/api/v1/tasks/{id}/status/COMPLETED"),
+])
+def test_unknown_task_is_404(client, method, path):
+    kwargs = {"json": {"title": "x"}} if method == "patch" else {}
+    response = getattr(client, method)(path.format(id=uuid4()), **kwargs)
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Task not found", "type": "task_not_found", "status": 404}
+
+def test_existing_task_is_found(client):
+    task = client.post("/api/v1/tasks/", json={"title": "t", "description": "d"}).json()
+    response = client.get(f"/api/v1/tasks/{task['id']}")
+    assert response.status_code == 200
+    assert response.json()["id"] == task["id"]
+
+def test_unknown_job_is_404(client):
+    response = client.get(f"/api/v1/jobs/{uuid4()}")
+    assert response.status_code == 404
+    assert response.json()["type"] == "job_not_found"
+
+def test_validation_error_is_422(client):
+    response = client.get("/api/v1/tasks/", params={"ids": "not-a-uuid"})
+    assert response.status_code == 422
+    assert response.json()["type"] == "validation_error"
+
+def test_registered_handlers_shape_responses():
+    app = FastAPI()
+    register_error_handlers(app)
+
+    @app.get("/task")
+    async def task():
+        raise TaskNotFoundError(uuid4())
+
+    @app.get("/job")
+    async def job():
+        raise JobNotFoundError(uuid4())
+
+    @app.get("/invalid")
+    async def invalid():
+        raise ValidationError("bad input")
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("secret detail")
+
+    client = TestClient(app, raise_server_exceptions=False)
+    assert client.get("/task").status_code == 404
+    assert client.get("/job").status_code == 404
+    assert client.get("/invalid").json() == {"detail": "bad input", "type": "validation_error", "status": 422}
+    response = client.get("/boom")
+    assert response.status_code == 500
+    assert response.json()["type"] == "internal_server_error"
+    assert "secret detail" not in response.text
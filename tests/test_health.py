@@ -0,0 +1,54 @@
+# tests/test_health.py
+import asyncio
+import logging
+import threading
+import time
+from fastapi.testclient import TestClient
+from src.infrastructure.api import warm_up as warm_up_module
+from src.infrastructure.config.settings import Settings
+from src.main import create_app
+
+def _wait_for(client, status_code, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        response = client.get("/readyz")
+        if response.status_code == status_code or time.monotonic() > deadline:
+            return response
+        time.sleep(0.01)
+
+def test_readyz_turns_ready_after_warm_up_while_healthz_is_always_ok(monkeypatch):
+    gate = threading.Event()
+    real_warm_up = warm_up_module.warm_up
+
+    async def gated_warm_up(app):
+        await asyncio.to_thread(gate.wait, 5)
+        await real_warm_up(app)
+
+    monkeypatch.setattr(warm_up_module, "warm_up", gated_warm_up)
+    app = create_app(Settings(warm_up=True))
+    with TestClient(app) as client:
+        assert client.get("/healthz").json() == {"status": "ok"}
+        response = client.get("/readyz")
+        assert response.status_code == 503
+        assert response.json() == {"status": "not_ready"}
+
+        gate.set()
+        response = _wait_for(client, 200)
+        assert response.json() == {"status": "ready"}
+        assert app.openapi_schema is not None
+    assert app.state.ready is False
+
+def test_failed_warm_up_is_logged_and_reported(monkeypatch, caplog):
+    async def failing_warm_up(app):
+        raise RuntimeError("index build failed")
+
+    monkeypatch.setattr(warm_up_module, "warm_up", failing_warm_up)
+    with caplog.at_level(logging.ERROR), TestClient(create_app(Settings(warm_up=True))) as client:
+        response = _wait_for(client, 200, timeout=0.2)
+        assert response.status_code == 503
+        assert response.json() == {"status": "failed", "detail": "RuntimeError: index build failed"}
+        assert client.get("/healthz").status_code == 200
+    assert any("Warm-up failed" in record.getMessage() for record in caplog.records)
+
+def test_ready_without_warm_up(client):
+    assert _wait_for(client, 200).json() == {"status": "ready"}
@@ -0,0 +1,37 @@
+# tests/test_identifiers.py
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from src.domain.entities.identifiers import UUID7Generator, uuid7, uuid7_min, uuid7_timestamp
+
+def test_uuid7_is_version_7_with_rfc_variant():
+    id = uuid7()
+    assert id.version == 7
+    assert id.variant == "specified in RFC 4122"
+
+def test_uuid7_is_strictly_increasing():
+    ids = [uuid7() for _ in range(10_000)]
+    assert all(a < b for a, b in zip(ids, ids[1:]))
+
+def test_uuid7_stays_monotonic_when_clock_steps_backwards():
+    generate = UUID7Generator()
+    with patch("time.time_ns", return_value=2_000_000_000_000_000_000):
+        first = generate()
+    with patch("time.time_ns", return_value=1_000_000_000_000_000_000):
+        second = generate()
+    assert second > first
+
+def test_uuid7_counter_overflow_rolls_into_next_millisecond():
+    generate = UUID7Generator()
+    with patch("time.time_ns", return_value=1_700_000_000_000_000_000):
+        ids = [generate() for _ in range(5000)]
+    assert all(a < b for a, b in zip(ids, ids[1:]))
+    assert uuid7_timestamp(ids[-1]) > uuid7_timestamp(ids[0])
+
+def test_uuid7_orders_by_creation_time():
+    moment = datetime(2024, 1, 16, 10, 0, 0)
+    generate = UUID7Generator()
+    nanos = int((moment - datetime(1970, 1, 1)).total_seconds()) * 1_000_000_000
+    with patch("time.time_ns", return_value=nanos):
+        id = generate()
+    assert uuid7_timestamp(id) == moment
+    assert uuid7_min(moment) <= id < uuid7_min(moment + timedelta(milliseconds=1))
@@ -0,0 +1,85 @@
+# tests/test_in_memory_task_repository.py
+import threading
+from src.domain.entities.task import Task, TaskStatus
+
+async def _seed(repository, count):
+    tasks = [Task.create(f"Task {i}", "seed") for i in range(count)]
+    await repository.save_many(tasks)
+    return tasks
+
+def _start_writers(repository, tasks, threads=4):
+    def writer(part):
+        for task in part:
+            repository._write(task.id, task.update_status(TaskStatus.COMPLETED))
+            repository._write(task.id, None)
+            created = Task.create("late", "added during the snapshot")
+            repository._write(created.id, created)
+
+    workers = [threading.Thread(target=writer, args=(tasks[i::threads],)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    return workers
+
+async def test_snapshot_is_isolated_from_concurrent_writes(repository):
+    tasks = await _seed(repository, 400)
+
+    with repository.snapshot() as snapshot:
+        workers = _start_writers(repository, tasks)
+        while any(worker.is_alive() for worker in workers):
+            assert await snapshot.find_all() == tasks
+        for worker in workers:
+            worker.join()
+
+        assert await snapshot.find_all() == tasks
+        for task in tasks:
+            assert await snapshot.find_by_id(task.id) == task
+        assert len(await repository.find_all()) == len(tasks)
+        assert all(task.title == "late" for task in await repository.find_all())
+
+async def test_closing_last_snapshot_reclaims_versions_and_tombstones(repository):
+    tasks = await _seed(repository, 100)
+
+    with repository.snapshot():
+        for task in tasks[:50]:
+            await repository.save(task.update_status(TaskStatus.IN_PROGRESS))
+        await repository.delete_many(task.id for task in tasks[50:])
+        assert repository._previous
+        assert repository._tombstones
+
+    assert repository._previous == {}
+    assert repository._tombstones == set()
+    assert set(repository._stamps) == set(repository.tasks)
+    assert repository._newest_snapshot == -1
+
+async def test_writes_after_snapshot_close_are_not_retained(repository):
+    first, = await _seed(repository, 1)
+    await repository.save(first.update_status(TaskStatus.IN_PROGRESS))
+    assert repository._previous == {}
+
+async def test_newest_snapshot_tracks_open_snapshots(repository):
+    old, = await _seed(repository, 1)
+    with repository.snapshot() as older:
+        new = Task.create("new", "created after the first snapshot")
+        await repository.save(new)
+        with repository.snapshot() as newer:
+            await repository.delete(old.id)
+            assert await newer.find_by_id(old.id) == old
+        # Only the older snapshot remains, and it cannot see ``new``, so
+        # superseding ``new`` retains nothing.
+        await repository.save(new.update_status(TaskStatus.COMPLETED))
+        assert new.id not in repository._previous
+        assert await older.find_by_id(old.id) == old
+        assert await older.find_by_id(new.id) is None
+        assert await older.find_all() == [old]
+
+    assert repository._previous == {}
+    assert set(repository._stamps) == {new.id}
+
+async def test_deleted_then_recreated_task_keeps_its_stamp(repository):
+    task, = await _seed(repository, 1)
+    with repository.snapshot() as snapshot:
+        await repository.delete(task.id)
+        await repository.save(task)
+        assert await snapshot.find_by_id(task.id) == task
+    assert await repository.find_by_id(task.id) == task
+    assert set(repository._stamps) == {task.id}
@@ -0,0 +1,187 @@
+# tests/test_job_manager.py
+import asyncio
+import threading
+import pytest
+from src.domain.entities.task import Task, TaskStatus
+from src.infrastructure.jobs.builtin_jobs import register_builtin_jobs
+from src.infrastructure.jobs.job_manager import (
+    ExecutorKind,
+    JobDefinition,
+    JobManager,
+    JobQueueFullError,
+    JobStatus,
+    UnknownJobError
+)
+from src.infrastructure.serialization.task_codec import decode_chunk
+
+def _counting_job(gate=None):
+    def count_chunk(chunk, params):
+        if gate is not None:
+            gate.acquire()
+        return len(decode_chunk(chunk))
+
+    return JobDefinition(
+        map_chunk=count_chunk,
+        combine=lambda total, part: total + part,
+        initial=lambda: 0,
+        finalize=lambda total, job: {"rows": total},
+        executor=ExecutorKind.THREAD
+    )
+
+async def _until(condition, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+@pytest.fixture
+async def manager(repository):
+    await repository.save_many(Task.create(f"Task {i}", "job") for i in range(50))
+    manager = JobManager(repository, max_workers=1, max_concurrent_jobs=1, max_queued=2, chunk_size=10)
+    yield manager
+    await manager.shutdown()
+
+async def test_submitted_job_runs_to_completion(manager):
+    manager.register("count", _counting_job())
+
+    job = manager.submit("count")
+    assert job.status == JobStatus.QUEUED
+    await _until(lambda: job.finished_at is not None)
+
+    assert job.status == JobStatus.COMPLETED
+    assert job.result == {"rows": 50}
+    assert (job.processed, job.total, job.progress) == (50, 50, 1.0)
+    assert manager.get(job.id) is job
+
+async def test_unknown_job_name_is_rejected(manager):
+    with pytest.raises(UnknownJobError):
+        manager.submit("missing")
+
+async def test_progress_is_reported_per_chunk(manager):
+    gate = threading.Semaphore(0)
+    manager.register("count", _counting_job(gate))
+    job = manager.submit("count")
+
+    await _until(lambda: job.status == JobStatus.RUNNING and job.total == 50)
+    assert job.progress == 0.0
+    gate.release()
+    await _until(lambda: job.processed == 10)
+    assert job.progress == pytest.approx(0.2)
+    for _ in range(4):
+        gate.release()
+    await _until(lambda: job.finished_at is not None)
+    assert job.progress == 1.0
+
+async def test_cancel_stops_a_running_job(manager):
+    gate = threading.Semaphore(0)
+    manager.register("count", _counting_job(gate))
+    job = manager.submit("count")
+    await _until(lambda: job.status == JobStatus.RUNNING)
+
+    assert manager.cancel(job.id) is job
+    await _until(lambda: job.finished_at is not None)
+    for _ in range(5):
+        gate.release()
+
+    assert job.status == JobStatus.CANCELLED
+    assert job.processed < job.total
+
+async def test_queued_job_can_be_cancelled_before_it_starts(manager):
+    gate = threading.Semaphore(0)
+    manager.register("count", _counting_job(gate))
+    running = manager.submit("count")
+    queued = manager.submit("count")
+    await _until(lambda: running.status == JobStatus.RUNNING)
+
+    manager.cancel(queued.id)
+    await _until(lambda: queued.finished_at is not None)
+    assert queued.status == JobStatus.CANCELLED
+    assert queued.started_at is None
+    for _ in range(5):
+        gate.release()
+    await _until(lambda: running.finished_at is not None)
+    assert running.status == JobStatus.COMPLETED
+
+async def test_job_cancelled_right_after_submit_frees_its_slot(manager):
+    manager.register("count", _counting_job())
+    jobs = [manager.submit("count"), manager.submit("count")]
+    for job in jobs:
+        manager.cancel(job.id)
+    await asyncio.sleep(0.01)
+
+    assert [job.status for job in jobs] == [JobStatus.CANCELLED, JobStatus.CANCELLED]
+    assert all(job.finished_at is not None and job.started_at is None for job in jobs)
+    assert not manager._running
+    job = manager.submit("count")
+    await _until(lambda: job.finished_at is not None)
+    assert job.status == JobStatus.COMPLETED
+
+async def test_shutdown_cancels_jobs_that_never_started(repository):
+    manager = JobManager(repository, max_concurrent_jobs=1)
+    manager.register("count", _counting_job())
+    job = manager.submit("count")
+    await manager.shutdown()
+    assert job.status == JobStatus.CANCELLED
+    assert not manager._running
+
+async def test_submit_is_rejected_when_queue_is_full(manager):
+    gate = threading.Semaphore(0)
+    manager.register("count", _counting_job(gate))
+    jobs = [manager.submit("count"), manager.submit("count")]
+
+    with pytest.raises(JobQueueFullError):
+        manager.submit("count")
+
+    for _ in range(10):
+        gate.release()
+    await _until(lambda: all(job.finished_at is not None for job in jobs))
+    job = manager.submit("count")
+    assert job.status == JobStatus.QUEUED
+    for _ in range(5):
+        gate.release()
+    await _until(lambda: job.finished_at is not None)
+
+async def test_failed_chunk_marks_job_failed(manager):
+    def fail(chunk, params):
+        raise RuntimeError("chunk failed")
+
+    manager.register("fail", JobDefinition(
+        map_chunk=fail, combine=lambda a, b: a, initial=lambda: None,
+        finalize=lambda total, job: {}, executor=ExecutorKind.THREAD
+    ))
+    job = manager.submit("fail")
+    await _until(lambda: job.finished_at is not None)
+    assert job.status == JobStatus.FAILED
+    assert job.error == "chunk failed"
+
+async def test_builtin_stats_job_counts_by_status(repository):
+    tasks = [Task.create(f"Task {i}", "job") for i in range(30)]
+    await repository.save_many(tasks)
+    await repository.save(tasks[0].update_status(TaskStatus.COMPLETED))
+    manager = JobManager(repository, max_workers=1, chunk_size=7)
+    register_builtin_jobs(manager)
+    try:
+        job = manager.submit("stats")
+        await _until(lambda: job.finished_at is not None, timeout=30)
+    finally:
+        await manager.shutdown()
+    assert job.status == JobStatus.COMPLETED
+    assert job.result["total"] == 30
+    assert job.result["by_status"] == {"PENDING": 29, "COMPLETED": 1}
+    assert job.result["unassigned"] == 30
+
+def test_full_queue_is_429(client):
+    from src.infrastructure.api import dependencies
+    manager = dependencies.job_manager()
+    gate = threading.Semaphore(0)
+    manager.register("block", _counting_job(gate))
+    manager.max_queued = 1
+    client.post("/api/v1/tasks/", json={"title": "t", "description": "d"})
+    try:
+        assert client.post("/api/v1/jobs", json={"name": "block"}).status_code == 202
+        response = client.post("/api/v1/jobs", json={"name": "block"})
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "5"
+        assert response.json()["type"] == "job_queue_full"
+    finally:
+        gate.release()
@@ -0,0 +1,89 @@
+# tests/test_negotiation.py
+from datetime import datetime
+from uuid import UUID, uuid4
+import msgpack
+import pytest
+from src.infrastructure.serialization import msgpack_codec
+from src.infrastructure.serialization.task_codec import datetime_to_micros
+
+MSGPACK = "application/msgpack"
+
+def _post_msgpack(client, payload, **headers):
+    return client.post(
+        "/api/v1/tasks/",
+        content=msgpack.packb(payload),
+        headers={"content-type": MSGPACK, **headers}
+    )
+
+def test_msgpack_request_body_is_decoded(client):
+    assignee = uuid4()
+    due_at = datetime(2024, 1, 31, 17, 0, 0)
+    response = _post_msgpack(client, {
+        "title": "t",
+        "description": "d",
+        "assigned_to": assignee.bytes,
+        "due_at": datetime_to_micros(due_at)
+    })
+    assert response.status_code == 201
+    task = response.json()
+    assert task["title"] == "t"
+    assert task["assigned_to"] == str(assignee)
+    assert task["due_at"].startswith("2024-01-31T17:00:00")
+
+def test_msgpack_body_is_validated(client):
+    response = _post_msgpack(client, {"title": "", "description": "d"})
+    assert response.status_code == 422
+
+def test_undecodable_msgpack_is_422(client):
+    response = client.post("/api/v1/tasks/", content=b"\xc1", headers={"content-type": MSGPACK})
+    assert response.status_code == 422
+    assert "MessagePack decode error" in response.text
+
+@pytest.mark.parametrize("accept, msgpack_wanted", [
+    (None, False),
+    ("application/json", False),
+    ("*/*", False),
+    (MSGPACK, True),
+    ("application/x-msgpack", True),
+    (f"{MSGPACK}, application/json", True),
+    (f"application/json, {MSGPACK}", False),
+    (f"application/json;q=0.5, {MSGPACK}", True),
+    (f"{MSGPACK};q=0, application/json", False),
+])
+def test_response_follows_accept(client, accept, msgpack_wanted):
+    created = client.post("/api/v1/tasks/", json={"title": "t", "description": "d"}).json()
+    headers = {"accept": accept} if accept else {}
+    response = client.get(f"/api/v1/tasks/{created['id']}", headers=headers)
+    assert response.status_code == 200
+    if msgpack_wanted:
+        assert response.headers["content-type"] == MSGPACK
+        task = msgpack.unpackb(response.content)
+        assert UUID(bytes=task["id"]) == UUID(created["id"])
+        assert isinstance(task["created_at"], int)
+    else:
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["id"] == created["id"]
+
+def test_msgpack_list_response(client):
+    for i in range(3):
+        client.post("/api/v1/tasks/", json={"title": f"t{i}", "description": "d"})
+    response = client.get("/api/v1/tasks/", headers={"accept": MSGPACK})
+    assert [task["title"] for task in msgpack.unpackb(response.content)] == ["t0", "t1", "t2"]
+
+def test_msgpack_body_without_msgpack_is_415(client, monkeypatch):
+    monkeypatch.setattr(msgpack_codec, "AVAILABLE", False)
+    response = _post_msgpack(client, {"title": "t", "description": "d"})
+    assert response.status_code == 415
+
+@pytest.mark.parametrize("accept, status", [
+    (MSGPACK, 406),
+    (f"{MSGPACK}, application/json;q=0", 406),
+    (f"{MSGPACK}, application/json;q=0.1", 200),
+    (f"{MSGPACK}, */*;q=0.1", 200),
+])
+def test_msgpack_only_accept_without_msgpack_is_406(client, monkeypatch, accept, status):
+    created = client.post("/api/v1/tasks/", json={"title": "t", "description": "d"}).json()
+    monkeypatch.setattr(msgpack_codec, "AVAILABLE", False)
+    response = client.get(f"/api/v1/tasks/{created['id']}", headers={"accept": accept})
+    assert response.status_code == status
+    assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,130 @@
+# tests/test_overdue_scheduler.py
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from src.domain.entities.task import Task, TaskStatus
+from src.domain.entities.task_events import TaskOverdue
+from src.domain.services.overdue_scheduler import OverdueScheduler
+from src.domain.services.task_service import TaskService
+from src.infrastructure.events.in_memory_event_publisher import InMemoryEventPublisher
+
+NOW = datetime(2024, 1, 16, 12, 0, 0)
+
+class Clock:
+    def __init__(self, now=NOW):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+@pytest.fixture
+def publisher():
+    return InMemoryEventPublisher()
+
+@pytest.fixture
+def scheduler(publisher, clock):
+    return OverdueScheduler(publisher, clock)
+
+@pytest.fixture
+def scheduled_service(repository, scheduler):
+    return TaskService(repository, scheduler=scheduler)
+
+async def test_overdue_event_fires_once(scheduled_service, scheduler, publisher, clock):
+    task = await scheduled_service.create_task("t", "d", due_at=NOW + timedelta(minutes=5))
+
+    assert await scheduler.advance() == []
+    clock.now = NOW + timedelta(minutes=5)
+    events = await scheduler.advance()
+    assert events == [TaskOverdue(task_id=task.id, due_at=task.due_at, detected_at=clock.now)]
+    assert scheduler.overdue() == [task.id]
+
+    clock.now += timedelta(hours=1)
+    assert await scheduler.advance() == []
+    # An unrelated update keeps the deadline, so it does not fire again.
+    await scheduled_service.update_task(task.id, title="renamed")
+    assert await scheduler.advance() == []
+    assert list(publisher.recent) == events
+
+async def test_reschedule_moves_the_deadline(scheduled_service, scheduler, clock):
+    task = await scheduled_service.create_task("t", "d", due_at=NOW + timedelta(minutes=5))
+    await scheduled_service.update_task(task.id, due_at=NOW + timedelta(hours=1))
+
+    clock.now = NOW + timedelta(minutes=30)
+    assert await scheduler.advance() == []
+    assert scheduler.next_due() == NOW + timedelta(hours=1)
+
+    clock.now = NOW + timedelta(hours=1)
+    assert [event.task_id for event in await scheduler.advance()] == [task.id]
+
+async def test_rescheduling_an_overdue_task_clears_it(scheduled_service, scheduler, clock):
+    task = await scheduled_service.create_task("t", "d", due_at=NOW)
+    await scheduler.advance()
+    assert scheduler.overdue() == [task.id]
+
+    await scheduled_service.update_task(task.id, due_at=NOW + timedelta(days=1))
+    assert scheduler.overdue() == []
+    await scheduled_service.update_task(task.id, clear_due_at=True)
+    assert scheduler.next_due() is None
+
+async def test_completion_cancels_the_deadline(scheduled_service, scheduler, clock):
+    pending = await scheduled_service.create_task("t", "d", due_at=NOW + timedelta(minutes=5))
+    late = await scheduled_service.create_task("late", "d", due_at=NOW)
+    await scheduler.advance()
+
+    await scheduled_service.update_task_status(pending.id, TaskStatus.COMPLETED)
+    await scheduled_service.update_task_status(late.id, TaskStatus.CANCELLED)
+
+    clock.now = NOW + timedelta(days=1)
+    assert await scheduler.advance() == []
+    assert scheduler.overdue() == []
+
+async def test_cancel_on_delete(scheduled_service, scheduler, repository, clock):
+    kept = await scheduled_service.create_task("kept", "d", due_at=NOW)
+    deleted = await scheduled_service.create_task("deleted", "d", due_at=NOW - timedelta(minutes=1))
+    await scheduler.advance()
+
+    await repository.delete(deleted.id)
+    # Deleted tasks are dropped from the listing even before they are cancelled.
+    assert [task.id for task in await scheduled_service.list_overdue_tasks()] == [kept.id]
+    scheduler.cancel(deleted.id)
+    assert scheduler.overdue() == [kept.id]
+
+async def test_overdue_lists_most_overdue_first(scheduled_service, scheduler):
+    ids = [
+        (await scheduled_service.create_task(f"t{minutes}", "d", due_at=NOW - timedelta(minutes=minutes))).id
+        for minutes in (1, 30, 10)
+    ]
+    tasks = await scheduled_service.list_overdue_tasks()
+    assert [task.id for task in tasks] == [ids[1], ids[2], ids[0]]
+
+async def test_heap_is_rebuilt_when_mostly_dead(scheduler):
+    tasks = [Task.create(f"t{i}", "d", due_at=NOW + timedelta(minutes=i + 1)) for i in range(200)]
+    scheduler.track_all(tasks)
+    for task in tasks[:150]:
+        scheduler.cancel(task.id)
+    assert len(scheduler._heap) < 200
+    assert scheduler.next_due() == tasks[150].due_at
+
+async def test_timer_fires_deadline_without_polling(publisher):
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    publisher.subscribe(handler)
+    scheduler = OverdueScheduler(publisher)
+    scheduler.start()
+    try:
+        task = Task.create("t", "d", due_at=datetime.utcnow() + timedelta(milliseconds=20))
+        scheduler.track(task)
+        for _ in range(100):
+            if received:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await scheduler.close()
+    assert [event.task_id for event in received] == [task.id]
@@ -0,0 +1,94 @@
+# tests/test_profiling.py
+import cProfile
+import time
+import pytest
+from fastapi.testclient import TestClient
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.profiling import middleware
+from src.infrastructure.profiling.middleware import ProfilingMiddleware
+from src.infrastructure.profiling.profiler import collapse_profile
+from src.main import create_app
+
+TOKEN = "s3cret"
+
+@pytest.fixture
+def profiled_client():
+    with TestClient(create_app(Settings(warm_up=False, profiling_enabled=True, admin_token=TOKEN))) as client:
+        yield client
+
+@pytest.mark.parametrize("mode", ["cprofile", "sample"])
+def test_profile_requires_admin_token(profiled_client, mode):
+    assert "x-profile-id" not in profiled_client.get("/api/v1/tasks/", headers={"X-Profile": mode}).headers
+    response = profiled_client.get("/api/v1/tasks/", headers={"X-Profile": mode, "X-Admin-Token": "wrong"})
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+
+    response = profiled_client.get("/api/v1/tasks/", headers={"X-Profile": mode, "X-Admin-Token": TOKEN})
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+
+    assert profiled_client.get(f"/api/v1/admin/profiles/{profile_id}").status_code == 403
+    stored = profiled_client.get(f"/api/v1/admin/profiles/{profile_id}", headers={"X-Admin-Token": TOKEN})
+    assert stored.status_code == 200
+    if mode == "cprofile":
+        lines = stored.text.splitlines()
+        assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert any("list_tasks (router.py:" in line for line in lines)
+    listed = profiled_client.get("/api/v1/admin/profiles", headers={"X-Admin-Token": TOKEN}).json()
+    assert [(profile["id"], profile["mode"]) for profile in listed] == [(profile_id, mode)]
+
+def _spin(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+def _fast():
+    _spin(0.01)
+
+def _slow():
+    _spin(0.03)
+
+def _outer():
+    _fast()
+    _slow()
+
+def test_cprofile_is_collapsed_into_weighted_stacks():
+    profile = cProfile.Profile()
+    profile.runcall(_outer)
+    stacks = collapse_profile(profile)
+
+    def under(caller):
+        return sum(count for stack, count in stacks.items() if f";{caller} (" in stack)
+
+    # _spin is shared, so its time is split by the caller that spent it.
+    assert all(stack.startswith("_outer (test_profiling.py:") for stack in stacks)
+    assert 5_000 < under("_fast") < 20_000
+    assert 20_000 < under("_slow") < 45_000
+
+def test_profile_query_flag(profiled_client):
+    response = profiled_client.get("/api/v1/tasks/?profile=cprofile", headers={"X-Admin-Token": TOKEN})
+    assert "x-profile-id" in response.headers
+
+def test_unknown_profile_mode_is_rejected(profiled_client):
+    response = profiled_client.get("/api/v1/tasks/", headers={"X-Profile": "perf", "X-Admin-Token": TOKEN})
+    assert response.status_code == 400
+    assert response.json()["type"] == "profile_mode_invalid"
+
+def test_concurrent_cprofile_is_409(profiled_client):
+    with middleware._deterministic:
+        response = profiled_client.get("/api/v1/tasks/", headers={"X-Profile": "cprofile", "X-Admin-Token": TOKEN})
+    assert response.status_code == 409
+    assert response.json()["type"] == "profiler_busy"
+    # The sampler is not exclusive.
+    with middleware._deterministic:
+        response = profiled_client.get("/api/v1/tasks/", headers={"X-Profile": "sample", "X-Admin-Token": TOKEN})
+    assert response.status_code == 200
+
+def test_profiling_disabled_installs_nothing():
+    app = create_app(Settings(warm_up=False, profiling_enabled=False, admin_token=TOKEN))
+    assert not any(m.cls is ProfilingMiddleware for m in app.user_middleware)
+    assert not hasattr(app.state, "profiler")
+    with TestClient(app) as client:
+        response = client.get("/api/v1/tasks/", headers={"X-Profile": "cprofile", "X-Admin-Token": TOKEN})
+        assert "x-profile-id" not in response.headers
+        assert client.get("/api/v1/admin/profiles", headers={"X-Admin-Token": TOKEN}).status_code == 404
@@ -0,0 +1,95 @@
+# tests/test_task_history.py
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+import pytest
+from src.domain.entities.task import Task, TaskStatus
+from src.domain.services.task_service import TaskService
+from src.infrastructure.repositories.in_memory_task_history_repository import InMemoryTaskHistoryRepository
+
+START = datetime(2024, 1, 16, 10, 0, 0)
+
+async def _record_versions(history, count):
+    """Record ``count`` versions, one second apart, and return them."""
+    task = replace(Task.create("v0", "history"), created_at=START, updated_at=START)
+    versions = [task]
+    await history.record(None, task)
+    for i in range(1, count):
+        previous, task = task, replace(
+            task,
+            title=f"v{i}",
+            status=TaskStatus.IN_PROGRESS if i % 2 else TaskStatus.PENDING,
+            updated_at=START + timedelta(seconds=i)
+        )
+        await history.record(previous, task)
+        versions.append(task)
+    return versions
+
+async def test_as_of_replays_deltas_from_nearest_keyframe():
+    history = InMemoryTaskHistoryRepository(keyframe_interval=4)
+    versions = await _record_versions(history, 11)
+    task_id = versions[0].id
+
+    assert len(history._timelines[task_id].keyframes) == 3
+    for i, version in enumerate(versions):
+        assert await history.find_as_of(task_id, START + timedelta(seconds=i)) == version
+
+async def test_as_of_boundaries():
+    history = InMemoryTaskHistoryRepository(keyframe_interval=4)
+    versions = await _record_versions(history, 6)
+    task_id = versions[0].id
+
+    assert await history.find_as_of(task_id, START - timedelta(microseconds=1)) is None
+    assert await history.find_as_of(task_id, START) == versions[0]
+    assert await history.find_as_of(task_id, START + timedelta(seconds=3, microseconds=-1)) == versions[2]
+    assert await history.find_as_of(task_id, START + timedelta(seconds=3)) == versions[3]
+    assert await history.find_as_of(task_id, START + timedelta(days=1)) == versions[-1]
+    aware = (START + timedelta(seconds=1)).replace(tzinfo=timezone.utc).astimezone(timezone(timedelta(hours=2)))
+    assert await history.find_as_of(task_id, aware) == versions[1]
+
+async def test_history_lists_only_changed_fields():
+    history = InMemoryTaskHistoryRepository()
+    versions = await _record_versions(history, 3)
+    await history.record(versions[-1], versions[-1])
+
+    changes = await history.find_history(versions[0].id)
+
+    assert [change.version for change in changes] == [0, 1, 2]
+    assert set(changes[0].changes) == {
+        "id", "title", "description", "status", "assigned_to", "created_at", "updated_at", "due_at"
+    }
+    assert changes[1].changes == {
+        "title": "v1", "status": TaskStatus.IN_PROGRESS, "updated_at": START + timedelta(seconds=1)
+    }
+
+async def test_clock_stepping_back_keeps_index_sorted():
+    history = InMemoryTaskHistoryRepository()
+    first, second = await _record_versions(history, 2)
+    third = replace(second, title="late", updated_at=START)
+    await history.record(second, third)
+
+    changes = await history.find_history(first.id)
+    assert changes[2].changed_at == START + timedelta(seconds=1)
+    assert await history.find_as_of(first.id, START + timedelta(seconds=1)) == third
+
+async def test_history_survives_task_deletion(repository):
+    history = InMemoryTaskHistoryRepository()
+    service = TaskService(repository, history)
+    task = await service.create_task("t", "d")
+    updated = await service.update_task_status(task.id, TaskStatus.COMPLETED)
+
+    await repository.delete(task.id)
+
+    assert await service.get_task(task.id) is None
+    assert [change.version for change in await service.get_task_history(task.id)] == [0, 1]
+    assert await service.get_task(task.id, as_of=updated.updated_at) == updated
+    assert await service.get_task(task.id, as_of=task.created_at) == task
+
+async def test_unknown_task_has_no_history(repository):
+    service = TaskService(repository, InMemoryTaskHistoryRepository())
+    task = Task.create("t", "d")
+    assert await service.get_task_history(task.id) is None
+    assert await service.get_task(task.id, as_of=datetime.utcnow()) is None
+
+async def test_as_of_requires_history(service):
+    with pytest.raises(ValueError):
+        await service.get_task(Task.create("t", "d").id, as_of=datetime.utcnow())
@@ -0,0 +1,74 @@
+# tests/test_task_listing.py
+from datetime import datetime, timedelta
+from uuid import uuid4
+from src.domain.entities.task import TaskStatus
+
+async def _create(service, count, assignee=None):
+    tasks = []
+    for i in range(count):
+        task = await service.create_task(f"Task {i}", "listing", assignee if i % 2 else None)
+        if i % 3 == 0:
+            task = await service.update_task_status(task.id, TaskStatus.COMPLETED)
+        tasks.append(task)
+    return tasks
+
+async def _collect(fetch, limit):
+    pages, after = [], None
+    while True:
+        page = await fetch(after, limit)
+        pages.append(page)
+        if len(page) < limit:
+            return pages
+        after = page[-1].id
+
+async def test_filtered_keyset_pages_are_full_until_the_last(service):
+    tasks = await _create(service, 50)
+    completed = [task.id for task in tasks if task.status == TaskStatus.COMPLETED]
+
+    pages = await _collect(
+        lambda after, limit: service.list_tasks(after, limit, status=TaskStatus.COMPLETED), 5
+    )
+
+    assert all(len(page) == 5 for page in pages[:-1])
+    assert [task.id for page in pages for task in page] == completed
+
+async def test_keyset_pages_filter_by_assignee_and_status(service):
+    user = uuid4()
+    tasks = await _create(service, 40, user)
+    expected = [
+        task.id for task in tasks
+        if task.assigned_to == user and task.status == TaskStatus.PENDING
+    ]
+
+    pages = await _collect(
+        lambda after, limit: service.list_tasks(after, limit, TaskStatus.PENDING, user), 4
+    )
+
+    assert [task.id for page in pages for task in page] == expected
+
+async def test_created_window_filters_before_limit(service):
+    tasks = await _create(service, 30)
+    completed = [task.id for task in tasks if task.status == TaskStatus.COMPLETED]
+    start = datetime.utcnow() - timedelta(minutes=1)
+
+    pages = await _collect(
+        lambda after, limit: service.list_tasks_created_between(
+            start, None, TaskStatus.COMPLETED, after=after, limit=limit
+        ),
+        3
+    )
+
+    assert [task.id for page in pages for task in page] == completed
+
+def test_list_endpoint_applies_status_before_limit(client):
+    ids = []
+    for i in range(12):
+        task = client.post("/api/v1/tasks/", json={"title": f"Task {i}", "description": "x"}).json()
+        if i >= 8:
+            client.post(f"/api/v1/tasks/{task['id']}/status/COMPLETED")
+            ids.append(task["id"])
+
+    response = client.get("/api/v1/tasks/", params={"status": "COMPLETED", "limit": 3})
+    assert [task["id"] for task in response.json()] == ids[:3]
+    response = client.get("/api/v1/tasks/", params={"status": "COMPLETED", "limit": 3, "after": ids[2]})
+    assert [task["id"] for task in response.json()] == ids[3:]
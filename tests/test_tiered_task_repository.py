@@ -0,0 +1,171 @@
+# tests/test_tiered_task_repository.py
+import asyncio
+import logging
+import os
+from datetime import timedelta
+import pytest
+from src.domain.entities.task import Task, TaskStatus
+from src.domain.services.task_service import TaskService
+from src.infrastructure.repositories import tiered_task_repository
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.tiered_task_repository import TieredTaskRepository
+
+@pytest.fixture
+async def tiered(tmp_path):
+    repository = TieredTaskRepository(
+        InMemoryTaskRepository(), directory=str(tmp_path), cold_after=timedelta(0), block_size=4, max_segments=3
+    )
+    yield repository
+    await repository.close()
+
+async def _completed(repository, count, status=TaskStatus.COMPLETED):
+    tasks = [Task.create(f"Task {i}", "tiering").update_status(status) for i in range(count)]
+    await repository.save_many(tasks)
+    return tasks
+
+def _segment_files(repository):
+    return sorted(name for name in os.listdir(repository.directory) if name.endswith(".seg"))
+
+async def test_moved_tasks_are_read_from_cold_tier(tiered):
+    tasks = await _completed(tiered, 10)
+    active = Task.create("active", "stays hot")
+    await tiered.save(active)
+
+    assert await tiered.move_to_cold() == 10
+
+    assert await tiered.hot.find_all() == [active]
+    for task in tasks:
+        assert await tiered.find_by_id(task.id) == task
+    assert await tiered.find_many_by_ids([tasks[3].id, active.id]) == [tasks[3], active]
+    assert await tiered.find_all() == tasks + [active]
+    assert await tiered.find_page(tasks[4].id, 3) == tasks[5:8]
+    with tiered.snapshot() as snapshot:
+        assert await snapshot.find_by_id(tasks[0].id) == tasks[0]
+
+async def test_update_shadows_cold_copy(tiered):
+    tasks = await _completed(tiered, 5)
+    await tiered.move_to_cold()
+
+    reopened = tasks[2].update_status(TaskStatus.IN_PROGRESS)
+    await tiered.save(reopened)
+
+    assert await tiered.find_by_id(reopened.id) == reopened
+    assert [task.id for task in await tiered.find_by_status(TaskStatus.COMPLETED)] == [
+        task.id for task in tasks if task.id != reopened.id
+    ]
+    assert (await tiered.find_all())[2] == reopened
+    assert reopened.id in tiered._cold.shadowed
+
+async def test_delete_shadows_cold_copy(tiered):
+    tasks = await _completed(tiered, 5)
+    await tiered.move_to_cold()
+
+    await tiered.delete(tasks[1].id)
+
+    assert await tiered.find_by_id(tasks[1].id) is None
+    assert tasks[1] not in await tiered.find_all()
+
+async def test_active_status_queries_skip_cold_tier(tiered, monkeypatch):
+    await _completed(tiered, 5)
+    pending = Task.create("pending", "hot")
+    await tiered.save(pending)
+    await tiered.move_to_cold()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cold tier scanned")
+
+    monkeypatch.setattr(tiered_task_repository._ColdTier, "scan", fail)
+    assert await tiered.find_by_status(TaskStatus.PENDING) == [pending]
+    assert await tiered.find_by_status(TaskStatus.IN_PROGRESS) == []
+    with pytest.raises(AssertionError):
+        await tiered.find_by_status(TaskStatus.COMPLETED)
+
+async def test_assignee_queries_for_active_statuses_skip_cold_tier(tiered, monkeypatch):
+    user = Task.create("x", "x").id
+    done = [task.assign(user) for task in await _completed(tiered, 5)]
+    await tiered.save_many(done)
+    pending = Task.create("pending", "hot", assigned_to=user)
+    await tiered.save(pending)
+    await tiered.move_to_cold()
+
+    assert await tiered.find_by_assignee(user) == done + [pending]
+    assert await tiered.find_by_assignee(user, [TaskStatus.COMPLETED]) == done
+    assert await tiered.find_by_assignee(user, [TaskStatus.CANCELLED]) == []
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cold tier scanned")
+
+    monkeypatch.setattr(tiered_task_repository._ColdTier, "scan", fail)
+    assert await tiered.find_by_assignee(user, [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]) == [pending]
+    assert await TaskService(tiered).list_tasks(status=TaskStatus.PENDING, assigned_to=user) == [pending]
+    with pytest.raises(AssertionError):
+        await tiered.find_by_assignee(user)
+
+async def test_compaction_merges_segments_and_prunes_shadows(tiered):
+    tasks = []
+    for _ in range(4):
+        tasks += await _completed(tiered, 3)
+        await tiered.move_to_cold()
+    # The fourth run exceeded max_segments and compacted everything.
+    assert tiered.metrics.compactions == 1
+    assert len(tiered._cold.segments) == 1
+    assert len(_segment_files(tiered)) == 1
+
+    updated = tasks[0].update_status(TaskStatus.CANCELLED)
+    await tiered.save(updated)
+    await tiered.delete(tasks[1].id)
+    assert len(tiered._cold.shadowed) == 2
+
+    with tiered.snapshot() as snapshot:
+        await tiered.compact()
+        # A snapshot opened before the compaction still reads the old segments.
+        assert await snapshot.find_by_id(tasks[5].id) == tasks[5]
+
+    assert tiered._cold.shadowed == {}
+    assert tiered.metrics.shadowed == 0
+    expected = [updated] + tasks[2:]
+    assert await tiered.find_all() == expected
+    assert not tiered._cold.segments[0].contains(tasks[0].id)
+    assert not tiered._cold.segments[0].contains(tasks[1].id)
+
+async def test_shadowing_during_compaction_is_kept(tiered, monkeypatch):
+    tasks = await _completed(tiered, 4)
+    await tiered.move_to_cold()
+    await tiered.save(tasks[0].update_status(TaskStatus.CANCELLED))
+    reopened = tasks[3].update_status(TaskStatus.PENDING)
+    real_compact = tiered_task_repository._compact_segments
+
+    def compact_while_writing(*args):
+        count = real_compact(*args)
+        # Simulate a request landing while the merged segment was written.
+        tiered._shadow([reopened.id])
+        tiered.hot.tasks[reopened.id] = reopened
+        return count
+
+    monkeypatch.setattr(tiered_task_repository, "_compact_segments", compact_while_writing)
+    await tiered.compact()
+
+    assert tiered._cold.shadowed == {reopened.id: 1}
+    assert await tiered.find_by_status(TaskStatus.COMPLETED) == tasks[1:3]
+
+async def test_failed_tiering_run_is_logged(tmp_path, monkeypatch, caplog):
+    repository = TieredTaskRepository(
+        InMemoryTaskRepository(), directory=str(tmp_path), cold_after=timedelta(0), interval=0.01
+    )
+    await _completed(repository, 3)
+
+    def broken(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(tiered_task_repository, "write_segment", broken)
+    with caplog.at_level(logging.ERROR):
+        repository.start()
+        for _ in range(100):
+            if repository.metrics.failed_runs:
+                break
+            await asyncio.sleep(0.01)
+        await repository.close()
+
+    assert repository.metrics.failed_runs >= 1
+    assert len(await repository.hot.find_all()) == 3
+    assert any("cold storage failed" in record.getMessage() for record in caplog.records)
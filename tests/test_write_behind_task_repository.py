@@ -0,0 +1,132 @@
+# tests/test_write_behind_task_repository.py
+import asyncio
+import logging
+import pytest
+from src.domain.entities.task import Task, TaskStatus
+from src.infrastructure.repositories.in_memory_task_repository import InMemoryTaskRepository
+from src.infrastructure.repositories.write_behind_task_repository import WriteBehindTaskRepository
+
+class CountingRepository(InMemoryTaskRepository):
+    def __init__(self, failures: int = 0):
+        super().__init__()
+        self.batches = []
+        self.failures = failures
+        self.closed = False
+
+    async def save_many(self, tasks):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("store unavailable")
+        tasks = list(tasks)
+        self.batches.append(tasks)
+        await super().save_many(tasks)
+
+    async def close(self):
+        self.closed = True
+
+async def test_updates_to_one_task_coalesce_into_one_write():
+    inner = CountingRepository()
+    repository = WriteBehindTaskRepository(inner, max_pending=100)
+    task = Task.create("t", "d")
+    await repository.save(task)
+    for status in (TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED):
+        task = task.update_status(status)
+        await repository.save(task)
+
+    assert await repository.find_by_id(task.id) == task
+    assert await inner.find_by_id(task.id) is None
+    await repository.flush()
+
+    assert inner.batches == [[task]]
+    assert repository.metrics.writes == 3
+    assert repository.metrics.flushed_writes == 1
+    assert repository.metrics.coalescing_ratio == pytest.approx(2 / 3)
+
+async def test_buffer_flushes_when_max_pending_is_reached():
+    inner = CountingRepository()
+    repository = WriteBehindTaskRepository(inner, max_pending=3)
+    tasks = [Task.create(f"t{i}", "d") for i in range(4)]
+    for task in tasks[:2]:
+        await repository.save(task)
+    assert inner.batches == []
+
+    await repository.save(tasks[2])
+    assert inner.batches == [tasks[:3]]
+    await repository.save(tasks[3])
+    assert len(inner.batches) == 1
+
+async def test_flusher_writes_buffer_after_interval():
+    inner = CountingRepository()
+    repository = WriteBehindTaskRepository(inner, flush_interval=0.01, max_pending=100)
+    repository.start()
+    try:
+        task = Task.create("t", "d")
+        await repository.save(task)
+        for _ in range(100):
+            if inner.batches:
+                break
+            await asyncio.sleep(0.01)
+        assert inner.batches == [[task]]
+    finally:
+        await repository.close()
+
+async def test_close_drains_buffer_and_closes_inner():
+    inner = CountingRepository()
+    repository = WriteBehindTaskRepository(inner, flush_interval=60, max_pending=100)
+    repository.start()
+    task = Task.create("t", "d")
+    await repository.save(task)
+    await repository.delete(Task.create("gone", "d").id)
+
+    await repository.close()
+
+    assert await inner.find_by_id(task.id) == task
+    assert repository._dirty == {}
+    assert inner.closed
+
+async def test_failed_flush_is_logged_kept_and_retried(caplog):
+    inner = CountingRepository(failures=2)
+    repository = WriteBehindTaskRepository(inner, flush_interval=0.01, max_pending=100)
+    task = Task.create("t", "d")
+    await repository.save(task)
+
+    with caplog.at_level(logging.ERROR):
+        repository.start()
+        try:
+            for _ in range(200):
+                if inner.batches:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await repository.close()
+
+    assert inner.batches == [[task]]
+    assert repository.metrics.failed_flushes == 2
+    assert repository.metrics.consecutive_failures == 0
+    assert "ConnectionError" in repository.metrics.last_error
+    assert [r.getMessage() for r in caplog.records].count("Write-behind flush failed; will retry") == 2
+
+async def test_failed_size_triggered_flush_does_not_fail_the_save():
+    inner = CountingRepository(failures=1)
+    repository = WriteBehindTaskRepository(inner, max_pending=1)
+    task = Task.create("t", "d")
+
+    await repository.save(task)
+
+    assert repository.metrics.consecutive_failures == 1
+    assert await repository.find_by_id(task.id) == task
+    await repository.flush()
+    assert await inner.find_by_id(task.id) == task
+
+async def test_assignee_status_filter_sees_buffered_changes():
+    inner = CountingRepository()
+    repository = WriteBehindTaskRepository(inner, max_pending=100)
+    user = Task.create("x", "x").id
+    tasks = [Task.create(f"t{i}", "d", assigned_to=user) for i in range(3)]
+    await inner.save_many(tasks)
+
+    done = tasks[0].update_status(TaskStatus.COMPLETED)
+    await repository.save(done)
+    assert await repository.find_by_assignee(user, [TaskStatus.PENDING]) == tasks[1:]
+    assert await repository.find_by_assignee(user, [TaskStatus.COMPLETED]) == [done]
+    assert await repository.find_by_assignee(user) == [done] + tasks[1:]